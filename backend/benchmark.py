@@ -0,0 +1,572 @@
+"""
+Benchmarks des structures de données du backend
+Compare les implémentations précalculées aux approches naïves
+
+Usage:
+    python3 benchmark.py                 # Tous les benchmarks
+    python3 benchmark.py ranking         # Un benchmark précis
+    python3 benchmark.py tokenizer       # Débit de la tokenisation (Mo/s)
+    python3 benchmark.py sketch          # Comptes approchés vs exacts
+    python3 benchmark.py vocabulary      # Mémoire: JSON vs vocabulaire binaire
+    python3 benchmark.py indexes         # Index dérivés: mots vs identifiants
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+
+# Syllabes utilisées pour générer un vocabulaire synthétique "malagasy"
+SYLLABLES = [
+    "ma",
+    "mi",
+    "man",
+    "ny",
+    "ra",
+    "ka",
+    "tsa",
+    "tra",
+    "ha",
+    "na",
+    "lo",
+    "vo",
+    "fa",
+    "ta",
+    "sa",
+    "za",
+    "dre",
+    "to",
+    "ri",
+    "an",
+    "ina",
+    "ana",
+    "ko",
+    "be",
+]
+
+
+def synthetic_vocabulary(size, seed=42):
+    """Vocabulaire synthétique de `size` mots avec fréquences zipfiennes"""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))))
+    words = sorted(words)
+    rng.shuffle(words)
+    return {word: max(1, int(100_000 / (rank + 1))) for rank, word in enumerate(words)}
+
+
+def measure(function, repeat=20):
+    """Durée moyenne d'un appel (en millisecondes)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def report(label, naive_ms, optimized_ms):
+    speedup = naive_ms / optimized_ms if optimized_ms else float("inf")
+    print(
+        f"   {label:44s} {naive_ms:10.3f} ms -> {optimized_ms:10.4f} ms"
+        f"  (x{speedup:,.1f})"
+    )
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+
+def bench_ranking(vocabulary_size=100_000, limit=5):
+    """Top-k fréquences: tri par requête vs classement précalculé / tas"""
+    from ranking import FrequencyRanking
+
+    print(f"\nClassement par fréquence ({vocabulary_size:,} mots, limit={limit})")
+    frequencies = synthetic_vocabulary(vocabulary_size)
+
+    start = time.perf_counter()
+    ranking = FrequencyRanking(frequencies)
+    print(
+        f"   Construction du classement: {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+
+    def naive_top():
+        top_words = sorted(frequencies.items(), key=lambda x: x[1], reverse=True)
+        return [w[0] for w in top_words[:limit]]
+
+    def naive_prefix():
+        top_words = sorted(
+            ((w, f) for w, f in frequencies.items() if w.startswith("man")),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        return [w[0] for w in top_words[:limit]]
+
+    # Sous-ensemble ad hoc (ex: une catégorie grammaticale): 10% du vocabulaire
+    subset = list(frequencies)[::10]
+
+    def naive_subset():
+        top_words = sorted(subset, key=lambda w: frequencies[w], reverse=True)
+        return top_words[:limit]
+
+    report(
+        "Top-k (tri complet vs découpage)",
+        measure(naive_top),
+        measure(lambda: ranking.top(limit), 1000),
+    )
+    report(
+        "Top-k par préfixe (tri vs arrêt anticipé)",
+        measure(naive_prefix),
+        measure(lambda: ranking.top_with_prefix("man", limit)),
+    )
+    report(
+        "Top-k d'un sous-ensemble (tri vs tas)",
+        measure(naive_subset),
+        measure(lambda: ranking.top_among(subset, limit)),
+    )
+
+
+def bench_phonotactics(vocabulary_size=50_000):
+    """Combinaisons interdites: boucle par combinaison vs alternation compilée"""
+    import re
+
+    from phonotactics import INVALID_COMBINATIONS, PHONOTACTIC_MATCHER
+
+    print(f"\nValidation phonotactique ({vocabulary_size:,} mots)")
+    rng = random.Random(7)
+    words = list(synthetic_vocabulary(vocabulary_size))
+    # ~10% de mots invalides, combinaison insérée à une position aléatoire
+    for i in range(0, len(words), 10):
+        position = rng.randint(0, len(words[i]))
+        combination = rng.choice(INVALID_COMBINATIONS)
+        words[i] = words[i][:position] + combination + words[i][position:]
+    text = " ".join(words)
+    spans = [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+
+    def loop_has_violation(word):
+        word = word.lower()
+        for combo in INVALID_COMBINATIONS:
+            if combo in word:
+                if combo == "nk" and word.index(combo) > 0:
+                    continue
+                return True
+        return False
+
+    def loop_violations(word):
+        found = []
+        for combo in INVALID_COMBINATIONS:
+            if combo in word:
+                position = word.index(combo)
+                if combo == "nk" and position > 0:
+                    continue
+                found.append((combo, position))
+        return found
+
+    report(
+        "Test rapide par mot (boucle vs matcher)",
+        measure(lambda: [loop_has_violation(w) for w in words], 5),
+        measure(lambda: [PHONOTACTIC_MATCHER.has_violation(w) for w in words], 5),
+    )
+    report(
+        "Positions par mot (1re occurrence vs toutes)",
+        measure(lambda: [loop_violations(w) for w in words], 5),
+        measure(lambda: [PHONOTACTIC_MATCHER.violations(w) for w in words], 5),
+    )
+    report(
+        "Document entier (boucle par token vs scan)",
+        measure(lambda: [loop_violations(text[a:b]) for a, b in spans], 5),
+        measure(lambda: PHONOTACTIC_MATCHER.scan(text, spans), 5),
+    )
+
+
+def bench_tokenizer(size_mb=5):
+    """Débit de la tokenisation (Mo/s): anciennes versions API/scraper vs tokenizer"""
+    import re
+
+    from tokenizer import iter_tokens, tokenize
+
+    rng = random.Random(11)
+    words = list(synthetic_vocabulary(20_000))
+    pieces, size = [], 0
+    while size < size_mb * 1_000_000:
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(5, 15)))
+        sentence = sentence.capitalize() + rng.choice(
+            [".", ",", " amin'ny", " an'i Soa."]
+        )
+        pieces.append(sentence)
+        size += len(sentence) + 1
+    text = "\n".join(pieces)
+    megabytes = len(text.encode("utf-8")) / 1_000_000
+    print(f"\nTokenisation ({megabytes:.1f} Mo de texte)")
+
+    def old_api():
+        return re.findall(r"\b[a-zàáâèéêìíîòóôùúû-]+\b", text.lower(), re.UNICODE)
+
+    def old_scraper():
+        lowered = re.sub(r"[^\w\s-]", " ", text.lower())
+        words = re.findall(r"\b[a-zàáâèéêìíîòóôùúû-]{2,}\b", lowered, re.UNICODE)
+        return [w for w in words if re.match(r"^[a-zàáâèéêìíîòóôùúû-]+$", w)]
+
+    old_pattern = re.compile(r"\b[a-zàáâèéêìíîòóôùúû-]+\b", re.IGNORECASE)
+
+    def old_offsets():
+        for match in old_pattern.finditer(text):
+            match.group().lower(), match.start(), match.end()
+
+    def with_offsets():
+        for _ in iter_tokens(text):
+            pass
+
+    for label, function in [
+        ("Ancienne tokenisation API", old_api),
+        ("Ancienne tokenisation scraper", old_scraper),
+        ("Ancien iter_tokens (IGNORECASE)", old_offsets),
+        ("tokenize (liste)", lambda: tokenize(text)),
+        ("iter_tokens (avec positions)", with_offsets),
+    ]:
+        elapsed_ms = measure(function, 3)
+        print(
+            f"   {label:44s} {elapsed_ms:10.1f} ms"
+            f"  ({megabytes / elapsed_ms * 1000:6.1f} Mo/s)"
+        )
+
+
+def bench_sketch(articles=5000, widths=(1 << 18, 1 << 20), depth=4):
+    """Count-Min Sketch + top-k par contexte vs Counter exact: erreur et mémoire"""
+    import tracemalloc
+
+    from count_sketch import SketchCounter
+    from ngram_model import count_ngrams
+
+    # Corpus zipfien: beaucoup de n-grams vus une seule fois, comme un vrai corpus
+    rng = random.Random(13)
+    frequencies = synthetic_vocabulary(20_000)
+    words, weights = list(frequencies), list(frequencies.values())
+    corpus = [rng.choices(words, weights, k=300) for _ in range(articles)]
+    batches = [corpus[i : i + 256] for i in range(0, len(corpus), 256)]
+    batch_counts = [count_ngrams(batch) for batch in batches]
+
+    def build(make_counters):
+        """Compteurs bigrammes/trigrammes remplis lot par lot, pic mémoire en Mo"""
+        tracemalloc.start()
+        unigrams = Counter()
+        counters = make_counters(unigrams)
+        for counts in batch_counts:
+            # Comme dans le scraper: unigrammes, puis bigrammes, puis trigrammes
+            unigrams.update(counts[0])
+            counters[0].update(counts[1])
+            counters[1].update(counts[2])
+        peak = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        return counters, peak
+
+    def sketches(unigrams, width, conservative):
+        bigrams = SketchCounter(
+            width,
+            depth,
+            conservative=conservative,
+            context_counts=lambda contexts: [unigrams[c[0]] for c in contexts],
+        )
+        trigrams = SketchCounter(
+            width, depth, conservative=conservative, context_counts=bigrams.estimate
+        )
+        return bigrams, trigrams
+
+    exact, exact_mb = build(lambda unigrams: (Counter(), Counter()))
+    tokens = sum(len(tokens) for tokens in corpus)
+    print(
+        f"\nComptes approchés ({articles:,} articles, {tokens:,} tokens,"
+        f" depth={depth})"
+    )
+    print(
+        f"   {'bigrammes / trigrammes distincts':34s}"
+        f" {len(exact[0]):,} / {len(exact[1]):,}"
+        f"  (vus une fois: {sum(c == 1 for c in exact[0].values()) / len(exact[0]):.0%}"
+        f" / {sum(c == 1 for c in exact[1].values()) / len(exact[1]):.0%})"
+    )
+    print(f"   {'Counter exact':34s} {exact_mb:8.1f} Mo")
+    # Erreur: surestimation moyenne des bigrammes; retrouvés: bigrammes / trigrammes
+    print(
+        f"   {'':34s} {'mémoire':>11s}  {'erreur moy.':>11s}  {'borne e/w*N':>11s}"
+        f"  {'top-k retrouvés':>15s}"
+    )
+
+    def top_k(counts, k=50, min_count=2):
+        """Successeurs gardés par le modèle N-gram (même élagage)"""
+        grouped = {}
+        for ngram, count in counts.items():
+            if count >= min_count:
+                grouped.setdefault(ngram[:-1], []).append((count, ngram))
+        return {
+            ngram: count
+            for successors in grouped.values()
+            for count, ngram in sorted(successors, reverse=True)[:k]
+        }
+
+    references = [top_k(counts) for counts in exact]
+    for width in widths:
+        for conservative in (False, True):
+            counters, sketch_mb = build(
+                lambda unigrams: sketches(unigrams, width, conservative)
+            )
+            # Erreur sur tous les bigrammes (jamais négative), retrouvés = top-k
+            # exact présent dans les n-grams suivis avec le bon compte
+            keys = list(exact[0])
+            estimates = counters[0].sketch.estimate(keys)
+            error = sum(estimates.tolist()) / len(keys) - sum(exact[0].values()) / len(
+                keys
+            )
+            found = []
+            for counter, reference in zip(counters, references):
+                tracked = dict(counter.items())
+                hits = sum(
+                    tracked.get(ngram) == count for ngram, count in reference.items()
+                )
+                found.append(hits / len(reference))
+            label = (
+                f"width={width:<8,d} {'conservatif' if conservative else 'standard'}"
+            )
+            print(
+                f"   {label:34s} {sketch_mb:8.1f} Mo  {error:11.2f}"
+                f"  {counters[0].sketch.error_bound():11.1f}"
+                f"  {found[0]:7.1%} {found[1]:7.1%}"
+            )
+
+
+def bench_vocabulary(vocabulary_size=200_000, articles=5000):
+    """
+    Mémoire des données servies: fichiers JSON chargés en objets Python (une
+    copie de chaque mot par structure) vs vocabulaire unique à identifiants
+    entiers (fréquences en tableau, N-grams en CSR, fichier mappé)
+    """
+    import json
+    import os
+    import tempfile
+    import tracemalloc
+
+    from binary_store import BinaryStore, write_binary_store
+    from ngram_model import NgramModel, count_ngrams
+
+    frequencies = synthetic_vocabulary(vocabulary_size)
+    words, weights = list(frequencies), list(frequencies.values())
+    rng = random.Random(17)
+    corpus = [rng.choices(words, weights, k=300) for _ in range(articles)]
+    _, bigrams, trigrams = count_ngrams(corpus)
+    model = NgramModel.from_counts(Counter(frequencies), bigrams, trigrams)
+    bigram_lists = {
+        model.vocabulary[context]: [model.vocabulary[w] for w in list(successors)[:10]]
+        for context, successors in model.bigrams.items()
+    }
+    # Fichiers tels qu'exportés par le scraper
+    files = {
+        "dictionary": json.dumps(words),
+        "bigram_model": json.dumps(bigram_lists),
+        "frequencies": json.dumps(frequencies),
+        "ngram_model": json.dumps(model.to_dict()),
+    }
+    stats = model.stats()
+    print(
+        f"\nVocabulaire partagé ({vocabulary_size:,} mots, "
+        f"{stats['bigrams']:,} bigrammes, {stats['trigrams']:,} trigrammes)"
+    )
+
+    def traced(function):
+        """(résultat, mémoire Python allouée et conservée, en Mo)"""
+        tracemalloc.start()
+        result = function()
+        size = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+        return result, size
+
+    def load_json():
+        return (
+            set(json.loads(files["dictionary"])),
+            json.loads(files["bigram_model"]),
+            json.loads(files["frequencies"]),
+            NgramModel.from_dict(json.loads(files["ngram_model"])),
+        )
+
+    before, before_mb = traced(load_json)
+    dictionary, bigram_model, loaded_frequencies, loaded_model = before
+
+    descriptor, path = tempfile.mkstemp(suffix=".bin")
+    os.close(descriptor)
+    try:
+        write_binary_store(path, dictionary, loaded_frequencies, loaded_model)
+        variants = [("Objets Python (JSON chargés)", before, before_mb)]
+        for label, word_index in [
+            ("Vocabulaire binaire + index mot -> id", True),
+            ("Vocabulaire binaire (mmap seul)", False),
+        ]:
+
+            def open_store():
+                store = BinaryStore(path, word_index=word_index)
+                return store, (
+                    store.dictionary,
+                    store.bigram_lists(),
+                    store.frequencies,
+                    store.ngram_model(),
+                )
+
+            (store, views), size_mb = traced(open_store)
+            variants.append((label, views, size_mb))
+        mapped_mb = store.size / 1e6
+
+        for label, _, size_mb in variants:
+            mapped = (
+                f" + {mapped_mb:.1f} Mo mappés"
+                if label.startswith("Vocabulaire")
+                else ""
+            )
+            print(f"   {label:44s} {size_mb:8.1f} Mo{mapped}")
+
+        # Coût des recherches (ms), dans l'ordre des variantes ci-dessus
+        sample = rng.sample(words, 1000)
+        contexts = [
+            [rng.choice(words[:1000]) for _ in range(rng.randint(1, 2))]
+            for _ in range(200)
+        ]
+        for label, lookup in [
+            (
+                "Appartenance au dictionnaire (1000 mots)",
+                lambda v: [w in v[0] for w in sample],
+            ),
+            (
+                "Suivants d'un mot, ancien format (1000 mots)",
+                lambda v: [v[1].get(w) for w in sample],
+            ),
+            ("Fréquences (1000 mots)", lambda v: [v[2].get(w, 0) for w in sample]),
+            (
+                "Prédiction N-gram (200 contextes)",
+                lambda v: [v[3].predict(c, 5) for c in contexts],
+            ),
+            (
+                "Prédiction avec préfixe (200 contextes)",
+                lambda v: [v[3].predict(c[:-1], 5, c[-1][:2]) for c in contexts],
+            ),
+        ]:
+            timings = " -> ".join(
+                f"{measure(lambda: lookup(views), 5):7.2f} ms"
+                for _, views, _ in variants
+            )
+            print(f"   {label:44s} {timings}")
+    finally:
+        os.unlink(path)
+
+
+def bench_indexes(vocabulary_size=50_000):
+    """
+    Index dérivés (classement, SymSpell, trie) sur les données binaires:
+    construits sur les mots décodés du fichier (dict des fréquences, ensemble
+    des mots: une copie par processus) vs sur les identifiants et les
+    tableaux mappés (from_ids)
+    """
+    import os
+    import tempfile
+    import tracemalloc
+
+    from binary_store import BinaryStore, write_binary_store
+    from completion import PrefixTrie
+    from ngram_model import NgramModel
+    from ranking import FrequencyRanking
+    from symspell import SymSpellIndex
+
+    frequencies = synthetic_vocabulary(vocabulary_size)
+    words = list(frequencies)
+    rng = random.Random(23)
+    print(f"\nIndex dérivés des données binaires ({vocabulary_size:,} mots)")
+
+    descriptor, path = tempfile.mkstemp(suffix=".bin")
+    os.close(descriptor)
+    try:
+        write_binary_store(path, words, frequencies, NgramModel())
+        store = BinaryStore(path, word_index=True)
+
+        def from_words():
+            dictionary = set(store.dictionary)
+            decoded = dict(store.frequencies.items())
+            return (
+                FrequencyRanking(decoded),
+                SymSpellIndex.build(dictionary, decoded),
+                PrefixTrie.build(dictionary, decoded, top_k=21),
+            )
+
+        def from_ids():
+            counts = store.sections["frequencies"]
+            return (
+                FrequencyRanking.from_ids(
+                    store.vocabulary, counts, store.ranked_ids(), store.word_ids
+                ),
+                SymSpellIndex.from_ids(
+                    store.vocabulary, counts, store.dictionary_ids()
+                ),
+                PrefixTrie.from_ids(
+                    store.vocabulary, counts, store.dictionary_ids(), top_k=21
+                ),
+            )
+
+        variants = []
+        for label, build in [
+            ("Mots décodés (dicts)", from_words),
+            ("Identifiants + tableaux mappés", from_ids),
+        ]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            indexes = build()
+            elapsed = time.perf_counter() - start
+            size_mb = tracemalloc.get_traced_memory()[0] / 1e6
+            tracemalloc.stop()
+            variants.append(indexes)
+            print(f"   {label:44s} {size_mb:8.1f} Mo  ({elapsed:.1f} s)")
+
+        # Coût des requêtes (ms), dans l'ordre des variantes ci-dessus
+        typos = [word[:-1] for word in rng.sample(words, 200)]
+        prefixes = [word[:3] for word in rng.sample(words, 200)]
+        subset = words[::10]
+        for label, lookup in [
+            ("Top-k d'un sous-ensemble", lambda v: v[0].top_among(subset, 5)),
+            (
+                "Suggestions SymSpell (200 mots)",
+                lambda v: [v[1].lookup(w) for w in typos],
+            ),
+            (
+                "Complétions (200 préfixes)",
+                lambda v: [v[2].complete(p, 5) for p in prefixes],
+            ),
+        ]:
+            timings = " -> ".join(
+                f"{measure(lambda: lookup(indexes), 5):7.2f} ms" for indexes in variants
+            )
+            print(f"   {label:44s} {timings}")
+    finally:
+        os.unlink(path)
+
+
+BENCHMARKS = {
+    "ranking": bench_ranking,
+    "phonotactics": bench_phonotactics,
+    "tokenizer": bench_tokenizer,
+    "sketch": bench_sketch,
+    "vocabulary": bench_vocabulary,
+    "indexes": bench_indexes,
+}
+
+
+def main():
+    print("=" * 70)
+    print(" BENCHMARKS - ÉDITEUR MALAGASY INTELLIGENT")
+    print("=" * 70)
+
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            available = ", ".join(BENCHMARKS)
+            print(f"⚠ Benchmark inconnu: {name} (disponibles: {available})")
+            continue
+        BENCHMARKS[name]()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,549 @@
+"""
+Format binaire des données linguistiques, lu par mmap
+
+Un seul fichier (data/malagasy_data.bin) contient:
+- une table de chaînes triée (offsets + blob UTF-8): identifiant = rang du mot
+- un drapeau "dans le dictionnaire" par mot
+- les fréquences (tableau d'entiers) et les identifiants triés par fréquence
+- les bigrammes et trigrammes au format CSR (offsets / successeurs / comptes)
+
+Le serveur ouvre le fichier avec mmap et interroge directement les tableaux
+(recherche dichotomique dans la table de chaînes): le démarrage est en O(1)
+quelle que soit la taille des données, et les workers d'un même serveur
+partagent les pages du fichier via le cache du système. Avec word_index, la
+table de chaînes est en plus indexée en mémoire (dict mot -> identifiant,
+une seule copie de chaque mot): recherches en O(1), modèles toujours en
+tableaux d'identifiants.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ngram_model import DEFAULT_BACKOFF, NgramModel
+
+MAGIC = b"MGLX"
+FORMAT_VERSION = 1
+
+SECTIONS = [
+    "string_offsets",
+    "string_blob",
+    "dictionary_flags",
+    "frequencies",
+    "ranked_ids",
+    "bigram_offsets",
+    "bigram_totals",
+    "bigram_successors",
+    "bigram_counts",
+    "trigram_first",
+    "trigram_second",
+    "trigram_offsets",
+    "trigram_totals",
+    "trigram_successors",
+    "trigram_counts",
+]
+
+# magic, version, mots, mots du dictionnaire, contextes trigram, alpha, total
+HEADER = struct.Struct("<4sIIIIdQ")
+SECTION_ENTRY = struct.Struct("<QQ")
+ALIGNMENT = 8
+
+
+def _u32(values: Iterable[int]) -> array:
+    data = array("I", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+# ============================================================================
+# ÉCRITURE
+# ============================================================================
+
+
+def write_binary_store(
+    path: str,
+    dictionary: Iterable[str],
+    frequencies: Dict[str, int],
+    ngram_model: Optional[NgramModel] = None,
+):
+    """Écrire dictionnaire, fréquences et modèle N-gram au format binaire"""
+    dictionary = set(dictionary)
+    words = set(dictionary) | set(frequencies)
+    if ngram_model is not None:
+        words.update(ngram_model.vocabulary)
+
+    # L'ordre des octets UTF-8 est l'ordre des points de code: recherche dichotomique
+    encoded = sorted(word.encode("utf-8") for word in words)
+    vocabulary = [word.decode("utf-8") for word in encoded]
+    ids = {word: i for i, word in enumerate(vocabulary)}
+
+    string_offsets = [0]
+    for word in encoded:
+        string_offsets.append(string_offsets[-1] + len(word))
+
+    counts = [frequencies.get(word, 0) for word in vocabulary]
+    ranked = sorted(range(len(vocabulary)), key=lambda i: (-counts[i], i))
+
+    sections = {
+        "string_offsets": _u32(string_offsets),
+        "string_blob": b"".join(encoded),
+        "dictionary_flags": bytes(word in dictionary for word in vocabulary),
+        "frequencies": _u32(counts),
+        "ranked_ids": _u32(ranked),
+    }
+
+    # Bigrammes: CSR indexé par l'identifiant du mot précédent
+    bigram_offsets, bigram_totals = [0], []
+    bigram_successors, bigram_counts = [], []
+    trigram_rows = []
+    alpha, total = DEFAULT_BACKOFF, sum(counts)
+    if ngram_model is not None:
+        alpha = ngram_model.alpha
+        old_vocabulary = ngram_model.vocabulary
+        by_context = {
+            ids[old_vocabulary[context]]: (
+                successors,
+                ngram_model.bigram_totals[context],
+            )
+            for context, successors in ngram_model.bigrams.items()
+        }
+        for word_id in range(len(vocabulary)):
+            successors, context_total = by_context.get(word_id, ({}, 0))
+            for successor, count in successors.items():
+                bigram_successors.append(ids[old_vocabulary[successor]])
+                bigram_counts.append(count)
+            bigram_offsets.append(len(bigram_successors))
+            bigram_totals.append(context_total)
+
+        for (first, second), successors in ngram_model.trigrams.items():
+            trigram_rows.append(
+                (
+                    ids[old_vocabulary[first]],
+                    ids[old_vocabulary[second]],
+                    ngram_model.trigram_totals[(first, second)],
+                    [(ids[old_vocabulary[w]], c) for w, c in successors.items()],
+                )
+            )
+        trigram_rows.sort(key=lambda row: (row[0], row[1]))
+    else:
+        bigram_offsets.extend([0] * len(vocabulary))
+        bigram_totals = [0] * len(vocabulary)
+
+    trigram_offsets, trigram_successors, trigram_counts = [0], [], []
+    for _, _, _, successors in trigram_rows:
+        for successor, count in successors:
+            trigram_successors.append(successor)
+            trigram_counts.append(count)
+        trigram_offsets.append(len(trigram_successors))
+
+    sections.update(
+        {
+            "bigram_offsets": _u32(bigram_offsets),
+            "bigram_totals": _u32(bigram_totals),
+            "bigram_successors": _u32(bigram_successors),
+            "bigram_counts": _u32(bigram_counts),
+            "trigram_first": _u32(row[0] for row in trigram_rows),
+            "trigram_second": _u32(row[1] for row in trigram_rows),
+            "trigram_offsets": _u32(trigram_offsets),
+            "trigram_totals": _u32(row[2] for row in trigram_rows),
+            "trigram_successors": _u32(trigram_successors),
+            "trigram_counts": _u32(trigram_counts),
+        }
+    )
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(vocabulary),
+        len(dictionary),
+        len(trigram_rows),
+        alpha,
+        total,
+    )
+    position = HEADER.size + SECTION_ENTRY.size * len(SECTIONS)
+    table, payload = [], []
+    for name in SECTIONS:
+        data = bytes(sections[name])
+        padding = -position % ALIGNMENT
+        payload.append(b"\0" * padding)
+        position += padding
+        table.append(SECTION_ENTRY.pack(position, len(data)))
+        payload.append(data)
+        position += len(data)
+
+    # Écriture atomique: un serveur qui a déjà mappé l'ancien fichier n'est
+    # pas affecté
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(header)
+        f.write(b"".join(table))
+        f.write(b"".join(payload))
+    os.replace(temporary, path)
+
+
+# ============================================================================
+# LECTURE (MMAP)
+# ============================================================================
+
+
+class BinaryStore:
+    """Accès en lecture seule au fichier binaire, sans matérialiser les données"""
+
+    def __init__(self, path: str, word_index: bool = False):
+        if sys.byteorder != "little":
+            raise ValueError("Format binaire lisible uniquement en little-endian")
+
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self.size = len(self._mmap)
+
+        (
+            magic,
+            version,
+            self.word_count,
+            self.dictionary_count,
+            self.trigram_context_count,
+            self.alpha,
+            self.total_count,
+        ) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Fichier binaire invalide ou version inconnue: {path}")
+
+        self.sections = {}
+        for i, name in enumerate(SECTIONS):
+            offset, length = SECTION_ENTRY.unpack_from(
+                self._mmap, HEADER.size + i * SECTION_ENTRY.size
+            )
+            section = self._view[offset : offset + length]
+            if name not in ("string_blob", "dictionary_flags"):
+                section = section.cast("I")
+            self.sections[name] = section
+
+        self._offsets = self.sections["string_offsets"]
+        self._blob = self.sections["string_blob"]
+        self._flags = self.sections["dictionary_flags"]
+        self._frequencies = self.sections["frequencies"]
+        self._sorted_words = _SortedWords(self)
+        # Index mot -> identifiant en mémoire (sinon recherche dichotomique)
+        self._word_index = (
+            {self.word(word_id): word_id for word_id in range(self.word_count)}
+            if word_index
+            else None
+        )
+
+        self.dictionary = BinaryLexicon(self)
+        self.frequencies = FrequencyView(self)
+        # Vues par identifiant pour les index dérivés (classement, SymSpell,
+        # trie): aucun mot ni compte copié en mémoire
+        self.vocabulary = _VocabularyView(self)
+        self.word_ids = _WordIdsView(self)
+
+    def word(self, word_id: int) -> str:
+        """Mot correspondant à un identifiant"""
+        start, end = self._offsets[word_id], self._offsets[word_id + 1]
+        return str(self._blob[start:end], "utf-8")
+
+    def word_id(self, word: str) -> Optional[int]:
+        """Identifiant d'un mot (recherche dichotomique dans la table triée)"""
+        if self._word_index is not None:
+            return self._word_index.get(word)
+        key = word.encode("utf-8")
+        index = bisect_left(self._sorted_words, key)
+        if index < self.word_count and self._sorted_words[index] == key:
+            return index
+        return None
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """
+        Identifiants [début, fin) des mots commençant par prefix: la table est
+        triée, ces mots sont contigus (0xff n'apparaît jamais en UTF-8).
+        Le premier de l'intervalle est prefix lui-même s'il est dans le vocabulaire
+        """
+        key = prefix.encode("utf-8")
+        low = bisect_left(self._sorted_words, key)
+        return low, bisect_left(self._sorted_words, key + b"\xff", low)
+
+    def dictionary_ids(self) -> Iterable[int]:
+        """Identifiants des mots du dictionnaire"""
+        flags = self._flags
+        return (word_id for word_id in range(self.word_count) if flags[word_id])
+
+    def ranked_ids(self):
+        """Identifiants de fréquence non nulle, triés par fréquence décroissante"""
+        return self.sections["ranked_ids"][: len(self.frequencies)]
+
+    def ngram_model(self) -> "BinaryNgramModel":
+        return BinaryNgramModel(self)
+
+    def bigram_lists(self, limit: int = 10) -> "BigramListsView":
+        return BigramListsView(self, limit)
+
+    def close(self):
+        for section in self.sections.values():
+            section.release()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+class _SortedWords:
+    """Séquence des mots encodés, pour bisect sur la table de chaînes"""
+
+    def __init__(self, store: BinaryStore):
+        self._offsets = store._offsets
+        self._blob = store._blob
+        self._length = store.word_count
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._blob[self._offsets[index] : self._offsets[index + 1]].tobytes()
+
+
+class BinaryLexicon:
+    """Dictionnaire vu comme un ensemble (in / len / itération)"""
+
+    def __init__(self, store: BinaryStore):
+        self._store = store
+
+    def __contains__(self, word) -> bool:
+        word_id = self._store.word_id(word)
+        return word_id is not None and bool(self._store._flags[word_id])
+
+    def __len__(self):
+        return self._store.dictionary_count
+
+    def __iter__(self):
+        for word_id in self._store.dictionary_ids():
+            yield self._store.word(word_id)
+
+
+class FrequencyView(Mapping):
+    """Fréquences vues comme un dictionnaire mot -> compte (mots de compte > 0)"""
+
+    def __init__(self, store: BinaryStore):
+        self._store = store
+        ranked = store.sections["ranked_ids"]
+        frequencies = store._frequencies
+        # Les identifiants triés par fréquence s'arrêtent au premier compte nul
+        low, high = 0, len(ranked)
+        while low < high:
+            middle = (low + high) // 2
+            if frequencies[ranked[middle]] > 0:
+                low = middle + 1
+            else:
+                high = middle
+        self._length = low
+
+    def __getitem__(self, word):
+        word_id = self._store.word_id(word)
+        if word_id is None or not self._store._frequencies[word_id]:
+            raise KeyError(word)
+        return self._store._frequencies[word_id]
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        ranked = self._store.sections["ranked_ids"]
+        for i in range(self._length):
+            yield self._store.word(ranked[i])
+
+    def items(self):
+        ranked = self._store.sections["ranked_ids"]
+        frequencies = self._store._frequencies
+        for i in range(self._length):
+            word_id = ranked[i]
+            yield self._store.word(word_id), frequencies[word_id]
+
+
+class _VocabularyView:
+    """Identifiant -> mot"""
+
+    def __init__(self, store: BinaryStore):
+        self._store = store
+        self._offsets = store._offsets
+        self._blob = store._blob
+
+    def __getitem__(self, word_id: int) -> str:
+        # Décodage direct (appelé pour chaque candidat SymSpell / complétion)
+        offsets = self._offsets
+        return str(self._blob[offsets[word_id] : offsets[word_id + 1]], "utf-8")
+
+    def __len__(self):
+        return self._store.word_count
+
+
+class _WordIdsView:
+    """Mot -> identifiant"""
+
+    def __init__(self, store: BinaryStore):
+        self._store = store
+
+    def get(self, word, default=None):
+        word_id = self._store.word_id(word)
+        return default if word_id is None else word_id
+
+
+class _BigramView:
+    """Contexte (id) -> {successeur: compte}, lu dans les tableaux CSR"""
+
+    def __init__(self, store: BinaryStore):
+        self._offsets = store.sections["bigram_offsets"]
+        self._successors = store.sections["bigram_successors"]
+        self._counts = store.sections["bigram_counts"]
+        self._length = len(self._offsets) - 1
+        self._context_count = None
+
+    def get(self, context, default=None):
+        successors, counts = self.slices(context)
+        if not successors:
+            return default
+        return dict(zip(successors, counts))
+
+    def slices(self, context):
+        """(successeurs, comptes) d'un contexte: tranches du fichier, sans copie"""
+        if context is None or not 0 <= context < self._length:
+            return (), ()
+        start, end = self._offsets[context], self._offsets[context + 1]
+        return self._successors[start:end], self._counts[start:end]
+
+    def __len__(self):
+        # Contextes avec au moins un successeur (offsets CSR consécutifs
+        # différents), compté une fois en numpy: le fichier est immuable
+        if self._context_count is None:
+            offsets = np.frombuffer(self._offsets, dtype=np.uint32)
+            self._context_count = int(np.count_nonzero(np.diff(offsets)))
+        return self._context_count
+
+
+class _TrigramView:
+    """Contexte (id, id) -> {successeur: compte}, recherche dichotomique"""
+
+    def __init__(self, store: BinaryStore):
+        self._first = store.sections["trigram_first"]
+        self._second = store.sections["trigram_second"]
+        self._offsets = store.sections["trigram_offsets"]
+        self._successors = store.sections["trigram_successors"]
+        self._counts = store.sections["trigram_counts"]
+        self._totals = store.sections["trigram_totals"]
+
+    def _index(self, context) -> Optional[int]:
+        # Contextes triés par (premier, second): bisect (en C) sur le premier
+        # mot, puis sur le second dans le bloc trouvé
+        first, second = context
+        low = bisect_left(self._first, first)
+        high = bisect_right(self._first, first, low)
+        index = bisect_left(self._second, second, low, high)
+        if index < high and self._second[index] == second:
+            return index
+        return None
+
+    def get(self, context, default=None):
+        successors, counts, _ = self.slices(context)
+        if not successors:
+            return default
+        return dict(zip(successors, counts))
+
+    def slices(self, context):
+        """(successeurs, comptes, total) d'un contexte, tranches du fichier"""
+        index = self._index(context)
+        if index is None:
+            return (), (), 0
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._successors[start:end], self._counts[start:end], self._totals[index]
+
+    def total(self, context) -> int:
+        index = self._index(context)
+        return 0 if index is None else self._totals[index]
+
+    def __len__(self):
+        return len(self._first)
+
+
+class _TrigramTotalsView:
+    def __init__(self, trigrams: _TrigramView):
+        self._trigrams = trigrams
+
+    def __getitem__(self, context):
+        return self._trigrams.total(context)
+
+
+class BinaryNgramModel(NgramModel):
+    """NgramModel dont les tables sont des vues sur le fichier mmap"""
+
+    def __init__(self, store: BinaryStore):
+        super().__init__(alpha=store.alpha)
+        self._store = store
+        self.vocabulary = store.vocabulary
+        self.word_ids = store.word_ids
+        self.unigram_counts = store._frequencies
+        self._ranked_ids = store.sections["ranked_ids"]
+        self.total_count = store.total_count
+        self.bigrams = _BigramView(store)
+        self.bigram_totals = store.sections["bigram_totals"]
+        self.trigrams = _TrigramView(store)
+        self.trigram_totals = _TrigramTotalsView(self.trigrams)
+
+    def _successor_levels(self, previous, before) -> list:
+        levels = []
+        if before is not None and previous is not None:
+            levels.append(self.trigrams.slices((before, previous)))
+        if previous is not None:
+            successors, counts = self.bigrams.slices(previous)
+            total = self.bigram_totals[previous] if successors else 0
+            levels.append((successors, counts, total))
+        return levels
+
+    def _prefix_filter(self, prefix: str):
+        # Intervalle d'identifiants: aucun mot décodé pour filtrer
+        low, high = self._store.prefix_range(prefix)
+        if low < high and self._store.word(low) == prefix:
+            low += 1
+        return lambda word_id: low <= word_id < high
+
+    def stats(self) -> dict:
+        return {
+            "vocabulary": len(self.vocabulary),
+            "bigram_contexts": len(self.bigrams),
+            "bigrams": len(self.bigrams._successors),
+            "trigram_contexts": len(self.trigrams),
+            "trigrams": len(self.trigrams._successors),
+            "storage": "mmap",
+        }
+
+
+class BigramListsView(Mapping):
+    """Ancien format (mot -> suivants les plus fréquents), calculé à la demande"""
+
+    def __init__(self, store: BinaryStore, limit: int = 10):
+        self._store = store
+        self._bigrams = _BigramView(store)
+        self._limit = limit
+
+    def __getitem__(self, word):
+        successors = self._bigrams.get(self._store.word_id(word))
+        if not successors:
+            raise KeyError(word)
+        ranked = sorted(successors.items(), key=lambda x: -x[1])[: self._limit]
+        return [self._store.word(word_id) for word_id, _ in ranked]
+
+    def __iter__(self):
+        offsets = self._bigrams._offsets
+        for word_id in range(self._store.word_count):
+            if offsets[word_id] != offsets[word_id + 1]:
+                yield self._store.word(word_id)
+
+    def __len__(self):
+        return len(self._bigrams)
@@ -0,0 +1,172 @@
+"""
+Trie compact (arbre radix) pondéré par les fréquences pour la complétion de mots
+
+Chaque nœud garde les top-k complétions de son sous-arbre, précalculées à la
+construction: compléter "mand" revient à descendre le long du préfixe puis à
+lire une liste déjà triée.
+
+Les nœuds ne gardent que des identifiants de mots: vocabulaire et fréquences
+sont des suites indexées par identifiant (vues du fichier binaire avec
+from_ids), les mots ne sont lus qu'au moment de répondre.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Nombre de complétions précalculées par nœud
+DEFAULT_TOP_K = 10
+
+
+class _Node:
+    __slots__ = ("edges", "word", "top")
+
+    def __init__(self):
+        # Premier caractère -> (étiquette de l'arête, nœud enfant)
+        self.edges: Dict[str, Tuple[str, "_Node"]] = {}
+        # Identifiants: mot du nœud, top-k complétions du sous-arbre
+        self.word: Optional[int] = None
+        self.top: Tuple[int, ...] = ()
+
+
+class PrefixTrie:
+    """Arbre radix des mots du dictionnaire avec top-k complétions par nœud"""
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self.top_k = top_k
+        self.root = _Node()
+        self.vocabulary: Sequence[str] = []
+        self.frequencies: Sequence[int] = []
+        self.node_count = 1
+        self.word_count = 0
+
+    @classmethod
+    def build(
+        cls,
+        words: Iterable[str],
+        frequencies: Optional[Dict[str, int]] = None,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> "PrefixTrie":
+        """Construire le trie puis précalculer les complétions de chaque nœud"""
+        vocabulary = sorted(set(words))
+        frequencies = frequencies or {}
+        return cls.from_ids(
+            vocabulary,
+            [frequencies.get(word, 0) for word in vocabulary],
+            range(len(vocabulary)),
+            top_k=top_k,
+        )
+
+    @classmethod
+    def from_ids(
+        cls,
+        vocabulary: Sequence[str],
+        frequencies: Sequence[int],
+        word_ids: Iterable[int],
+        top_k: int = DEFAULT_TOP_K,
+    ) -> "PrefixTrie":
+        """
+        Construire le trie sur des identifiants existants
+        vocabulary / frequencies: identifiant -> mot / fréquence, non copiés
+        """
+        trie = cls(top_k=top_k)
+        trie.vocabulary = vocabulary
+        trie.frequencies = frequencies
+        for word_id in word_ids:
+            trie.insert(word_id)
+        trie._compute_top(trie.root)
+        return trie
+
+    def _rank(self, word_id: int):
+        # Fréquence décroissante, puis mots courts, puis ordre alphabétique
+        word = self.vocabulary[word_id]
+        return (-self.frequencies[word_id], len(word), word)
+
+    def insert(self, word_id: int):
+        """Insérer un mot (les top-k doivent être recalculés ensuite)"""
+        word = self.vocabulary[word_id]
+        node = self.root
+        rest = word
+        while rest:
+            edge = node.edges.get(rest[0])
+            if edge is None:
+                leaf = _Node()
+                node.edges[rest[0]] = (rest, leaf)
+                self.node_count += 1
+                node = leaf
+                break
+
+            label, child = edge
+            common = 0
+            limit = min(len(label), len(rest))
+            while common < limit and label[common] == rest[common]:
+                common += 1
+
+            if common < len(label):
+                # Découper l'arête au point de divergence
+                middle = _Node()
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[rest[0]] = (label[:common], middle)
+                self.node_count += 1
+                child = middle
+
+            node = child
+            rest = rest[common:]
+
+        if node.word is None:
+            node.word = word_id
+            self.word_count += 1
+
+    def _compute_top(self, node: _Node):
+        candidates = [node.word] if node.word is not None else []
+        for _, child in node.edges.values():
+            self._compute_top(child)
+            candidates.extend(child.top)
+        node.top = tuple(heapq.nsmallest(self.top_k, candidates, key=self._rank))
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        """Nœud sous lequel se trouvent tous les mots commençant par prefix"""
+        node = self.root
+        rest = prefix
+        while rest:
+            edge = node.edges.get(rest[0])
+            if edge is None:
+                return None
+            label, child = edge
+            if label.startswith(rest):
+                return child
+            if not rest.startswith(label):
+                return None
+            node = child
+            rest = rest[len(label) :]
+        return node
+
+    def _iter_words(self, node: _Node):
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.word is not None:
+                yield current.word
+            stack.extend(child for _, child in current.edges.values())
+
+    def complete(self, prefix: str, limit: int = 5) -> List[str]:
+        """Mots les plus fréquents commençant par prefix"""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        if limit <= self.top_k:
+            best = node.top[:limit]
+        else:
+            # Au-delà des top-k précalculés: parcours du sous-arbre
+            best = heapq.nsmallest(limit, self._iter_words(node), key=self._rank)
+        return [self.vocabulary[word_id] for word_id in best]
+
+    def __contains__(self, word: str):
+        node = self._find(word)
+        return (
+            node is not None
+            and node.word is not None
+            and self.vocabulary[node.word] == word
+        )
+
+    def __len__(self):
+        return self.word_count
@@ -0,0 +1,130 @@
+"""
+Comptes N-gram à mémoire bornée pour la construction du corpus
+
+SpillingCounter se comporte comme un Counter de n-grams (tuples de tokens)
+dont la partie en mémoire est limitée à max_entries clés: au-delà, les
+comptes partiels sont triés et écrits sur disque (un "run" par
+déversement). items() fusionne ensuite tous les runs en un seul passage
+(fusion externe, heapq.merge), dans l'ordre des clés, sans jamais charger
+l'ensemble des comptes.
+
+Les tokens ne contiennent ni espace ni tabulation (voir tokenizer.py):
+un n-gram est écrit "w1 w2\\tcompte" sur une ligne.
+"""
+
+import heapq
+import os
+import tempfile
+from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterator, List, Mapping, Optional, Tuple
+
+# Nombre maximal de runs fusionnés en une fois (fichiers ouverts simultanément)
+MERGE_FAN_IN = 64
+
+
+def _encode(ngram: Tuple[str, ...]) -> str:
+    return " ".join(ngram)
+
+
+def _decode(key: str) -> Tuple[str, ...]:
+    return tuple(key.split(" "))
+
+
+def _read_run(path: str) -> Iterator[Tuple[str, int]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            key, _, count = line.rstrip("\n").rpartition("\t")
+            yield key, int(count)
+
+
+def _merge_sorted(runs) -> Iterator[Tuple[str, int]]:
+    """Fusionne des suites (clé, compte) triées en additionnant les clés égales"""
+    merged = heapq.merge(*runs, key=itemgetter(0))
+    for key, group in groupby(merged, key=itemgetter(0)):
+        yield key, sum(count for _, count in group)
+
+
+class SpillingCounter:
+    """Counter de n-grams borné en mémoire, avec fusion externe sur disque"""
+
+    def __init__(
+        self, name: str, spill_dir: Optional[str] = None, max_entries: int = 1_000_000
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self._tmp = None
+        if spill_dir is None:
+            # Supprimé automatiquement avec le compteur
+            self._tmp = tempfile.TemporaryDirectory(prefix=f"malagasy-{name}-")
+            spill_dir = self._tmp.name
+        os.makedirs(spill_dir, exist_ok=True)
+        self.spill_dir = spill_dir
+        self.counts = Counter()
+        self.runs: List[str] = []
+        self.spills = 0
+        self.spilled_bytes = 0
+
+    def update(self, counts: Mapping[Tuple[str, ...], int]):
+        self.counts.update(counts)
+        if len(self.counts) >= self.max_entries:
+            self.spill()
+
+    def spill(self):
+        """Écrit les comptes en mémoire, triés, dans un nouveau run"""
+        if not self.counts:
+            return
+        path = self._run_path()
+        self._write_run(path, sorted((_encode(k), c) for k, c in self.counts.items()))
+        self.runs.append(path)
+        self.counts = Counter()
+        self.spills += 1
+        if len(self.runs) >= MERGE_FAN_IN:
+            self._compact()
+
+    def _run_path(self) -> str:
+        return os.path.join(self.spill_dir, f"{self.name}-{self.spills:05d}.tsv")
+
+    def _write_run(self, path: str, items):
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(f"{key}\t{count}\n" for key, count in items)
+        self.spilled_bytes += os.path.getsize(path)
+
+    def _compact(self):
+        """Fusionne tous les runs en un seul (limite les fichiers ouverts)"""
+        path = os.path.join(self.spill_dir, f"{self.name}-merged-{self.spills:05d}.tsv")
+        self._write_run(path, _merge_sorted(_read_run(run) for run in self.runs))
+        for run in self.runs:
+            os.remove(run)
+        self.runs = [path]
+
+    def items(self) -> Iterator[Tuple[Tuple[str, ...], int]]:
+        """Tous les n-grams et leurs comptes totaux, triés par clé"""
+        if not self.runs:
+            for key, count in sorted(
+                self.counts.items(), key=lambda item: _encode(item[0])
+            ):
+                yield key, count
+            return
+        in_memory = sorted((_encode(k), c) for k, c in self.counts.items())
+        runs = [_read_run(run) for run in self.runs] + [iter(in_memory)]
+        for key, count in _merge_sorted(runs):
+            yield _decode(key), count
+
+    def stats(self) -> dict:
+        return {
+            "in_memory": len(self.counts),
+            "runs": len(self.runs),
+            "spills": self.spills,
+            "spilled_bytes": self.spilled_bytes,
+        }
+
+    def close(self):
+        """Supprime les runs sur disque"""
+        for run in self.runs:
+            if os.path.exists(run):
+                os.remove(run)
+        self.runs = []
+        if self._tmp is not None:
+            self._tmp.cleanup()
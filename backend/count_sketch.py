@@ -0,0 +1,216 @@
+"""
+Comptes N-gram approchés à mémoire fixe (Count-Min Sketch)
+
+CountMinSketch: tableau depth x width de compteurs (numpy uint32). Chaque
+clé incrémente une case par ligne, son estimation est le minimum de ses
+cases: jamais sous-estimée, surestimée d'au plus e/width * N avec une
+probabilité 1 - exp(-depth) (N: somme des comptes ajoutés). La mise à jour
+conservatrice (Estan & Varghese, 2002) n'élève chaque case qu'au minimum
+nécessaire, ce qui réduit nettement la surestimation des clés rares.
+
+SketchCounter remplace un Counter de n-grams dans le scraper: les comptes
+vont dans l'esquisse, seuls les top_k successeurs les plus fréquents de
+chaque contexte (heavy hitters) sont gardés explicitement, à partir de
+min_count occurrences estimées. Les n-grams vus une seule fois, la grande
+majorité, n'occupent aucune entrée. Le total de chaque contexte (avant
+élagage) vient des comptes de l'ordre inférieur (context_counts: unigrammes
+pour les bigrammes, esquisse des bigrammes pour les trigrammes), ou à
+défaut est compté dans l'esquisse elle-même (charge doublée).
+
+Les cases sont dérivées de hash() (double hachage): stables dans un même
+processus, pas d'un lancement à l'autre.
+"""
+
+import math
+from collections import Counter
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_WIDTH = 1 << 20
+DEFAULT_DEPTH = 4
+
+# Clés mises à jour ensemble (borne les tableaux numpy temporaires)
+UPDATE_CHUNK = 1 << 14
+
+_MASK64 = (1 << 64) - 1
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+
+class CountMinSketch:
+    """Esquisse Count-Min (mise à jour conservatrice par défaut)"""
+
+    def __init__(
+        self,
+        width: int = DEFAULT_WIDTH,
+        depth: int = DEFAULT_DEPTH,
+        conservative: bool = True,
+    ):
+        if width < 1 or depth < 1:
+            raise ValueError("width et depth doivent être positifs")
+        self.width = width
+        self.depth = depth
+        self.conservative = conservative
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+        self.total = 0
+        self._rows = np.arange(depth, dtype=np.uint64)[:, None]
+
+    def _indices(self, keys: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+        """Cases des clés: (lignes, colonnes), tableaux (depth, len(keys))"""
+        hashes = np.fromiter(
+            (hash(key) & _MASK64 for key in keys), dtype=np.uint64, count=len(keys)
+        )
+        # Double hachage (Kirsch & Mitzenmacher): h1 + i * h2 pour la ligne i
+        h1 = hashes & _MASK32
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        columns = ((h1 + self._rows * h2) % np.uint64(self.width)).astype(np.intp)
+        rows = np.broadcast_to(self._rows.astype(np.intp), columns.shape)
+        return rows, columns
+
+    def update(self, keys: Sequence, counts: np.ndarray) -> np.ndarray:
+        """Ajoute counts[i] à keys[i]; retourne les nouvelles estimations"""
+        if not len(keys):
+            return np.zeros(0, dtype=np.uint32)
+        counts = np.asarray(counts, dtype=np.uint32)
+        rows, columns = self._indices(keys)
+        if self.conservative:
+            # Chaque case monte au plus à (estimation + compte): sur un lot,
+            # les estimations sont lues avant écriture, aucune clé n'est
+            # jamais sous-estimée
+            target = self.table[rows, columns].min(axis=0) + counts
+            np.maximum.at(
+                self.table, (rows, columns), np.broadcast_to(target, columns.shape)
+            )
+        else:
+            np.add.at(
+                self.table, (rows, columns), np.broadcast_to(counts, columns.shape)
+            )
+        self.total += int(counts.sum())
+        return self.table[rows, columns].min(axis=0)
+
+    def estimate(self, keys: Sequence) -> np.ndarray:
+        if not len(keys):
+            return np.zeros(0, dtype=np.uint32)
+        rows, columns = self._indices(keys)
+        return self.table[rows, columns].min(axis=0)
+
+    def error_bound(self) -> float:
+        """Surestimation maximale (probabilité 1 - exp(-depth))"""
+        return math.e / self.width * self.total
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+
+class SketchCounter:
+    """
+    Comptes de n-grams approchés: esquisse Count-Min + top-k par contexte
+    (contexte: le n-gram sans son dernier mot)
+    """
+
+    def __init__(
+        self,
+        width: int = DEFAULT_WIDTH,
+        depth: int = DEFAULT_DEPTH,
+        top_k: int = 50,
+        min_count: int = 2,
+        conservative: bool = True,
+        context_counts: Optional[Callable[[List[tuple]], Sequence[int]]] = None,
+    ):
+        self.sketch = CountMinSketch(width, depth, conservative)
+        self.top_k = top_k
+        self.min_count = min_count
+        # Comptes (ou majorants) des contextes, tenus par l'ordre inférieur
+        self.context_counts = context_counts
+        # Contexte -> {successeur: compte estimé}, au plus top_k entrées
+        self.heavy_hitters: Dict[Tuple[str, ...], Dict[str, int]] = {}
+        # Contexte plein -> plus petit compte gardé (minorant): la plupart
+        # des candidats sont rejetés sans parcourir les top_k entrées
+        self._floors: Dict[Tuple[str, ...], int] = {}
+
+    def update(self, counts: Mapping[Tuple[str, ...], int]):
+        if not counts:
+            return
+        # Un n-gram n'est suivi que si son contexte atteint aussi min_count:
+        # aucun vrai n-gram fréquent n'est perdu (jamais de sous-estimation),
+        # un faux positif exige deux collisions indépendantes
+        if self.context_counts is None:
+            totals = Counter()
+            for ngram, count in counts.items():
+                totals[ngram[:-1]] += count
+            frequent_contexts = {context for context, _ in self._add(totals)}
+        else:
+            contexts = list({ngram[:-1] for ngram in counts})
+            frequent_contexts = {
+                context
+                for context, count in zip(contexts, self.context_counts(contexts))
+                if count >= self.min_count
+            }
+        for ngram, estimate in self._add(counts):
+            context = ngram[:-1]
+            if context in frequent_contexts:
+                self._offer(context, ngram[-1], estimate)
+
+    def _add(self, counts: Mapping[tuple, int]) -> Iterator[Tuple[tuple, int]]:
+        """Ajoute les comptes par tranches; génère les clés estimées >= min_count"""
+        items = iter(counts.items())
+        while True:
+            chunk = list(islice(items, UPDATE_CHUNK))
+            if not chunk:
+                return
+            keys = [key for key, _ in chunk]
+            values = np.fromiter(
+                (count for _, count in chunk), dtype=np.uint32, count=len(chunk)
+            )
+            estimates = self.sketch.update(keys, values)
+            for i in np.flatnonzero(estimates >= self.min_count).tolist():
+                yield keys[i], int(estimates[i])
+
+    def _offer(self, context, word, estimate):
+        top = self.heavy_hitters.get(context)
+        if top is None:
+            self.heavy_hitters[context] = {word: estimate}
+        elif word in top or len(top) < self.top_k:
+            top[word] = estimate
+            if len(top) == self.top_k and context not in self._floors:
+                self._floors[context] = min(top.values())
+        elif estimate > self._floors[context]:
+            # Les comptes gardés ne font que croître: une valeur ancienne est
+            # un minorant, le remplacement reste prudent
+            weakest = min(top, key=top.get)
+            if estimate > top[weakest]:
+                del top[weakest]
+                top[word] = estimate
+            self._floors[context] = min(top.values())
+
+    def items(self) -> Iterator[Tuple[Tuple[str, ...], int]]:
+        """N-grams suivis avec leur estimation finale, triés par n-gram"""
+        ngrams = sorted(
+            context + (word,)
+            for context, top in self.heavy_hitters.items()
+            for word in top
+        )
+        yield from zip(ngrams, self.sketch.estimate(ngrams).tolist())
+
+    def estimate(self, ngrams: Sequence[tuple]) -> np.ndarray:
+        return self.sketch.estimate(ngrams)
+
+    def context_total(self, context) -> int:
+        """Total estimé d'un contexte (mot seul pour les bigrammes)"""
+        key = context if isinstance(context, tuple) else (context,)
+        if self.context_counts is not None:
+            return int(self.context_counts([key])[0])
+        return int(self.sketch.estimate([key])[0])
+
+    def stats(self) -> dict:
+        return {
+            "width": self.sketch.width,
+            "depth": self.sketch.depth,
+            "sketch_bytes": self.sketch.nbytes,
+            "contexts": len(self.heavy_hitters),
+            "tracked": sum(len(top) for top in self.heavy_hitters.values()),
+            "total": self.sketch.total,
+            "error_bound": self.sketch.error_bound(),
+        }
@@ -0,0 +1,188 @@
+"""
+Stockage persistant du crawl (SQLite)
+
+- pages: articles Wikipedia par identifiant de page, avec leur révision
+  (lastrevid): un article déjà stocké dans la même révision n'est pas
+  retéléchargé
+- documents: pages HTML par URL, avec ETag / Last-Modified pour les
+  requêtes conditionnelles (304 Not Modified: contenu stocké réutilisé)
+- checkpoints: état d'un crawl en cours (articles du crawl, articles déjà
+  traités), pour reprendre un crawl interrompu
+
+Les textes sont compressés (zlib). Le corpus complet reste disponible pour
+reconstruire les modèles hors ligne (iter_texts).
+"""
+
+import json
+import os
+import sqlite3
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    page_id    INTEGER PRIMARY KEY,
+    source     TEXT NOT NULL,
+    title      TEXT,
+    revision   INTEGER,
+    fetched_at REAL NOT NULL,
+    text       BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    url           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    fetched_at    REAL NOT NULL,
+    content       BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name       TEXT PRIMARY KEY,
+    state      TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def _pack(data: bytes) -> bytes:
+    return zlib.compress(data, 6)
+
+
+def _unpack(blob: bytes) -> bytes:
+    return zlib.decompress(blob)
+
+
+class CrawlStore:
+    """Pages, documents et points de reprise d'un crawl, dans un fichier SQLite"""
+
+    def __init__(self, path: str = "data/crawl_store.sqlite3"):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        # WAL: un crawl interrompu ne laisse pas la base dans un état incohérent
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    # ------------------------------------------------------------------
+    # Articles (par identifiant de page)
+    # ------------------------------------------------------------------
+
+    def revisions(self, page_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+        """Révision stockée de chaque page connue parmi page_ids"""
+        page_ids = list(page_ids)
+        if not page_ids:
+            return {}
+        placeholders = ",".join("?" * len(page_ids))
+        rows = self._db.execute(
+            f"SELECT page_id, revision FROM pages WHERE page_id IN ({placeholders})",
+            page_ids,
+        )
+        return dict(rows.fetchall())
+
+    def put_page(
+        self,
+        page_id: int,
+        text: str,
+        revision: Optional[int] = None,
+        title: Optional[str] = None,
+        source: str = "wikipedia",
+    ):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    page_id,
+                    source,
+                    title,
+                    revision,
+                    time.time(),
+                    _pack(text.encode("utf-8")),
+                ),
+            )
+
+    def get_texts(self, page_ids: Iterable[int]) -> Dict[int, str]:
+        page_ids = list(page_ids)
+        if not page_ids:
+            return {}
+        placeholders = ",".join("?" * len(page_ids))
+        rows = self._db.execute(
+            f"SELECT page_id, text FROM pages WHERE page_id IN ({placeholders})",
+            page_ids,
+        )
+        return {page_id: _unpack(blob).decode("utf-8") for page_id, blob in rows}
+
+    def iter_texts(self, source: Optional[str] = None) -> Iterator[str]:
+        """Tous les textes stockés, un à la fois (reconstruction hors ligne)"""
+        query = "SELECT text FROM pages"
+        params = ()
+        if source is not None:
+            query += " WHERE source = ?"
+            params = (source,)
+        for (blob,) in self._db.execute(query + " ORDER BY page_id", params):
+            yield _unpack(blob).decode("utf-8")
+
+    # ------------------------------------------------------------------
+    # Documents HTML (par URL, requêtes conditionnelles)
+    # ------------------------------------------------------------------
+
+    def get_document(self, url: str) -> Optional[dict]:
+        row = self._db.execute(
+            "SELECT etag, last_modified, content FROM documents WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, blob = row
+        return {"etag": etag, "last_modified": last_modified, "content": _unpack(blob)}
+
+    def put_document(
+        self,
+        url: str,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, time.time(), _pack(content)),
+            )
+
+    # ------------------------------------------------------------------
+    # Points de reprise
+    # ------------------------------------------------------------------
+
+    def load_checkpoint(self, name: str) -> Optional[dict]:
+        row = self._db.execute(
+            "SELECT state FROM checkpoints WHERE name = ?", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_checkpoint(self, name: str, state: dict):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                (name, json.dumps(state), time.time()),
+            )
+
+    def clear_checkpoint(self, name: str):
+        with self._db:
+            self._db.execute("DELETE FROM checkpoints WHERE name = ?", (name,))
+
+    def stats(self) -> dict:
+        pages, text_bytes = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(text)), 0) FROM pages"
+        ).fetchone()
+        documents = self._db.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        return {
+            "pages": pages,
+            "documents": documents,
+            "compressed_bytes": text_bytes,
+            "file_bytes": (
+                os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            ),
+        }
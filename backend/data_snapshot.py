@@ -0,0 +1,84 @@
+"""
+Instantané immuable des données linguistiques servies par l'API
+
+Toutes les structures (dictionnaire, modèles, index dérivés) d'une même
+version sont regroupées dans un seul objet. Un rechargement construit un
+nouvel instantané hors du chemin des requêtes puis remplace la référence
+globale en une affectation: chaque requête lit l'instantané une fois au
+début et travaille sur des données cohérentes jusqu'à la fin.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
+
+# Fichiers surveillés pour le rechargement automatique
+DATA_FILE_EXTENSIONS = (".json", ".bin")
+
+# Touché par /admin/reload: la signature surveillée change, les autres
+# workers (surveillance active) rechargent eux aussi
+RELOAD_MARKER = ".reload"
+
+
+@dataclass(frozen=True)
+class LinguisticSnapshot:
+    """Données et index d'une version donnée (jamais modifiés après création)"""
+
+    version: int
+    dictionary: Any
+    bigram_model: Any
+    frequencies: Any
+    ngram_model: Any
+    ranking: Any
+    spell_index: Any
+    completion_trie: Any
+    # Analyseur morphologique (segmentations mémorisées par forme de surface)
+    analyzer: Any
+    # Liste ordonnée du dictionnaire (colonnes de process.cdist)
+    dictionary_words: List[str]
+    binary_store: Any = None
+    # Signature des fichiers de data/ au moment du chargement
+    files_signature: Tuple = ()
+    loaded_at: float = field(default_factory=time.time)
+    build_seconds: float = 0.0
+
+    @property
+    def version_id(self) -> str:
+        """Identifiant lisible: version et date de chargement"""
+        return f"{self.version}-{int(self.loaded_at)}"
+
+    def describe(self) -> dict:
+        return {
+            "version": self.version,
+            "version_id": self.version_id,
+            "loaded_at": self.loaded_at,
+            "build_seconds": round(self.build_seconds, 3),
+            "storage": "mmap" if self.binary_store is not None else "memory",
+            "files": len(self.files_signature),
+        }
+
+
+def data_files_signature(directory: str = "data") -> Tuple:
+    """(nom, taille, date de modification) des fichiers de données, triés"""
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return ()
+    signature = []
+    for entry in entries:
+        if entry.is_file() and (
+            entry.name.endswith(DATA_FILE_EXTENSIONS) or entry.name == RELOAD_MARKER
+        ):
+            stat = entry.stat()
+            signature.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+def touch_reload_marker(directory: str = "data"):
+    """Change la signature de data/ sans toucher aux fichiers de données"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, RELOAD_MARKER)
+    with open(path, "a"):
+        pass
+    os.utime(path)
@@ -0,0 +1,154 @@
+"""
+Détection des quasi-doublons à l'ingestion du corpus (MinHash + LSH)
+
+Chaque document est réduit à l'ensemble de ses shingles (suites de
+shingle_size tokens consécutifs), puis à une signature MinHash de num_perm
+entiers: la proportion de composantes égales entre deux signatures estime la
+similarité de Jaccard des deux ensembles. L'index LSH découpe la signature
+en `bands` bandes: deux documents qui partagent une bande entière sont
+candidats (probabilité élevée au-delà de (1/bands)^(1/rows) de similarité),
+puis confirmés si leur similarité estimée atteint threshold.
+
+Un document aux tokens identiques à un précédent est écarté sans comparer
+les signatures. Le premier document vu est toujours conservé.
+
+Empreinte et signature sont calculées par MinHasher sur les tokens du
+comptage, dans les workers (scraper.count_articles): chaque article n'est
+tokenisé qu'une fois. Les hachages (crc32, blake2b) ne dépendent pas de la
+graine de hash() du processus: deux workers donnent la même signature.
+"""
+
+import hashlib
+import zlib
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 16
+SHINGLE_SIZE = 5
+
+
+class MinHasher:
+    """Empreinte exacte et signature MinHash d'une liste de tokens (picklable)"""
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = SHINGLE_SIZE,
+        seed: int = 1,
+    ):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Hachage multiplicatif sur 64 bits: (a * x + b) >> 32, a impair
+        rng = np.random.default_rng(seed)
+        self._a = (rng.integers(0, 2**64, num_perm, dtype=np.uint64) | np.uint64(1))[
+            :, None
+        ]
+        self._b = rng.integers(0, 2**64, num_perm, dtype=np.uint64)[:, None]
+        # Combinaison des hachages des tokens d'un shingle (un facteur par rang)
+        self._mix = rng.integers(0, 2**64, shingle_size, dtype=np.uint64) | np.uint64(1)
+
+    def sketch(self, tokens: Sequence[str]) -> Tuple[int, np.ndarray]:
+        """(empreinte des tokens, signature MinHash de leurs shingles)"""
+        fingerprint = int.from_bytes(
+            hashlib.blake2b(
+                "\x1f".join(tokens).encode("utf-8"), digest_size=8
+            ).digest(),
+            "little",
+        )
+        hashed = np.fromiter(
+            (zlib.crc32(token.encode("utf-8")) for token in tokens),
+            dtype=np.uint64,
+            count=len(tokens),
+        )
+        # Texte plus court qu'un shingle: un seul shingle (éventuellement vide)
+        size = min(self.shingle_size, len(tokens))
+        count = len(tokens) - size + 1
+        shingles = np.zeros(count, dtype=np.uint64)
+        for rank in range(size):
+            shingles += hashed[rank : rank + count] * self._mix[rank]
+        values = shingles >> np.uint64(32)
+        permuted = (self._a * values + self._b) >> np.uint64(32)
+        return fingerprint, permuted.min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateDetector:
+    """Index MinHash/LSH des documents déjà ingérés"""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = SHINGLE_SIZE,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm doit être un multiple de bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, shingle_size, seed)
+        self._fingerprints = set()
+        # (bande, valeurs de la bande) -> documents indexés partageant la bande
+        self._buckets: Dict[int, List[int]] = {}
+        self._signatures: List[np.ndarray] = []
+        self.stats = {
+            "documents": 0,
+            "exact_duplicates": 0,
+            "near_duplicates": 0,
+            "tokens_dropped": 0,
+        }
+
+    def signature(self, tokens: Sequence[str]) -> np.ndarray:
+        """Signature MinHash (num_perm entiers) des shingles de tokens"""
+        return self.hasher.sketch(tokens)[1]
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Similarité de Jaccard estimée entre deux signatures"""
+        return np.count_nonzero(first == second) / self.num_perm
+
+    def is_duplicate(self, tokens: Sequence[str]) -> bool:
+        """
+        Le document (ses tokens) double-t-il un document déjà vu? Sinon il
+        est indexé (les doublons ne le sont pas: le premier reste la référence)
+        """
+        return self.check(*self.hasher.sketch(tokens), len(tokens))
+
+    def check(self, fingerprint: int, signature: np.ndarray, token_count: int) -> bool:
+        """is_duplicate sur une empreinte et une signature déjà calculées"""
+        self.stats["documents"] += 1
+
+        if fingerprint in self._fingerprints:
+            self._drop("exact_duplicates", token_count)
+            return True
+
+        keys = [
+            hash((band, signature[band * self.rows : (band + 1) * self.rows].tobytes()))
+            for band in range(self.bands)
+        ]
+        candidates = {
+            document for key in keys for document in self._buckets.get(key, ())
+        }
+        for candidate in candidates:
+            if (
+                self.similarity(self._signatures[candidate], signature)
+                >= self.threshold
+            ):
+                self._drop("near_duplicates", token_count)
+                return True
+
+        document = len(self._signatures)
+        self._signatures.append(signature)
+        self._fingerprints.add(fingerprint)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(document)
+        return False
+
+    def _drop(self, kind: str, token_count: int):
+        self.stats[kind] += 1
+        self.stats["tokens_dropped"] += token_count
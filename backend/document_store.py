@@ -0,0 +1,170 @@
+"""
+État des documents côté serveur pour la vérification orthographique incrémentale
+
+Chaque document suivi garde son texte et ses tokens (positions dans des tableaux
+numpy, pour décaler en bloc les tokens situés après une modification). Un delta
+Quill (retain / insert / delete) ne provoque la re-tokenisation que de la zone
+modifiée. Les documents inactifs sont évincés après un TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Caractère utilisé pour les insertions non textuelles (images, embeds Quill):
+# un embed compte pour une position dans un delta, le client envoie le même
+# caractère (U+FFFC, OBJECT REPLACEMENT CHARACTER) dans le texte complet
+EMBED_PLACEHOLDER = "\ufffc"
+
+
+def apply_delta(text: str, ops: List[dict]) -> Tuple[str, int, int, int]:
+    """
+    Applique un delta Quill au texte
+    Retourne (nouveau texte, début de la zone modifiée,
+              fin de la zone dans l'ancien texte, fin dans le nouveau texte)
+    """
+    pieces = []
+    old_pos = 0
+    new_pos = 0
+    change_start = None
+    old_change_end = new_change_end = 0
+
+    for op in ops:
+        if "retain" in op:
+            count = int(op["retain"])
+            if old_pos + count > len(text):
+                raise ValueError("Delta incompatible avec le texte du document")
+            pieces.append(text[old_pos : old_pos + count])
+            old_pos += count
+            new_pos += count
+            continue
+
+        if change_start is None:
+            change_start = old_pos
+
+        if "insert" in op:
+            inserted = op["insert"]
+            if not isinstance(inserted, str):
+                inserted = EMBED_PLACEHOLDER
+            pieces.append(inserted)
+            new_pos += len(inserted)
+        elif "delete" in op:
+            count = int(op["delete"])
+            if old_pos + count > len(text):
+                raise ValueError("Delta incompatible avec le texte du document")
+            old_pos += count
+        else:
+            raise ValueError(f"Opération de delta inconnue: {op}")
+
+        old_change_end = old_pos
+        new_change_end = new_pos
+
+    pieces.append(text[old_pos:])
+    new_text = "".join(pieces)
+
+    if change_start is None:
+        return new_text, len(text), len(text), len(text)
+    return new_text, change_start, old_change_end, new_change_end
+
+
+class TrackedDocument:
+    """Texte et tokens (mot, position, correction) d'un document suivi"""
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self.version = 0
+        # Version du dictionnaire utilisée pour les corrections mémorisées
+        self.dictionary_version = 0
+        self.starts = np.zeros(0, dtype=np.int64)
+        self.ends = np.zeros(0, dtype=np.int64)
+        self.words: List[str] = []
+        self.correct: List[bool] = []
+        self.errors = 0
+        self.last_access = time.monotonic()
+
+    def affected_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Indices [lo, hi) des tokens qui touchent la zone [start, end]"""
+        lo = int(np.searchsorted(self.ends, start, side="left"))
+        hi = int(np.searchsorted(self.starts, end, side="right"))
+        return lo, max(lo, hi)
+
+    def replace_tokens(
+        self,
+        lo: int,
+        hi: int,
+        tokens: List[Tuple[str, int, int]],
+        correct: List[bool],
+        shift: int,
+    ):
+        """Remplace les tokens [lo, hi) et décale les positions des suivants"""
+        tail_starts = self.starts[hi:] + shift
+        tail_ends = self.ends[hi:] + shift
+        new_starts = np.fromiter(
+            (t[1] for t in tokens), dtype=np.int64, count=len(tokens)
+        )
+        new_ends = np.fromiter(
+            (t[2] for t in tokens), dtype=np.int64, count=len(tokens)
+        )
+
+        self.starts = np.concatenate((self.starts[:lo], new_starts, tail_starts))
+        self.ends = np.concatenate((self.ends[:lo], new_ends, tail_ends))
+
+        self.errors -= sum(1 for ok in self.correct[lo:hi] if not ok)
+        self.errors += sum(1 for ok in correct if not ok)
+        self.words[lo:hi] = [t[0] for t in tokens]
+        self.correct[lo:hi] = correct
+
+    def __len__(self):
+        return len(self.words)
+
+
+class DocumentStore:
+    """Documents suivis, évincés après ttl secondes d'inactivité (LRU borné)"""
+
+    def __init__(self, ttl: float = 1800.0, max_documents: int = 1000):
+        self.ttl = ttl
+        self.max_documents = max_documents
+        self._documents = OrderedDict()
+        self.evictions = 0
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        while self._documents:
+            document_id, document = next(iter(self._documents.items()))
+            expired = now - document.last_access > self.ttl
+            if not expired and len(self._documents) <= self.max_documents:
+                break
+            del self._documents[document_id]
+            self.evictions += 1
+
+    def get(self, document_id: str) -> Optional[TrackedDocument]:
+        """Document suivi, ou None s'il est inconnu ou expiré"""
+        self._evict_expired()
+        document = self._documents.get(document_id)
+        if document is not None:
+            document.last_access = time.monotonic()
+            self._documents.move_to_end(document_id)
+        return document
+
+    def create(self, document_id: str, text: str) -> TrackedDocument:
+        """(Re)crée un document à partir de son texte complet"""
+        document = TrackedDocument(text)
+        self._documents[document_id] = document
+        self._documents.move_to_end(document_id)
+        self._evict_expired()
+        return document
+
+    def discard(self, document_id: str):
+        self._documents.pop(document_id, None)
+
+    def stats(self) -> dict:
+        self._evict_expired()
+        return {
+            "documents": len(self._documents),
+            "tokens": sum(len(d) for d in self._documents.values()),
+            "ttl_seconds": self.ttl,
+            "max_documents": self.max_documents,
+            "evictions": self.evictions,
+        }
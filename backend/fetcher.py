@@ -0,0 +1,144 @@
+"""
+Téléchargement HTTP concurrent pour le scraper (asyncio + httpx)
+
+- concurrence limitée (sémaphore global)
+- limite de débit par hôte (seau à jetons: `rate` requêtes/s, rafales de `burst`)
+- nouvelles tentatives avec attente exponentielle sur erreurs réseau,
+  429 et 5xx (en-tête Retry-After respecté)
+
+Installation: pip install httpx
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+# Statuts qui justifient une nouvelle tentative
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+class TokenBucket:
+    """Seau à jetons: au plus `rate` acquisitions par seconde, rafales de `burst`"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        # Les attentes sont sérialisées: l'ordre d'arrivée est respecté
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncFetcher:
+    """
+    Client HTTP asynchrone partagé par toutes les requêtes d'un scraping
+    Usage:
+        async with AsyncFetcher(concurrency=8, rate=5) as fetcher:
+            data = await fetcher.get_json(url, params)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 8,
+        rate: float = 5.0,
+        burst: int = 5,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 15.0,
+        verify: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            verify=verify,
+            follow_redirects=True,
+            headers={"User-Agent": DEFAULT_USER_AGENT, **(headers or {})},
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return self._buckets[host]
+
+    def _delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """Attente avant la tentative suivante (Retry-After prioritaire)"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        # Attente exponentielle avec gigue, pour ne pas revenir tous ensemble
+        return self.backoff * (2**attempt) * (0.5 + random.random())
+
+    async def get(self, url: str, params: Optional[dict] = None) -> httpx.Response:
+        """GET avec limites et nouvelles tentatives; lève l'erreur finale"""
+        bucket = self._bucket(url)
+        for attempt in range(self.retries + 1):
+            response = None
+            async with self._semaphore:
+                await bucket.acquire()
+                self.stats["requests"] += 1
+                try:
+                    response = await self._client.get(url, params=params)
+                    if response.status_code not in RETRY_STATUSES:
+                        response.raise_for_status()
+                        return response
+                    error = httpx.HTTPStatusError(
+                        f"HTTP {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                except httpx.TransportError as e:
+                    error = e
+
+            if attempt == self.retries:
+                break
+            self.stats["retries"] += 1
+            await asyncio.sleep(self._delay(attempt, response))
+
+        self.stats["failures"] += 1
+        raise error
+
+    async def get_json(self, url: str, params: Optional[dict] = None):
+        response = await self.get(url, params)
+        return response.json()
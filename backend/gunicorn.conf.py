@@ -0,0 +1,37 @@
+"""
+Configuration gunicorn pour la production
+Lancer: gunicorn main:app -c gunicorn.conf.py
+
+Le maître charge les données une seule fois avant de créer les workers
+(preload): dictionnaire, fréquences et N-grams sont mappés en mémoire
+partagée, les workers y accèdent en lecture seule. Un rechargement
+(/admin/reload ou kill -HUP du maître) reconstruit les données dans le
+maître puis remplace tous les workers.
+"""
+
+import multiprocessing
+import os
+
+# Lu par main.py à l'import (dans le maître, avant le fork)
+os.environ.setdefault("PRELOAD_DATA", "1")
+
+preload_app = True
+
+
+def when_ready(server):
+    # Hérité par les workers: /admin/reload demande le rechargement au maître
+    os.environ["DATA_RELOAD_MASTER_PID"] = str(os.getpid())
+
+
+def on_reload(server):
+    # SIGHUP (/admin/reload): le maître recharge et partage les données, puis
+    # gunicorn crée de nouveaux workers et arrête les anciens après leurs
+    # requêtes en cours
+    import main
+
+    main.reload_shared_data()
+
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
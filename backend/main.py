@@ -4,23 +4,71 @@ Installation: pip install fastapi uvicorn rapidfuzz nltk
 Lancer: uvicorn main:app --reload
 """
 
-from fastapi import FastAPI
+from fastapi import (
+    FastAPI,
+    Header,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from typing import Dict, List, Literal, Optional
 import re
 from rapidfuzz import fuzz, process
-import nltk
+import numpy as np
+import asyncio
+import gc
+import itertools
 import json
 import os
+import signal
+import tempfile
+import time
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import replace
+
+from binary_store import BinaryStore, write_binary_store
+from completion import PrefixTrie
+from data_snapshot import (
+    LinguisticSnapshot,
+    data_files_signature,
+    touch_reload_marker,
+)
+from document_store import DocumentStore, apply_delta
+from memory_report import memory_report
+from morphology import MorphologicalAnalyzer
+from ngram_model import NgramModel
+from phonotactics import PHONOTACTIC_MATCHER
+from ranking import FrequencyRanking
+from resource_loader import ResourceTracker
+from suggestion_cache import SuggestionCache
+from symspell import SymSpellIndex
+from tokenizer import TRAILING_WORD, WORD_CHAR, iter_tokens, tokenize
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Le serveur accepte les connexions immédiatement (données de base);
+    les données complètes et les index sont chargés en arrière-plan
+    (sauf en mode préchargement: déjà chargées par le maître avant le fork)
+    """
+    if PRELOAD_DATA:
+        tasks = [asyncio.create_task(asyncio.to_thread(ensure_nltk_punkt))]
+    else:
+        RESOURCES.reset()
+        tasks = [asyncio.create_task(load_resources())]
+    if DATA_WATCH_SECONDS > 0:
+        tasks.append(asyncio.create_task(watch_data_files(DATA_WATCH_SECONDS)))
+    yield
+    for task in tasks:
+        task.cancel()
 
-# Télécharger les ressources NLTK nécessaires
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
 
-app = FastAPI(title="Malagasy AI Text Editor API")
+app = FastAPI(title="Malagasy AI Text Editor API", lifespan=lifespan)
 
 # Configuration CORS
 app.add_middleware(
@@ -29,14 +77,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Data-Version"],
 )
 
+
+@app.middleware("http")
+async def data_version_header(request: Request, call_next):
+    """Version des données linguistiques servies, sur chaque réponse"""
+    response = await call_next(request)
+    response.headers["X-Data-Version"] = DATA.version_id
+    return response
+
+
 # ============================================================================
 # DONNÉES ET CONFIGURATION
 # ============================================================================
 
-# Combinaisons phonotactiques interdites en malagasy
-INVALID_COMBINATIONS = ["nb", "mk", "dt", "bp", "sz", "nk"]
+# Combinaisons phonotactiques interdites en malagasy: voir phonotactics.py
 
 # Préfixes et suffixes malagasy communs
 PREFIXES = [
@@ -55,12 +112,40 @@ PREFIXES = [
 ]
 SUFFIXES = ["ana", "ina", "na", "ka", "tra"]
 
+# Table de lemmatisation (racines des mots)
+LEMMA_TABLE = {
+    "manosika": "tosika",
+    "nanosika": "tosika",
+    "hanosika": "tosika",
+    "manoratra": "soratra",
+    "nanoratra": "soratra",
+    "hanoratra": "soratra",
+    "mandeha": "deha",
+    "nandeha": "deha",
+    "handeha": "deha",
+    "mihinana": "hina",
+    "nihinana": "hina",
+    "hihinana": "hina",
+    "misotro": "sotro",
+    "nisotro": "sotro",
+    "hisotro": "sotro",
+    "mihira": "hira",
+    "nihira": "hira",
+    "hihira": "hira",
+    "matory": "tory",
+    "natory": "tory",
+    "hatory": "tory",
+    "miasa": "asa",
+    "niasa": "asa",
+    "hiasa": "asa",
+}
+
 # ============================================================================
 # CHARGEMENT DU DICTIONNAIRE
 # ============================================================================
 
 
-def load_dictionary():
+def load_dictionary(include_files: bool = True):
     """
     Charge le dictionnaire depuis les fichiers scrapés ou malagasy_base_data.py
     Priorité: data/malagasy_dictionary.json > malagasy_base_data.py > fallback minimal
@@ -69,7 +154,7 @@ def load_dictionary():
 
     # 1. Essayer de charger depuis le fichier scrapé (priorité)
     try:
-        if os.path.exists(dictionary_file):
+        if include_files and os.path.exists(dictionary_file):
             print(f"Chargement du dictionnaire depuis {dictionary_file}...")
             with open(dictionary_file, "r", encoding="utf-8") as f:
                 loaded_dict = json.load(f)
@@ -130,13 +215,13 @@ def load_dictionary():
     return minimal_dict
 
 
-def load_bigram_model():
+def load_bigram_model(include_files: bool = True):
     """Charge le modèle bigram depuis les fichiers ou malagasy_base_data.py"""
     bigram_file = "data/bigram_model.json"
 
     # 1. Fichier scrapé (priorité)
     try:
-        if os.path.exists(bigram_file):
+        if include_files and os.path.exists(bigram_file):
             print(f"Chargement du modèle N-gram depuis {bigram_file}...")
             with open(bigram_file, "r", encoding="utf-8") as f:
                 loaded_model = json.load(f)
@@ -164,13 +249,13 @@ def load_bigram_model():
     }
 
 
-def load_word_frequencies():
+def load_word_frequencies(include_files: bool = True):
     """Charge les fréquences de mots"""
     freq_file = "data/word_frequencies.json"
 
     # 1. Fichier scrapé
     try:
-        if os.path.exists(freq_file):
+        if include_files and os.path.exists(freq_file):
             print(f"Chargement des fréquences depuis {freq_file}...")
             with open(freq_file, "r", encoding="utf-8") as f:
                 frequencies = json.load(f)
@@ -201,44 +286,484 @@ def load_word_frequencies():
     }
 
 
-# Chargement des données au démarrage
+def load_ngram_model(bigram_model, frequencies, include_files: bool = True):
+    """
+    Charge le modèle N-gram avec comptes (trigrammes, stupid backoff)
+    Fallback: conversion du modèle bigram et des fréquences
+    """
+    ngram_file = "data/ngram_model.json"
+
+    try:
+        if include_files and os.path.exists(ngram_file):
+            print(f"Chargement du modèle N-gram (comptes) depuis {ngram_file}...")
+            with open(ngram_file, "r", encoding="utf-8") as f:
+                model = NgramModel.from_dict(json.load(f))
+                stats = model.stats()
+                print(
+                    f"✓ Modèle N-gram chargé: {stats['bigrams']:,} bigrammes, "
+                    f"{stats['trigrams']:,} trigrammes"
+                )
+                return model
+    except Exception as e:
+        print(f"⚠ Erreur modèle N-gram: {e}")
+
+    return NgramModel.from_bigram_lists(bigram_model, frequencies)
+
+
+def load_binary_store():
+    """
+    Ouvre data/malagasy_data.bin (mmap) s'il existe
+    Les requêtes lisent directement le fichier: pas de désérialisation au démarrage
+    """
+    binary_file = "data/malagasy_data.bin"
+
+    try:
+        if os.path.exists(binary_file):
+            start = time.perf_counter()
+            store = BinaryStore(binary_file, word_index=WORD_INDEX)
+            elapsed = time.perf_counter() - start
+            print(
+                f"✓ Données binaires (mmap) ouvertes: "
+                f"{store.dictionary_count:,} mots, {store.word_count:,} entrées "
+                f"({elapsed * 1000:.1f} ms)"
+            )
+            return store
+    except Exception as e:
+        print(f"⚠ Erreur fichier binaire: {e}")
+
+    return None
+
+
+# COMPACT_DATA=1: données chargées depuis JSON ou malagasy_base_data.py
+# compilées au format binaire (mémoire réduite, prédictions plus lentes).
+# Par défaut: dictionnaires Python, recherches plus rapides
+COMPACT_DATA = os.getenv("COMPACT_DATA", "0") == "1"
+
+# Index mot -> identifiant en mémoire: recherches en O(1) au lieu d'une
+# recherche dichotomique dans la table de chaînes. Désactivé par défaut en
+# préchargement, où les workers partagent toutes les pages des données
+WORD_INDEX = (
+    os.getenv("WORD_INDEX", "0" if os.getenv("PRELOAD_DATA") == "1" else "1") == "1"
+)
+
+# Répertoire des fichiers binaires compilés (mémoire partagée si disponible)
+SHARED_DATA_DIR = os.getenv(
+    "SHARED_DATA_DIR",
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+)
+
+
+def compile_binary_store(dictionary, frequencies, ngram_model):
+    """
+    Compile des données en mémoire au format binaire: un seul vocabulaire
+    (identifiants entiers), fréquences en tableau, N-grams en CSR. Le
+    fichier est supprimé dès qu'il est mappé (le mapping reste valide):
+    rien à nettoyer à l'arrêt
+    """
+    descriptor, path = tempfile.mkstemp(
+        prefix="malagasy_data-", suffix=".bin", dir=SHARED_DATA_DIR
+    )
+    os.close(descriptor)
+    try:
+        write_binary_store(path, dictionary, frequencies, ngram_model)
+        return BinaryStore(path, word_index=WORD_INDEX)
+    finally:
+        os.unlink(path)
+
+
+def build_spell_index(dictionary, frequencies, store=None):
+    """
+    Construit l'index SymSpell (distance 1-2) à partir du dictionnaire
+    (sur les identifiants et les tableaux du fichier binaire s'il est chargé)
+    """
+    start = time.perf_counter()
+    if store is not None:
+        index = SymSpellIndex.from_ids(
+            store.vocabulary, store.sections["frequencies"], store.dictionary_ids()
+        )
+    else:
+        index = SymSpellIndex.build(dictionary, frequencies)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Index orthographique: {len(index):,} clés ({elapsed:.2f}s)")
+    return index
+
+
+# Limite maximale servie par /autocomplete: le trie précalcule une complétion
+# de plus par nœud (le préfixe lui-même est écarté des suggestions)
+AUTOCOMPLETE_MAX_LIMIT = 20
+
+
+def build_completion_trie(dictionary, frequencies, store=None):
+    """Construit le trie de complétion pondéré par les fréquences"""
+    start = time.perf_counter()
+    top_k = AUTOCOMPLETE_MAX_LIMIT + 1
+    if store is not None:
+        trie = PrefixTrie.from_ids(
+            store.vocabulary,
+            store.sections["frequencies"],
+            store.dictionary_ids(),
+            top_k=top_k,
+        )
+    else:
+        trie = PrefixTrie.build(dictionary, frequencies, top_k=top_k)
+    elapsed = time.perf_counter() - start
+    print(f"✓ Trie de complétion: {trie.node_count:,} nœuds ({elapsed:.2f}s)")
+    return trie
+
+
+def build_analyzer(dictionary):
+    """Compile les affixes et la table de lemmatisation (cache vide par version)"""
+    return MorphologicalAnalyzer(dictionary, PREFIXES, SUFFIXES, LEMMA_TABLE)
+
+
+# Numéros de version des instantanés (croissants, y compris entre rechargements)
+SNAPSHOT_VERSIONS = itertools.count(1)
+
+
+def build_linguistic_data(
+    include_files: bool = True, tracker: Optional[ResourceTracker] = None
+) -> LinguisticSnapshot:
+    """
+    Charge les données puis construit les index dérivés (appel bloquant,
+    hors du chemin des requêtes)
+    Priorité: data/malagasy_data.bin > fichiers JSON > malagasy_base_data.py
+    (fichiers JSON et données de base compilés au format binaire, voir COMPACT_DATA)
+    include_files=False: données de base uniquement (démarrage immédiat)
+    """
+
+    def step(name):
+        return tracker.track(name) if tracker is not None else nullcontext({})
+
+    start = time.perf_counter()
+    files_signature = data_files_signature() if include_files else ()
+
+    with step("dictionary") as record:
+        store = load_binary_store() if include_files else None
+        dictionary = store.dictionary if store else load_dictionary(include_files)
+        record["size"] = len(dictionary)
+        record["storage"] = "mmap" if store else "memory"
+
+    with step("bigram_model") as record:
+        bigram_model = (
+            store.bigram_lists() if store else load_bigram_model(include_files)
+        )
+        record["size"] = len(bigram_model)
+
+    with step("word_frequencies") as record:
+        frequencies = (
+            store.frequencies if store else load_word_frequencies(include_files)
+        )
+        record["size"] = len(frequencies)
+
+    with step("ngram_model") as record:
+        ngram_model = (
+            store.ngram_model()
+            if store
+            else load_ngram_model(bigram_model, frequencies, include_files)
+        )
+        record["size"] = len(ngram_model.vocabulary)
+
+    # Vocabulaire unique partagé par tous les modèles: chaque mot n'est stocké
+    # qu'une fois (table de chaînes), les modèles ne contiennent que des
+    # identifiants entiers. Les données JSON ou de base sont compilées ici.
+    with step("vocabulary") as record:
+        if store is None and COMPACT_DATA:
+            try:
+                store = compile_binary_store(dictionary, frequencies, ngram_model)
+                dictionary = store.dictionary
+                bigram_model = store.bigram_lists()
+                frequencies = store.frequencies
+                ngram_model = store.ngram_model()
+            except Exception as e:
+                print(f"⚠ Compilation binaire impossible, données en mémoire: {e}")
+        record["storage"] = "mmap" if store else "memory"
+        record["size"] = store.word_count if store else len(ngram_model.vocabulary)
+
+    # Classement par fréquence, trié une seule fois (pas de tri par requête)
+    with step("frequency_ranking") as record:
+        ranking = (
+            FrequencyRanking.from_ids(
+                store.vocabulary,
+                store.sections["frequencies"],
+                store.ranked_ids(),
+                store.word_ids,
+            )
+            if store
+            else FrequencyRanking(frequencies)
+        )
+        record["size"] = len(ranking)
+
+    with step("spell_index") as record:
+        spell_index = build_spell_index(dictionary, frequencies, store)
+        record["size"] = len(spell_index)
+
+    with step("completion_trie") as record:
+        completion_trie = build_completion_trie(dictionary, frequencies, store)
+        record["size"] = completion_trie.node_count
+
+    with step("morphology") as record:
+        analyzer = build_analyzer(dictionary)
+        record["size"] = len(LEMMA_TABLE)
+
+    return LinguisticSnapshot(
+        version=next(SNAPSHOT_VERSIONS),
+        dictionary=dictionary,
+        bigram_model=bigram_model,
+        frequencies=frequencies,
+        ngram_model=ngram_model,
+        ranking=ranking,
+        spell_index=spell_index,
+        completion_trie=completion_trie,
+        analyzer=analyzer,
+        dictionary_words=sorted(dictionary),
+        binary_store=store,
+        files_signature=files_signature,
+        build_seconds=time.perf_counter() - start,
+    )
+
+
+def install_snapshot(snapshot: LinguisticSnapshot) -> LinguisticSnapshot:
+    """
+    Remplace l'instantané servi (une seule affectation) et invalide le cache
+    des suggestions. Les requêtes en cours terminent sur l'ancien instantané
+    (l'ancien mmap reste valide tant qu'elles le référencent).
+    Retourne l'instantané remplacé
+    """
+    global DATA
+    previous = DATA
+    SUGGESTION_CACHE.set_version(snapshot.version)
+    DATA = snapshot
+    return previous
+
+
+# Ressources chargées en arrière-plan (état exposé par /ready)
+RESOURCES = ResourceTracker(
+    required=[
+        "dictionary",
+        "bigram_model",
+        "word_frequencies",
+        "ngram_model",
+        "vocabulary",
+        "frequency_ranking",
+        "spell_index",
+        "completion_trie",
+        "morphology",
+    ],
+    optional=["nltk_punkt"],
+)
+
+# Attente maximale (secondes) des données complètes par les endpoints qui en
+# dépendent, avant de répondre avec les données de base
+DATA_WAIT_SECONDS = float(os.getenv("DATA_WAIT_SECONDS", "5"))
+
+
+def ensure_nltk_punkt():
+    """Ressource NLTK optionnelle, téléchargée sans bloquer le démarrage"""
+    try:
+        with RESOURCES.track("nltk_punkt") as record:
+            # Import différé: nltk est lent à importer et non requis pour servir
+            import nltk
+
+            try:
+                nltk.data.find("tokenizers/punkt")
+                record["source"] = "local"
+            except LookupError:
+                if not nltk.download("punkt", quiet=True):
+                    raise RuntimeError("téléchargement impossible")
+                record["source"] = "download"
+    except Exception as e:
+        print(f"⚠ NLTK punkt indisponible: {e}")
+
+
+async def load_resources():
+    """Charge les données complètes dans un thread puis les installe"""
+    RESOURCES.start()
+    nltk_task = asyncio.create_task(asyncio.to_thread(ensure_nltk_punkt))
+    try:
+        async with RELOAD_LOCK:
+            snapshot = await asyncio.to_thread(build_linguistic_data, True, RESOURCES)
+            install_snapshot(snapshot)
+        print(
+            f"✓ Données complètes prêtes: {len(snapshot.dictionary):,} mots "
+            f"(version {snapshot.version})"
+        )
+    except Exception as e:
+        print(f"⚠ Chargement échoué, données de base conservées: {e}")
+    finally:
+        RESOURCES.finish()
+    await nltk_task
+
+
+# Un seul rechargement à la fois (démarrage, admin ou surveillance)
+RELOAD_LOCK = asyncio.Lock()
+
+# Dernier rechargement à chaud (exposé par /stats)
+LAST_RELOAD: Dict[str, object] = {}
+
+# Intervalle (secondes) de surveillance de data/ (0 = désactivé)
+DATA_WATCH_SECONDS = float(os.getenv("DATA_WATCH_SECONDS", "0"))
+
+# Jeton exigé par /admin/reload (aucun contrôle s'il n'est pas défini)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+
+def build_reloaded_snapshot() -> LinguisticSnapshot:
+    """Nouvel instantané (partagé via le fichier binaire en préchargement)"""
+    snapshot = build_linguistic_data()
+    return share_snapshot(snapshot) if PRELOAD_DATA else snapshot
+
+
+async def reload_snapshot(trigger: str) -> dict:
+    """
+    Rechargement à chaud de ce worker: le nouvel instantané est construit
+    dans un thread pendant que les requêtes continuent d'être servies, puis
+    installé
+    """
+    async with RELOAD_LOCK:
+        previous = DATA
+        start = time.perf_counter()
+        try:
+            snapshot = await asyncio.to_thread(build_reloaded_snapshot)
+        except Exception as e:
+            record_reload_error(trigger, e)
+            raise
+        install_snapshot(snapshot)
+    return record_reload(trigger, previous, snapshot, start)
+
+
+def reload_shared_data():
+    """
+    Rechargement dans le maître gunicorn (hook on_reload, préchargement):
+    l'instantané est reconstruit et partagé avant le fork des nouveaux
+    workers. En cas d'échec, les nouveaux workers servent l'ancien instantané
+    """
+    previous = DATA
+    start = time.perf_counter()
+    gc.unfreeze()
+    try:
+        snapshot = build_reloaded_snapshot()
+        install_snapshot(snapshot)
+        record_reload("master", previous, snapshot, start)
+    except Exception as e:
+        record_reload_error("master", e)
+        print(f"⚠ Rechargement du maître échoué: {e}")
+    finally:
+        gc.freeze()
+
+
+def record_reload_error(trigger: str, error: Exception):
+    LAST_RELOAD.clear()
+    LAST_RELOAD.update({"trigger": trigger, "error": str(error)})
+
+
+def record_reload(trigger, previous, snapshot, start) -> dict:
+    """Rapport du dernier rechargement (exposé par /stats)"""
+    report = {
+        "trigger": trigger,
+        "previous_version": previous.version,
+        "version": snapshot.version,
+        "version_id": snapshot.version_id,
+        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        "dictionary_size": len(snapshot.dictionary),
+    }
+    LAST_RELOAD.clear()
+    LAST_RELOAD.update(report)
+    print(
+        f"✓ Données rechargées ({trigger}): version {snapshot.version}, "
+        f"{report['dictionary_size']:,} mots ({report['duration_ms']:.0f} ms)"
+    )
+    return report
+
+
+async def watch_data_files(interval: float):
+    """
+    Mode surveillance: recharge quand les fichiers de data/ changent
+    Le rechargement attend que la signature soit stable sur deux relevés
+    (fichiers en cours d'écriture par setup_data.py)
+    """
+    candidate = None
+    while True:
+        await asyncio.sleep(interval)
+        if RESOURCES.finished_at is None:
+            continue
+        signature = await asyncio.to_thread(data_files_signature)
+        if signature == DATA.files_signature:
+            candidate = None
+            continue
+        if signature != candidate:
+            candidate = signature
+            continue
+        candidate = None
+        try:
+            await reload_snapshot("watch")
+        except Exception as e:
+            print(f"⚠ Rechargement automatique échoué: {e}")
+
+
+# Chargement des données de base au démarrage (rapide, sans fichiers data/);
+# les données complètes sont chargées par load_resources() au lancement
 print("\n" + "=" * 70)
 print(" DÉMARRAGE DE L'API ÉDITEUR MALAGASY INTELLIGENT")
 print("=" * 70)
 
-MALAGASY_DICTIONARY = load_dictionary()
-BIGRAM_MODEL = load_bigram_model()
-WORD_FREQUENCIES = load_word_frequencies()
+# Cache LRU des suggestions, partagé entre les requêtes
+SUGGESTION_CACHE = SuggestionCache(
+    max_entries=int(os.getenv("SUGGESTION_CACHE_MAX_ENTRIES", "50000")),
+    max_bytes=int(os.getenv("SUGGESTION_CACHE_MAX_MB", "64")) * 1024 * 1024,
+)
+
+# Documents suivis par /spell-check/incremental
+DOCUMENT_STORE = DocumentStore(
+    ttl=float(os.getenv("DOCUMENT_TTL_SECONDS", "1800")),
+    max_documents=int(os.getenv("DOCUMENT_STORE_MAX", "1000")),
+)
+
+# Mode préchargement (gunicorn --preload, voir gunicorn.conf.py): le maître
+# charge les données complètes avant le fork, les workers les partagent
+PRELOAD_DATA = os.getenv("PRELOAD_DATA", "0") == "1"
+
+
+def share_snapshot(snapshot: LinguisticSnapshot) -> LinguisticSnapshot:
+    """
+    Remplace dictionnaire, fréquences et modèle N-gram par des vues sur un
+    fichier binaire mappé (MAP_SHARED): après le fork, les workers lisent les
+    mêmes pages physiques au lieu de copier des objets Python
+    """
+    if snapshot.binary_store is None:
+        store = compile_binary_store(
+            snapshot.dictionary, snapshot.frequencies, snapshot.ngram_model
+        )
+        snapshot = replace(
+            snapshot,
+            binary_store=store,
+            dictionary=store.dictionary,
+            bigram_model=store.bigram_lists(),
+            frequencies=store.frequencies,
+            ngram_model=store.ngram_model(),
+            analyzer=build_analyzer(store.dictionary),
+        )
+        print(f"✓ Données figées en mémoire partagée ({store.size // 1024} Ko)")
+    return snapshot
+
+
+# Instantané des données servies, remplacé en bloc par install_snapshot()
+if PRELOAD_DATA:
+    RESOURCES.start()
+    DATA = share_snapshot(build_linguistic_data(tracker=RESOURCES))
+    RESOURCES.finish()
+    # Objets du maître exclus du GC: les workers ne réécrivent pas leurs pages
+    gc.freeze()
+else:
+    DATA = build_linguistic_data(include_files=False)
+SUGGESTION_CACHE.set_version(DATA.version)
 
 print("=" * 70 + "\n")
 
-# Table de lemmatisation (racines des mots)
-LEMMA_TABLE = {
-    "manosika": "tosika",
-    "nanosika": "tosika",
-    "hanosika": "tosika",
-    "manoratra": "soratra",
-    "nanoratra": "soratra",
-    "hanoratra": "soratra",
-    "mandeha": "deha",
-    "nandeha": "deha",
-    "handeha": "deha",
-    "mihinana": "hina",
-    "nihinana": "hina",
-    "hihinana": "hina",
-    "misotro": "sotro",
-    "nisotro": "sotro",
-    "hisotro": "sotro",
-    "mihira": "hira",
-    "nihira": "hira",
-    "hihira": "hira",
-    "matory": "tory",
-    "natory": "tory",
-    "hatory": "tory",
-    "miasa": "asa",
-    "niasa": "asa",
-    "hiasa": "asa",
-}
+# Seuil de similarité (fuzz.ratio) pour proposer une suggestion
+SUGGESTION_MIN_SCORE = 70
+
+# Nombre de mots inconnus comparés au dictionnaire par appel à process.cdist
+FUZZY_BATCH_SIZE = 256
 
 # Knowledge Graph (Ontologie sémantique)
 KNOWLEDGE_GRAPH = {
@@ -398,6 +923,21 @@ class TextInput(BaseModel):
     text: str
 
 
+class SpellCheckInput(TextInput):
+    rerank: bool = False
+    stream: bool = False  # Réponse NDJSON au fil de la vérification
+    stream_unit: Literal["token", "paragraph"] = "token"
+    include_text: bool = True  # Renvoyer le texte original (hors streaming)
+
+
+class IncrementalSpellCheckInput(BaseModel):
+    document_id: str
+    text: Optional[str] = None  # Synchronisation complète
+    ops: List[dict] = []  # Delta Quill: retain / insert / delete
+    base_version: Optional[int] = None
+    rerank: bool = False
+
+
 class WordInput(BaseModel):
     word: str
 
@@ -407,6 +947,16 @@ class AutocompleteInput(BaseModel):
     limit: int = 5
 
 
+class WordListInput(BaseModel):
+    words: List[str]
+
+
+class LemmatizeBatchInput(BaseModel):
+    text: Optional[str] = None
+    words: Optional[List[str]] = None  # Alternative à text
+    stream: bool = False  # Réponse NDJSON, un token par ligne
+
+
 class TranslationInput(BaseModel):
     word: str
     source_lang: str = "mg"
@@ -418,47 +968,303 @@ class TranslationInput(BaseModel):
 # ============================================================================
 
 
-def tokenize(text: str) -> List[str]:
-    """Tokenisation pour le malagasy"""
-    text = text.lower()
-    tokens = re.findall(r"\b[a-zàáâèéêìíîòóôùúû-]+\b", text, re.UNICODE)
-    return tokens
+# Tokenisation (tokenize, iter_tokens, TRAILING_WORD): voir tokenizer.py
+
+# Paragraphes: lignes non vides (un paragraphe Quill par ligne)
+PARAGRAPH_PATTERN = re.compile(r"[^\n]+")
+
+
+def iter_paragraphs(text: str):
+    """Génère (début, fin) de chaque paragraphe du texte"""
+    for match in PARAGRAPH_PATTERN.finditer(text):
+        yield match.start(), match.end()
+
+
+def ndjson_response(items) -> StreamingResponse:
+    """Réponse NDJSON: une ligne JSON par élément, produite à la demande"""
+    lines = (json.dumps(item, ensure_ascii=False) + "\n" for item in items)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
 
 
 def contains_invalid_combination(word: str) -> bool:
     """Vérifier les combinaisons phonotactiques invalides"""
-    word = word.lower()
-    for combo in INVALID_COMBINATIONS:
-        if combo in word:
-            if combo == "nk" and word.index(combo) > 0:
-                continue
-            return True
-    return False
+    return PHONOTACTIC_MATCHER.has_violation(word.lower())
+
+
+def fuzzy_suggestions_batch(
+    words: List[str], snapshot: LinguisticSnapshot, limit: int = 5
+) -> Dict[str, List[dict]]:
+    """
+    Suggestions rapidfuzz vectorisées: une seule matrice process.cdist
+    (mots inconnus x dictionnaire) calculée sur tous les coeurs
+    """
+    suggestions = {}
+    for start in range(0, len(words), FUZZY_BATCH_SIZE):
+        batch = words[start : start + FUZZY_BATCH_SIZE]
+        scores = process.cdist(
+            batch,
+            snapshot.dictionary_words,
+            scorer=fuzz.ratio,
+            score_cutoff=SUGGESTION_MIN_SCORE,
+            workers=-1,
+        )
+        for word, row in zip(batch, scores):
+            # Sélection des limit meilleurs en O(V), seul ce sous-ensemble est trié
+            if limit < len(row):
+                top = np.argpartition(-row, limit)[:limit]
+            else:
+                top = np.arange(len(row))
+            top = top[np.argsort(-row[top], kind="stable")]
+            suggestions[word] = [
+                {"word": snapshot.dictionary_words[i], "score": float(row[i])}
+                for i in top
+                if row[i] > SUGGESTION_MIN_SCORE
+            ]
+    return suggestions
+
+
+def check_unique_tokens(
+    tokens: List[str], snapshot: LinguisticSnapshot, rerank: bool = False
+) -> Dict[str, dict]:
+    """
+    Vérification orthographique d'un ensemble de tokens uniques
+    - Mots connus: aucun calcul
+    - Mots inconnus: index SymSpell, puis un seul lot process.cdist
+      pour ceux que l'index ne couvre pas (distance > 2)
+    """
+    checked = {}
+    unresolved = []
+    namespace = "spell-rerank" if rerank else "spell"
+
+    for token in tokens:
+        if token in snapshot.dictionary:
+            checked[token] = {"word": token, "is_correct": True, "suggestions": []}
+            continue
+
+        cached = SUGGESTION_CACHE.get(namespace, token, version=snapshot.version)
+        if cached is not None:
+            checked[token] = cached
+            continue
+
+        # Suggestions via l'index SymSpell (re-classement rapidfuzz optionnel)
+        suggestions = [
+            {"word": word, "score": score}
+            for word, score, _ in snapshot.spell_index.lookup(
+                token, limit=5, rerank=rerank
+            )
+            if score > SUGGESTION_MIN_SCORE
+        ]
+
+        checked[token] = {
+            "word": token,
+            "is_correct": False,
+            "has_invalid_combination": contains_invalid_combination(token),
+            "suggestions": suggestions,
+        }
+        if suggestions:
+            SUGGESTION_CACHE.put(namespace, token, checked[token], snapshot.version)
+        else:
+            unresolved.append(token)
 
+    for token, suggestions in fuzzy_suggestions_batch(unresolved, snapshot).items():
+        checked[token]["suggestions"] = suggestions
+        SUGGESTION_CACHE.put(namespace, token, checked[token], snapshot.version)
 
-def find_root(word: str) -> Optional[str]:
-    """Lemmatisation: trouver la racine d'un mot"""
-    word = word.lower()
+    return checked
 
-    # Table de lemmatisation
-    if word in LEMMA_TABLE:
-        return LEMMA_TABLE[word]
 
-    # Heuristique: retirer préfixes
-    for prefix in PREFIXES:
-        if word.startswith(prefix) and len(word) > len(prefix) + 2:
-            candidate = word[len(prefix) :]
-            if candidate in MALAGASY_DICTIONARY:
-                return candidate
+def iter_spell_check(
+    text: str, snapshot: LinguisticSnapshot, rerank: bool = False, unit: str = "token"
+):
+    """
+    Vérification au fil du texte, paragraphe par paragraphe (mode streaming)
+    Génère un objet par token (unit="token") ou par paragraphe, avec les
+    positions dans le texte, puis un résumé. Seules les formes jamais vues
+    sont vérifiées: la mémoire dépend du vocabulaire, pas de la taille du texte
+    """
+    checked: Dict[str, dict] = {}
+    total_words = errors_found = 0
+
+    for start, end in iter_paragraphs(text):
+        tokens = list(iter_tokens(text, start, end))
+        if not tokens:
+            continue
+        unseen = [t for t in dict.fromkeys(t for t, _, _ in tokens) if t not in checked]
+        checked.update(check_unique_tokens(unseen, snapshot, rerank))
+
+        results = [
+            {**checked[token], "start": token_start, "end": token_end}
+            for token, token_start, token_end in tokens
+        ]
+        total_words += len(results)
+        errors_found += sum(1 for r in results if not r["is_correct"])
+
+        if unit == "paragraph":
+            yield {"type": "paragraph", "start": start, "end": end, "results": results}
+        else:
+            for result in results:
+                yield {"type": "token", **result}
+
+    yield {
+        "type": "summary",
+        "total_words": total_words,
+        "errors_found": errors_found,
+        "unique_words": len(checked),
+    }
 
-    # Heuristique: retirer suffixes
-    for suffix in SUFFIXES:
-        if word.endswith(suffix) and len(word) > len(suffix) + 2:
-            candidate = word[: -len(suffix)]
-            if candidate in MALAGASY_DICTIONARY:
-                return candidate
 
-    return word if word in MALAGASY_DICTIONARY else None
+def normalize_word(word: str) -> str:
+    """Normalisation commune à toutes les analyses d'un mot"""
+    return word.strip().lower()
+
+
+def iter_lemmas(input_data, snapshot: LinguisticSnapshot, roots: Dict[str, dict]):
+    """
+    Racine de chaque token d'un texte (avec positions) ou de chaque mot d'une
+    liste (avec son indice). Chaque forme n'est analysée qu'une fois: roots
+    sert de mémo et compte les formes uniques
+    """
+    if input_data.text is not None:
+        tokens = (
+            (token, {"start": start, "end": end})
+            for token, start, end in iter_tokens(input_data.text)
+        )
+    else:
+        tokens = (
+            (normalize_word(word), {"index": index})
+            for index, word in enumerate(input_data.words)
+        )
+
+    for token, position in tokens:
+        lemma = roots.get(token)
+        if lemma is None:
+            analyses = snapshot.analyzer.analyze(token)
+            best = analyses[0] if analyses else None
+            lemma = roots[token] = {
+                "root": best.root if best else None,
+                "tense": best.tense if best else None,
+            }
+        yield {"word": token, **lemma, **position}
+
+
+def lemma_analysis(word: str, original: str, snapshot: LinguisticSnapshot) -> dict:
+    """Lemme et affixes détectés d'un mot normalisé"""
+    analyzer = snapshot.analyzer
+    analyses = analyzer.analyze(word)
+    root = analyses[0].root if analyses else None
+
+    return {
+        "original": original,
+        "root": root,
+        "prefixes": [prefix for prefix, _ in analyzer.prefixes_of(word)],
+        "suffixes": analyzer.suffixes_of(word),
+        "tense": analyses[0].tense if analyses else None,
+        "segmentations": [a._asdict() for a in analyses],
+        "is_in_dictionary": root in snapshot.dictionary if root else False,
+    }
+
+
+def knowledge_graph_analysis(word: str, original: str) -> dict:
+    """Relations sémantiques d'un mot normalisé"""
+    if word in KNOWLEDGE_GRAPH:
+        related = KNOWLEDGE_GRAPH[word]
+
+        # Relations de second niveau
+        second_level = []
+        for related_word in related[:3]:
+            if related_word in KNOWLEDGE_GRAPH:
+                second_level.extend(KNOWLEDGE_GRAPH[related_word][:2])
+
+        return {
+            "word": original,
+            "found": True,
+            "direct_relations": related,
+            "second_level_relations": list(set(second_level)),
+            "semantic_field": (
+                "culture" if word in ["razana", "famadihana", "kabary"] else "general"
+            ),
+        }
+    else:
+        similar = SUGGESTION_CACHE.get_or_compute(
+            "knowledge-graph",
+            word,
+            lambda: process.extract(word, KNOWLEDGE_GRAPH.keys(), limit=3),
+        )
+        return {
+            "word": original,
+            "found": False,
+            "similar_concepts": [s[0] for s in similar if s[1] > 70],
+        }
+
+
+def phonotactic_analysis(word: str, original: str) -> dict:
+    """Validation phonotactique d'un mot normalisé (toutes les occurrences)"""
+    invalid_found = [
+        {"combination": combination, "position": position}
+        for combination, position in PHONOTACTIC_MATCHER.violations(word)
+    ]
+    has_invalid = bool(invalid_found)
+
+    return {
+        "word": original,
+        "is_valid": not has_invalid,
+        "invalid_combinations": invalid_found,
+        "message": (
+            "Règles phonotactiques respectées"
+            if not has_invalid
+            else "Combinaisons invalides détectées"
+        ),
+    }
+
+
+def translation_analysis(
+    word: str, original: str, source_lang: str = "mg", target_lang: str = "fr"
+) -> dict:
+    """Traduction d'un mot normalisé"""
+    if source_lang == "mg" and target_lang == "fr":
+        translation = MG_TO_FR.get(word)
+
+        if not translation:
+            similar = SUGGESTION_CACHE.get_or_compute(
+                "translate", word, lambda: process.extractOne(word, MG_TO_FR.keys())
+            )
+            return {
+                "word": original,
+                "translation": None,
+                "found": False,
+                "suggestion": (
+                    {
+                        "word": similar[0],
+                        "translation": MG_TO_FR[similar[0]],
+                        "similarity": similar[1],
+                    }
+                    if similar and similar[1] > 70
+                    else None
+                ),
+            }
+
+        return {
+            "word": original,
+            "translation": translation,
+            "found": True,
+            "source_lang": "mg",
+            "target_lang": "fr",
+        }
+
+    return {"error": "Direction de traduction non supportée"}
+
+
+def word_analysis(original: str, snapshot: LinguisticSnapshot) -> dict:
+    """Analyse complète d'un mot, normalisé une seule fois"""
+    word = normalize_word(original)
+    return {
+        "word": original,
+        "normalized": word,
+        "lemma": lemma_analysis(word, original, snapshot),
+        "knowledge_graph": knowledge_graph_analysis(word, original),
+        "translation": translation_analysis(word, original),
+        "phonotactics": phonotactic_analysis(word, original),
+    }
 
 
 # ============================================================================
@@ -472,109 +1278,247 @@ async def root():
         "message": "API Éditeur Malagasy Intelligent",
         "version": "2.0.0",
         "status": "online",
-        "dictionary_size": len(MALAGASY_DICTIONARY),
+        "dictionary_size": len(DATA.dictionary),
+        "data_version": DATA.version_id,
         "endpoints": {
             "spell_check": "/spell-check",
+            "spell_check_incremental": "/spell-check/incremental",
             "autocomplete": "/autocomplete",
             "lemmatize": "/lemmatize",
+            "lemmatize_batch": "/lemmatize/batch",
             "sentiment": "/sentiment",
             "knowledge_graph": "/knowledge-graph",
             "phonotactics": "/validate-phonotactics",
+            "phonotactics_text": "/validate-phonotactics/text",
             "translate": "/translate",
+            "analyze_word": "/analyze-word",
             "stats": "/stats",
+            "health": "/health",
+            "ready": "/ready",
+            "admin_reload": "/admin/reload",
+            "live": "/ws (WebSocket)",
         },
     }
 
 
 @app.post("/spell-check")
-async def spell_check(input_data: TextInput):
+async def spell_check(input_data: SpellCheckInput):
     """
     Correcteur orthographique avec:
     - Dictionnaire malagasy enrichi
-    - Distance de Levenshtein
+    - Index SymSpell (distance de Levenshtein 1-2)
     - Validation phonotactique
     """
-    tokens = tokenize(input_data.text)
-    results = []
-
-    for token in tokens:
-        token_lower = token.lower()
+    await RESOURCES.wait(DATA_WAIT_SECONDS)
+    snapshot = DATA
+    if input_data.stream:
+        return ndjson_response(
+            iter_spell_check(
+                input_data.text, snapshot, input_data.rerank, input_data.stream_unit
+            )
+        )
+    tokens = list(iter_tokens(input_data.text))
+
+    # Chaque forme unique n'est vérifiée qu'une fois, puis redistribuée
+    # dans l'ordre du document, avec sa position dans le texte
+    unique_tokens = list(dict.fromkeys(token for token, _, _ in tokens))
+    checked = check_unique_tokens(unique_tokens, snapshot, input_data.rerank)
+    results = [
+        {**checked[token], "start": start, "end": end} for token, start, end in tokens
+    ]
+
+    response = {
+        "original_text": input_data.text,
+        "results": results,
+        "total_words": len(tokens),
+        "errors_found": sum(1 for r in results if not r["is_correct"]),
+    }
+    if not input_data.include_text:
+        del response["original_text"]
+    return response
 
-        if token_lower in MALAGASY_DICTIONARY:
-            results.append({"word": token, "is_correct": True, "suggestions": []})
-        else:
-            has_invalid = contains_invalid_combination(token_lower)
 
-            # Suggestions avec rapidfuzz
-            suggestions = process.extract(
-                token_lower, MALAGASY_DICTIONARY, scorer=fuzz.ratio, limit=5
+@app.post("/spell-check/incremental")
+async def spell_check_incremental(input_data: IncrementalSpellCheckInput):
+    """
+    Vérification incrémentale: seule la zone modifiée est re-vérifiée
+    - text: synchronisation complète (premier appel ou après resync)
+    - ops: delta Quill appliqué au texte gardé côté serveur
+    Les résultats portent les positions des tokens; token_range indique les
+    indices [start, end) des tokens remplacés dans la liste du client.
+    """
+    await RESOURCES.wait(DATA_WAIT_SECONDS)
+    snapshot = DATA
+    document_id = input_data.document_id
+    document = DOCUMENT_STORE.get(document_id)
+
+    if input_data.text is not None:
+        document = DOCUMENT_STORE.create(document_id, input_data.text)
+        document.dictionary_version = snapshot.version
+        lo = hi = shift = 0
+        window_start, window_end = 0, len(document.text)
+    else:
+        # Un changement de dictionnaire invalide les corrections mémorisées
+        if (
+            document is None
+            or document.dictionary_version != snapshot.version
+            or (
+                input_data.base_version is not None
+                and input_data.base_version != document.version
             )
+        ):
+            return {"document_id": document_id, "resync": True}
 
-            filtered_suggestions = [
-                {"word": sug[0], "score": sug[1]} for sug in suggestions if sug[1] > 70
-            ]
-
-            results.append(
-                {
-                    "word": token,
-                    "is_correct": False,
-                    "has_invalid_combination": has_invalid,
-                    "suggestions": filtered_suggestions,
-                }
+        try:
+            new_text, change_start, old_end, new_end = apply_delta(
+                document.text, input_data.ops
             )
+        except ValueError:
+            DOCUMENT_STORE.discard(document_id)
+            return {"document_id": document_id, "resync": True}
+
+        # La zone est étendue jusqu'aux séparateurs: les tokens qui la touchent
+        # (y compris via un trait d'union ou un chiffre) sont re-tokenisés en entier
+        old_text = document.text
+        while change_start > 0 and WORD_CHAR.match(old_text[change_start - 1]):
+            change_start -= 1
+        while old_end < len(old_text) and WORD_CHAR.match(old_text[old_end]):
+            old_end += 1
+            new_end += 1
+
+        shift = new_end - old_end
+        lo, hi = document.affected_span(change_start, old_end)
+        window_start = (
+            min(change_start, int(document.starts[lo])) if hi > lo else change_start
+        )
+        window_end = max(old_end, int(document.ends[hi - 1])) if hi > lo else old_end
+        window_end += shift
+        document.text = new_text
+
+    tokens = list(iter_tokens(document.text, window_start, window_end))
+    checked = check_unique_tokens(
+        list(dict.fromkeys(token for token, _, _ in tokens)),
+        snapshot,
+        input_data.rerank,
+    )
+    document.replace_tokens(
+        lo, hi, tokens, [checked[token]["is_correct"] for token, _, _ in tokens], shift
+    )
+    document.version += 1
 
     return {
-        "original_text": input_data.text,
-        "results": results,
-        "total_words": len(tokens),
-        "errors_found": sum(1 for r in results if not r["is_correct"]),
+        "document_id": document_id,
+        "version": document.version,
+        "resync": False,
+        "full_sync": input_data.text is not None,
+        "token_range": {"start": lo, "end": hi},
+        "shift": shift,
+        "results": [
+            {**checked[token], "start": start, "end": end}
+            for token, start, end in tokens
+        ],
+        "total_words": len(document),
+        "errors_found": document.errors,
     }
 
 
 @app.post("/autocomplete")
 async def autocomplete(input_data: AutocompleteInput):
-    """Autocomplétion basée sur N-grams"""
+    """
+    Autocomplétion basée sur N-grams (trigrammes, stupid backoff)
+    - Contexte terminé par un mot partiel ("ny mand", "ny aman-"): complétion
+      du mot, trait d'union final compris, classée par le modèle N-gram puis
+      complétée par le trie
+    - Contexte terminé par un espace: prédiction du mot suivant à partir
+      des deux derniers mots, avec repli bigram puis unigramme
+    """
+    await RESOURCES.wait(DATA_WAIT_SECONDS)
+    snapshot = DATA
+    limit = max(0, min(input_data.limit, AUTOCOMPLETE_MAX_LIMIT))
     tokens = tokenize(input_data.context)
 
     if not tokens:
         # Retourner les mots les plus fréquents
-        top_words = sorted(WORD_FREQUENCIES.items(), key=lambda x: x[1], reverse=True)
-        return {"suggestions": [w[0] for w in top_words[: input_data.limit]]}
+        return {"suggestions": snapshot.ranking.top(limit)}
+
+    context = input_data.context
+    partial = TRAILING_WORD.search(context)
+    if partial:
+        prefix = partial.group().lower()
+        previous_words = tokenize(context[: partial.start()])
+
+        scored = snapshot.ngram_model.predict(previous_words, limit, prefix=prefix)
+        known = {word for word, _ in scored}
+        for word in snapshot.completion_trie.complete(prefix, limit + 1):
+            if word != prefix and word not in known:
+                scored.append(
+                    (word, snapshot.ngram_model.score_word(word, previous_words))
+                )
+                known.add(word)
+        scored = scored[:limit]
 
-    last_word = tokens[-1].lower()
+        return {
+            "context": context,
+            "mode": "completion",
+            "prefix": prefix,
+            "last_word": previous_words[-1] if previous_words else None,
+            "suggestions": [word for word, _ in scored],
+            "scores": [{"word": w, "score": round(sc, 6)} for w, sc in scored],
+        }
 
-    # Bigram model
-    suggestions = []
-    if last_word in BIGRAM_MODEL:
-        suggestions = BIGRAM_MODEL[last_word][: input_data.limit]
+    last_word = tokens[-1]
+    scored = snapshot.ngram_model.predict(tokens, limit)
 
     # Fallback: mots fréquents
-    if not suggestions:
-        top_words = sorted(WORD_FREQUENCIES.items(), key=lambda x: x[1], reverse=True)
-        suggestions = [w[0] for w in top_words[: input_data.limit]]
+    if not scored:
+        scored = [(word, 0.0) for word in snapshot.ranking.top(limit)]
 
     return {
-        "context": input_data.context,
+        "context": context,
+        "mode": "next_word",
         "last_word": last_word,
-        "suggestions": suggestions,
+        "suggestions": [word for word, _ in scored],
+        "scores": [{"word": w, "score": round(sc, 6)} for w, sc in scored],
     }
 
 
 @app.post("/lemmatize")
 async def lemmatize(input_data: WordInput):
     """Lemmatisation malagasy"""
-    word = input_data.word.lower()
-    root = find_root(word)
+    await RESOURCES.wait(DATA_WAIT_SECONDS)
+    return lemma_analysis(normalize_word(input_data.word), input_data.word, DATA)
 
-    detected_prefixes = [p for p in PREFIXES if word.startswith(p)]
-    detected_suffixes = [s for s in SUFFIXES if word.endswith(s)]
 
+@app.post("/lemmatize/batch")
+async def lemmatize_batch(input_data: LemmatizeBatchInput):
+    """
+    Lemmatisation d'un texte entier ou d'une liste de mots
+    Chaque forme unique est analysée une fois; stream=true renvoie une ligne
+    NDJSON par token (puis une ligne de résumé) au fil de l'analyse
+    """
+    if input_data.text is None and input_data.words is None:
+        raise HTTPException(status_code=422, detail="Champ 'text' ou 'words' requis")
+    await RESOURCES.wait(DATA_WAIT_SECONDS)
+    snapshot = DATA
+    roots: Dict[str, dict] = {}
+    lemmas = iter_lemmas(input_data, snapshot, roots)
+
+    if input_data.stream:
+
+        def with_summary():
+            total = 0
+            for lemma in lemmas:
+                total += 1
+                yield lemma
+            yield {"done": True, "total_words": total, "unique_words": len(roots)}
+
+        return ndjson_response(with_summary())
+
+    results = list(lemmas)
     return {
-        "original": input_data.word,
-        "root": root,
-        "prefixes": detected_prefixes,
-        "suffixes": detected_suffixes,
-        "is_in_dictionary": root in MALAGASY_DICTIONARY if root else False,
+        "lemmas": results,
+        "total_words": len(results),
+        "unique_words": len(roots),
     }
 
 
@@ -617,111 +1561,179 @@ async def sentiment_analysis(input_data: TextInput):
 @app.post("/knowledge-graph")
 async def knowledge_graph_explore(input_data: WordInput):
     """Explorateur sémantique (Knowledge Graph)"""
-    word = input_data.word.lower()
-
-    if word in KNOWLEDGE_GRAPH:
-        related = KNOWLEDGE_GRAPH[word]
-
-        # Relations de second niveau
-        second_level = []
-        for related_word in related[:3]:
-            if related_word in KNOWLEDGE_GRAPH:
-                second_level.extend(KNOWLEDGE_GRAPH[related_word][:2])
-
-        return {
-            "word": input_data.word,
-            "found": True,
-            "direct_relations": related,
-            "second_level_relations": list(set(second_level)),
-            "semantic_field": (
-                "culture" if word in ["razana", "famadihana", "kabary"] else "general"
-            ),
-        }
-    else:
-        similar = process.extract(word, KNOWLEDGE_GRAPH.keys(), limit=3)
-        return {
-            "word": input_data.word,
-            "found": False,
-            "similar_concepts": [s[0] for s in similar if s[1] > 70],
-        }
+    return knowledge_graph_analysis(normalize_word(input_data.word), input_data.word)
 
 
 @app.post("/validate-phonotactics")
 async def validate_phonotactics(input_data: WordInput):
     """Validation phonotactique"""
-    word = input_data.word.lower()
-    has_invalid = contains_invalid_combination(word)
-
-    invalid_found = []
-    for combo in INVALID_COMBINATIONS:
-        if combo in word:
-            pos = word.index(combo)
-            if combo == "nk" and pos > 0:
-                continue
-            invalid_found.append({"combination": combo, "position": pos})
+    return phonotactic_analysis(normalize_word(input_data.word), input_data.word)
+
+
+@app.post("/validate-phonotactics/text")
+async def validate_phonotactics_text(input_data: TextInput):
+    """
+    Validation phonotactique de tous les tokens d'un document en un seul
+    passage sur le texte; seuls les tokens invalides sont retournés
+    """
+    tokens = list(iter_tokens(input_data.text))
+    found = PHONOTACTIC_MATCHER.scan(
+        input_data.text, [(start, end) for _, start, end in tokens]
+    )
+
+    invalid_tokens = []
+    for index in sorted(found):
+        word, start, end = tokens[index]
+        invalid_tokens.append(
+            {
+                "word": word,
+                "start": start,
+                "end": end,
+                "invalid_combinations": [
+                    {"combination": c, "position": p, "offset": start + p}
+                    for c, p in found[index]
+                ],
+            }
+        )
 
     return {
-        "word": input_data.word,
-        "is_valid": not has_invalid,
-        "invalid_combinations": invalid_found,
-        "message": (
-            "Règles phonotactiques respectées"
-            if not has_invalid
-            else "Combinaisons invalides détectées"
-        ),
+        "total_words": len(tokens),
+        "invalid_words": len(invalid_tokens),
+        "is_valid": not invalid_tokens,
+        "results": invalid_tokens,
     }
 
 
 @app.post("/translate")
 async def translate_word(input_data: TranslationInput):
     """Traduction mot-à-mot MG <-> FR"""
-    word = input_data.word.lower()
+    return translation_analysis(
+        normalize_word(input_data.word),
+        input_data.word,
+        input_data.source_lang,
+        input_data.target_lang,
+    )
 
-    if input_data.source_lang == "mg" and input_data.target_lang == "fr":
-        translation = MG_TO_FR.get(word)
 
-        if not translation:
-            similar = process.extractOne(word, MG_TO_FR.keys())
-            return {
-                "word": input_data.word,
-                "translation": None,
-                "found": False,
-                "suggestion": (
-                    {
-                        "word": similar[0],
-                        "translation": MG_TO_FR[similar[0]],
-                        "similarity": similar[1],
-                    }
-                    if similar and similar[1] > 70
-                    else None
-                ),
-            }
+@app.post("/analyze-word")
+async def analyze_word(input_data: WordInput):
+    """
+    Analyse complète d'un mot en une seule requête:
+    lemme, graphe de connaissances, traduction et phonotactique
+    """
+    await RESOURCES.wait(DATA_WAIT_SECONDS)
+    return word_analysis(input_data.word, DATA)
 
-        return {
-            "word": input_data.word,
-            "translation": translation,
-            "found": True,
-            "source_lang": "mg",
-            "target_lang": "fr",
-        }
 
-    return {"error": "Direction de traduction non supportée"}
+@app.post("/analyze-word/batch")
+async def analyze_words(input_data: WordListInput):
+    """Analyse complète d'une liste de mots (chaque forme unique analysée une fois)"""
+    await RESOURCES.wait(DATA_WAIT_SECONDS)
+    snapshot = DATA
+    analyses = {}
+    for original in input_data.words:
+        word = normalize_word(original)
+        if word not in analyses:
+            analyses[word] = word_analysis(original, snapshot)
+
+    return {
+        "results": [analyses[normalize_word(w)] for w in input_data.words],
+        "total_words": len(input_data.words),
+        "unique_words": len(analyses),
+    }
+
+
+@app.get("/health")
+async def health():
+    """Vivacité: répond dès que le serveur accepte des connexions"""
+    return {"status": "ok"}
+
+
+@app.get("/ready")
+async def readiness():
+    """
+    Disponibilité des données: état, durée et taille de chaque ressource
+    503 tant que les données complètes ne sont pas chargées (données de base
+    servies)
+    """
+    report = RESOURCES.report()
+    report["dictionary_version"] = DATA.version
+    report["data_version"] = DATA.version_id
+    report["dictionary_size"] = len(DATA.dictionary)
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+@app.post("/admin/reload")
+async def admin_reload(x_admin_token: Optional[str] = Header(None)):
+    """
+    Rechargement à chaud des données de data/ (après setup_data.py --force)
+    sans interrompre les requêtes en cours, dans tous les workers:
+    - préchargement (gunicorn.conf.py): le maître recharge et partage les
+      données puis remplace les workers (202, rechargement en cours)
+    - sinon: ce worker recharge (rapport de ce worker, "scope": "worker");
+      le marqueur data/.reload change la signature surveillée, les autres
+      workers ne rechargent que si la surveillance est active
+      (DATA_WATCH_SECONDS > 0, "other_workers": "watch")
+    """
+    if ADMIN_TOKEN and x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Jeton d'administration invalide")
+
+    master_pid = os.getenv("DATA_RELOAD_MASTER_PID")
+    if PRELOAD_DATA and master_pid:
+        os.kill(int(master_pid), signal.SIGHUP)
+        return JSONResponse(
+            {
+                "status": "scheduled",
+                "scope": "all_workers",
+                "master_pid": int(master_pid),
+                "previous_version": DATA.version,
+            },
+            status_code=202,
+        )
+
+    try:
+        await asyncio.to_thread(touch_reload_marker)
+        report = await reload_snapshot("admin")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Rechargement échoué: {e}")
+    report.update(
+        {
+            "scope": "worker",
+            "pid": os.getpid(),
+            "other_workers": "watch" if DATA_WATCH_SECONDS > 0 else "not_notified",
+        }
+    )
+    return report
 
 
 @app.get("/stats")
 async def get_statistics():
     """Statistiques du système"""
-    dict_size = len(MALAGASY_DICTIONARY)
+    snapshot = DATA
+    dict_size = len(snapshot.dictionary)
     data_source = (
         "scraped" if dict_size > 500 else "base" if dict_size > 100 else "minimal"
     )
 
     return {
         "dictionary_size": dict_size,
-        "bigram_entries": len(BIGRAM_MODEL),
-        "word_frequencies_loaded": len(WORD_FREQUENCIES),
+        "bigram_entries": len(snapshot.bigram_model),
+        "ngram_model": snapshot.ngram_model.stats(),
+        "spell_index_keys": len(snapshot.spell_index),
+        "completion_trie_nodes": snapshot.completion_trie.node_count,
+        "dictionary_version": snapshot.version,
+        "data_snapshot": snapshot.describe(),
+        "last_reload": LAST_RELOAD or None,
+        "loading_status": RESOURCES.status,
+        "data_storage": "mmap" if snapshot.binary_store is not None else "memory",
+        "suggestion_cache": SUGGESTION_CACHE.stats(),
+        "tracked_documents": DOCUMENT_STORE.stats(),
+        "preload": PRELOAD_DATA,
+        "memory": memory_report(include_workers=PRELOAD_DATA),
+        "word_frequencies_loaded": len(snapshot.frequencies),
         "knowledge_graph_nodes": len(KNOWLEDGE_GRAPH),
         "lemma_rules": len(LEMMA_TABLE),
+        "morphology_cache": snapshot.analyzer.cache_info(),
         "prefixes": len(PREFIXES),
         "suffixes": len(SUFFIXES),
         "positive_words": len(POSITIVE_WORDS),
@@ -748,6 +1760,133 @@ async def get_statistics():
     }
 
 
+# ============================================================================
+# WEBSOCKET (ANALYSE EN DIRECT)
+# ============================================================================
+
+
+async def live_word_analysis(input_data: WordInput):
+    """Analyse complète d'un mot sélectionné (voir /analyze-word)"""
+    return word_analysis(input_data.word, DATA)
+
+
+async def live_spell_check(input_data: SpellCheckInput):
+    """Vérification orthographique (voir /spell-check), toujours en un seul message"""
+    return await spell_check(input_data.model_copy(update={"stream": False}))
+
+
+# Type de message -> (modèle d'entrée, traitement)
+LIVE_HANDLERS = {
+    "spell_check": (SpellCheckInput, live_spell_check),
+    "autocomplete": (AutocompleteInput, autocomplete),
+    "sentiment": (TextInput, sentiment_analysis),
+    "word_analysis": (WordInput, live_word_analysis),
+}
+
+
+@app.websocket("/ws")
+async def live_channel(websocket: WebSocket):
+    """
+    Canal persistant multiplexant les analyses de l'éditeur
+    Message: {"id": 1, "type": "spell_check", "payload": {"text": "..."}}
+    Réponse: {"id": 1, "type": "spell_check", "status": "ok", "data": {...}}
+
+    Coalescence: si plusieurs messages du même type arrivent avant d'être
+    traités, seul le plus récent l'est; les autres reçoivent "superseded".
+    """
+    await websocket.accept()
+
+    pending = {}
+    wakeup = asyncio.Event()
+    send_lock = asyncio.Lock()
+
+    async def send(message):
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def reject(message_id, message_type, error):
+        await send(
+            {"id": message_id, "type": message_type, "status": "error", "error": error}
+        )
+
+    async def receive_messages():
+        while True:
+            # Un message invalide reçoit une erreur, la connexion reste ouverte
+            try:
+                message = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError as e:
+                await reject(None, None, f"JSON invalide: {e}")
+                continue
+            if not isinstance(message, dict):
+                await reject(None, None, "Le message doit être un objet JSON")
+                continue
+
+            message_type = message.get("type")
+            if not isinstance(message_type, str) or message_type not in LIVE_HANDLERS:
+                await reject(
+                    message.get("id"),
+                    message_type,
+                    f"Type de message inconnu: {message_type}",
+                )
+                continue
+            if not isinstance(message.get("payload", {}), dict):
+                await reject(
+                    message.get("id"), message_type, "payload doit être un objet"
+                )
+                continue
+
+            superseded = pending.pop(message_type, None)
+            if superseded is not None:
+                await send(
+                    {
+                        "id": superseded.get("id"),
+                        "type": message_type,
+                        "status": "superseded",
+                    }
+                )
+            pending[message_type] = message
+            wakeup.set()
+
+    async def process_messages():
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            while pending:
+                message_type = next(iter(pending))
+                message = pending.pop(message_type)
+                input_model, handler = LIVE_HANDLERS[message_type]
+                response = {"id": message.get("id"), "type": message_type}
+                try:
+                    data = await handler(input_model(**message.get("payload", {})))
+                    response.update({"status": "ok", "data": data})
+                except ValidationError as e:
+                    response.update({"status": "error", "error": json.loads(e.json())})
+                except HTTPException as e:
+                    response.update({"status": "error", "error": e.detail})
+                except Exception as e:
+                    # Une erreur de traitement ne ferme pas le canal du client
+                    print(f"⚠ Canal /ws, message {message_type}: {e!r}")
+                    response.update({"status": "error", "error": str(e)})
+                await send(response)
+                # Laisser la réception avancer entre deux traitements
+                await asyncio.sleep(0)
+
+    receiver = asyncio.create_task(receive_messages())
+    processor = asyncio.create_task(process_messages())
+    try:
+        done, _ = await asyncio.wait(
+            {receiver, processor}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+            if task.exception() and not isinstance(
+                task.exception(), WebSocketDisconnect
+            ):
+                raise task.exception()
+    finally:
+        receiver.cancel()
+        processor.cancel()
+
+
 # ============================================================================
 # LANCEMENT
 # ============================================================================
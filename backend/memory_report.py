@@ -0,0 +1,97 @@
+"""
+Mesure de la mémoire des processus du serveur (Linux: /proc)
+
+- rss: mémoire résidente totale (compte plusieurs fois les pages partagées)
+- pss: part proportionnelle (une page partagée par N workers compte pour 1/N)
+- shared / private: pages partagées avec d'autres processus / propres au processus
+
+En mode préchargement (gunicorn --preload), le rapport couvre le maître et
+tous les workers: la somme des PSS donne la mémoire réelle du serveur.
+"""
+
+import os
+import resource
+from typing import Dict, List, Optional
+
+SMAPS_FIELDS = {
+    "Rss": "rss_bytes",
+    "Pss": "pss_bytes",
+    "Shared_Clean": "shared_clean_bytes",
+    "Shared_Dirty": "shared_dirty_bytes",
+    "Private_Clean": "private_clean_bytes",
+    "Private_Dirty": "private_dirty_bytes",
+}
+
+
+def process_memory(pid="self") -> Optional[dict]:
+    """Mémoire d'un processus (octets), None si elle n'est pas mesurable"""
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in SMAPS_FIELDS:
+                    memory[SMAPS_FIELDS[name]] = int(value.split()[0]) * 1024
+    except (FileNotFoundError, PermissionError, ProcessLookupError):
+        pass
+
+    if memory:
+        memory["shared_bytes"] = memory.pop("shared_clean_bytes", 0) + memory.pop(
+            "shared_dirty_bytes", 0
+        )
+        memory["private_bytes"] = memory.pop("private_clean_bytes", 0) + memory.pop(
+            "private_dirty_bytes", 0
+        )
+        return memory
+
+    if pid == "self":
+        # Hors Linux: seul le pic de mémoire résidente est disponible
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {"max_rss_bytes": usage.ru_maxrss * 1024}
+    return None
+
+
+def child_pids(parent: int) -> List[int]:
+    """Processus enfants d'un processus (workers d'un maître gunicorn)"""
+    try:
+        with open(f"/proc/{parent}/task/{parent}/children") as f:
+            return sorted(int(pid) for pid in f.read().split())
+    except (FileNotFoundError, PermissionError):
+        pass
+
+    # Noyau sans /proc/<pid>/task/<pid>/children: parcours de /proc
+    children = []
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # Le nom du processus (entre parenthèses) peut contenir des espaces
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (FileNotFoundError, PermissionError, ProcessLookupError):
+            continue
+        if int(fields[1]) == parent:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def memory_report(include_workers: bool = False) -> dict:
+    """Mémoire du processus courant, ou du maître et de tous les workers"""
+    pid = os.getpid()
+    report = {"pid": pid, "current": process_memory()}
+    if not include_workers:
+        return report
+
+    master = os.getppid()
+    workers: Dict[int, Optional[dict]] = {
+        worker: process_memory(worker) for worker in child_pids(master)
+    }
+    report["master"] = {"pid": master, **(process_memory(master) or {})}
+    report["workers"] = workers
+    pss = [m.get("pss_bytes", 0) for m in workers.values() if m]
+    if pss:
+        report["total_pss_bytes"] = sum(pss) + report["master"].get("pss_bytes", 0)
+        report["total_rss_bytes"] = sum(
+            m.get("rss_bytes", 0) for m in workers.values() if m
+        ) + report["master"].get("rss_bytes", 0)
+    return report
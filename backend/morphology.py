@@ -0,0 +1,187 @@
+"""
+Analyseur morphologique à états finis pour la lemmatisation malagasy
+
+Les préfixes (avec leurs variantes de temps m-/n-/h-) et les suffixes sont
+compilés en deux tries; un mot est parcouru une fois depuis la gauche (trie
+des préfixes) et une fois depuis la droite (trie des suffixes inversés), ce
+qui énumère toutes les segmentations préfixe + radical + suffixe. Chaque
+radical est ensuite rétabli par les règles de mutation nasale et de syllabe
+finale faible, puis validé par le dictionnaire. Les résultats sont mémorisés
+par forme de surface.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Marqueurs de temps des préfixes verbaux (m- présent, n- passé, h- futur)
+TENSE_MARKERS = {"m": "présent", "n": "passé", "h": "futur"}
+
+# Mutation nasale: la consonne initiale de la racine est absorbée après un
+# préfixe terminé par n (man-, fan-...) ou par m (mam-, fam-...)
+# (début du radical en surface, début de la racine)
+NASAL_MUTATIONS = {
+    "n": [("", "t"), ("", "s"), ("", "ts"), ("g", "k"), ("g", "h")],
+    "m": [("", "p"), ("", "f"), ("", "b"), ("", "v")],
+}
+
+# Syllabes finales faibles (-tra, -ka, -na) réduites devant un suffixe:
+# soratra -> fanoratana (radical "sorat" + "ra")
+WEAK_ENDINGS = {"t": "ra", "k": "a", "n": "a"}
+
+VOWELS = set("aeiouyàáâèéêìíîòóôùúû")
+
+MIN_ROOT_LENGTH = 3
+
+# Racine minimale quand préfixe et suffixe sont retirés tous deux: une racine
+# de trois lettres coïncide trop souvent avec un mot court du dictionnaire
+# (mpan + ora + tra pour mpanoratra)
+MIN_AFFIXED_ROOT_LENGTH = 4
+
+
+class Segmentation(NamedTuple):
+    """Une analyse: racine, affixes reconnus, temps et règles appliquées"""
+
+    root: str
+    prefix: str
+    suffix: str
+    tense: Optional[str]
+    rules: Tuple[str, ...]
+
+
+class _Node:
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.values: List[tuple] = []
+
+
+def _build_trie(entries: Iterable[Tuple[str, tuple]]) -> _Node:
+    root = _Node()
+    for key, value in entries:
+        node = root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+        if value not in node.values:
+            node.values.append(value)
+    return root
+
+
+def _walk(trie: _Node, chars: Iterable[str]):
+    """Toutes les entrées du trie qui sont un préfixe de chars (un seul parcours)"""
+    node = trie
+    for length, char in enumerate(chars, 1):
+        node = node.children.get(char)
+        if node is None:
+            return
+        for value in node.values:
+            yield length, value
+
+
+class MorphologicalAnalyzer:
+    """Segmentations d'un mot validées par le dictionnaire, mémorisées"""
+
+    def __init__(
+        self,
+        dictionary,
+        prefixes: Iterable[str],
+        suffixes: Iterable[str],
+        lemma_table: Optional[Dict[str, str]] = None,
+        cache_size: int = 100_000,
+    ):
+        self.dictionary = dictionary
+        self.lemma_table = lemma_table or {}
+
+        entries = []
+        for prefix in prefixes:
+            # Préfixes verbaux (hors mp- des noms d'agent): variantes de temps
+            if prefix.startswith("m") and not prefix.startswith("mp"):
+                for marker, tense in TENSE_MARKERS.items():
+                    entries.append((marker + prefix[1:], (marker + prefix[1:], tense)))
+            else:
+                entries.append((prefix, (prefix, None)))
+        self._prefixes = _build_trie(entries)
+        self._suffixes = _build_trie((s[::-1], (s,)) for s in suffixes)
+
+        self.analyze = lru_cache(maxsize=cache_size)(self._analyze)
+
+    def prefixes_of(self, word: str) -> List[Tuple[str, Optional[str]]]:
+        """Préfixes reconnus en tête du mot: (préfixe, temps)"""
+        return [value for _, value in _walk(self._prefixes, word)]
+
+    def suffixes_of(self, word: str) -> List[str]:
+        """Suffixes reconnus en fin de mot"""
+        return [value[0] for _, value in _walk(self._suffixes, reversed(word))]
+
+    def _root_candidates(self, stem: str, prefix: str, suffix: str):
+        """Racines possibles d'un radical: (racine, règles appliquées)"""
+        forms = [(stem, ())]
+        if prefix and prefix[-1] in NASAL_MUTATIONS:
+            for surface, initial in NASAL_MUTATIONS[prefix[-1]]:
+                if surface:
+                    if stem.startswith(surface):
+                        forms.append(
+                            (
+                                initial + stem[len(surface) :],
+                                (f"mutation:{surface}>{initial}",),
+                            )
+                        )
+                elif stem[0] in VOWELS:
+                    forms.append((initial + stem, (f"mutation:{initial}",)))
+
+        if not suffix:
+            return forms
+        restored = []
+        for form, rules in forms:
+            ending = WEAK_ENDINGS.get(form[-1])
+            if ending:
+                restored.append((form + ending, rules + (f"finale:{ending}",)))
+        return forms + restored
+
+    def _analyze(self, word: str) -> Tuple[Segmentation, ...]:
+        """
+        Toutes les segmentations du mot dont la racine est dans le dictionnaire,
+        de la plus probable à la moins probable
+        """
+        found = {}
+        if word in self.lemma_table:
+            tense = next((t for p, t in self.prefixes_of(word) if t is not None), None)
+            segmentation = Segmentation(
+                self.lemma_table[word], "", "", tense, ("table",)
+            )
+            found[segmentation.root] = ((-1,), segmentation)
+
+        prefixes = [(0, ("", None))] + list(_walk(self._prefixes, word))
+        suffixes = [(0, ("",))] + list(_walk(self._suffixes, reversed(word)))
+
+        for prefix_length, (prefix, tense) in prefixes:
+            for suffix_length, (suffix,) in suffixes:
+                stem = word[prefix_length : len(word) - suffix_length]
+                if len(stem) < MIN_ROOT_LENGTH:
+                    continue
+                min_length = (
+                    MIN_AFFIXED_ROOT_LENGTH if prefix and suffix else MIN_ROOT_LENGTH
+                )
+                for root, rules in self._root_candidates(stem, prefix, suffix):
+                    if len(root) < min_length or root not in self.dictionary:
+                        continue
+                    bare = not prefix and not suffix
+                    # Mot nu en dernier, puis la racine la plus longue (pas de
+                    # sur-segmentation: manoratra -> soratra, pas "ora"),
+                    # puis le moins de règles appliquées
+                    rank = (bare, -len(root), len(rules))
+                    segmentation = Segmentation(root, prefix, suffix, tense, rules)
+                    if root not in found or rank < found[root][0]:
+                        found[root] = (rank, segmentation)
+
+        ranked = sorted(found.values(), key=lambda item: item[0])
+        return tuple(segmentation for _, segmentation in ranked)
+
+    def root(self, word: str) -> Optional[str]:
+        """Racine la plus probable (None si aucune n'est dans le dictionnaire)"""
+        analyses = self.analyze(word)
+        return analyses[0].root if analyses else None
+
+    def cache_info(self) -> dict:
+        info = self.analyze.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "entries": info.currsize}
@@ -0,0 +1,334 @@
+"""
+Modèle de langue N-gram (jusqu'aux trigrammes) avec comptes conservés
+Score "stupid backoff" (Brants et al., 2007)
+
+Encodage compact: les mots sont remplacés par des identifiants entiers
+(indices dans le vocabulaire), les successeurs de chaque contexte sont stockés
+en listes plates [id, compte, id, compte, ...] triées par compte décroissant.
+Les n-grams rares sont élagués (min_count, max_successors) pour borner la mémoire.
+"""
+
+from collections import Counter
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+FORMAT_VERSION = "ngram-v1"
+
+# Pénalité appliquée à chaque repli vers un ordre inférieur
+DEFAULT_BACKOFF = 0.4
+
+
+def count_ngrams(
+    token_streams: Iterable[Sequence[str]], max_order: int = 3
+) -> Tuple[Counter, Counter, Counter]:
+    """Compte unigrammes, bigrammes et trigrammes d'une suite de textes tokenisés"""
+    unigrams, bigrams, trigrams = Counter(), Counter(), Counter()
+    for tokens in token_streams:
+        unigrams.update(tokens)
+        if max_order >= 2:
+            bigrams.update(zip(tokens, tokens[1:]))
+        if max_order >= 3:
+            trigrams.update(zip(tokens, tokens[1:], tokens[2:]))
+    return unigrams, bigrams, trigrams
+
+
+class NgramModel:
+    """Comptes N-gram indexés par identifiants entiers"""
+
+    def __init__(self, alpha: float = DEFAULT_BACKOFF):
+        self.alpha = alpha
+        self.vocabulary: List[str] = []
+        self.word_ids: Dict[str, int] = {}
+        self.unigram_counts: List[int] = []
+        self.total_count = 0
+        # Contexte -> {successeur: compte}, contexte -> total avant élagage
+        self.bigrams: Dict[int, Dict[int, int]] = {}
+        self.bigram_totals: Dict[int, int] = {}
+        self.trigrams: Dict[Tuple[int, int], Dict[int, int]] = {}
+        self.trigram_totals: Dict[Tuple[int, int], int] = {}
+        # Identifiants classés par fréquence (repli unigram), calculés au besoin
+        self._ranked_ids: Optional[Sequence[int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _word_id(self, word: str) -> int:
+        word_id = self.word_ids.get(word)
+        if word_id is None:
+            word_id = len(self.vocabulary)
+            self.word_ids[word] = word_id
+            self.vocabulary.append(word)
+            self.unigram_counts.append(0)
+        return word_id
+
+    @classmethod
+    def from_counts(
+        cls,
+        unigrams: Counter,
+        bigrams: Counter,
+        trigrams: Counter,
+        min_count: int = 2,
+        max_successors: int = 50,
+        alpha: float = DEFAULT_BACKOFF,
+        sorted_items: bool = False,
+    ) -> "NgramModel":
+        """
+        Construire le modèle depuis des comptes bruts
+        - min_count: comptes minimaux des bigrammes/trigrammes conservés
+        - max_successors: nombre maximal de successeurs gardés par contexte
+        - sorted_items: items() des bigrammes/trigrammes triés par n-gram
+          (fusion externe): chaque contexte est traité d'un bloc, seuls les
+          totaux des contextes conservés restent en mémoire
+        Un compteur approché (count_sketch.SketchCounter) ne fournit que les
+        successeurs suivis: le total de chaque contexte vient de context_total
+        """
+        model = cls(alpha=alpha)
+        for word, count in unigrams.most_common():
+            model.unigram_counts[model._word_id(word)] = count
+        model.total_count = sum(unigrams.values())
+
+        def group(counter, context_of):
+            """(contexte, successeurs conservés, total avant élagage)"""
+            context_total = getattr(counter, "context_total", None)
+            if sorted_items:
+                for context, items in groupby(
+                    counter.items(), key=lambda item: context_of(item[0])
+                ):
+                    total, successors = 0, []
+                    for ngram, count in items:
+                        total += count
+                        if count >= min_count:
+                            successors.append((ngram[-1], count))
+                    if successors:
+                        if context_total is not None:
+                            total = context_total(context)
+                        yield context, successors, total
+                return
+
+            grouped, totals = {}, Counter()
+            for ngram, count in counter.items():
+                context = context_of(ngram)
+                totals[context] += count
+                if count >= min_count:
+                    grouped.setdefault(context, []).append((ngram[-1], count))
+            for context, successors in grouped.items():
+                if context_total is not None:
+                    totals[context] = context_total(context)
+                yield context, successors, totals[context]
+
+        for context, successors, total in group(bigrams, lambda ngram: ngram[0]):
+            context_id = model._word_id(context)
+            model.bigrams[context_id] = model._top_successors(
+                successors, max_successors
+            )
+            model.bigram_totals[context_id] = total
+
+        for context, successors, total in group(trigrams, lambda ngram: ngram[:2]):
+            context_ids = (model._word_id(context[0]), model._word_id(context[1]))
+            model.trigrams[context_ids] = model._top_successors(
+                successors, max_successors
+            )
+            model.trigram_totals[context_ids] = total
+
+        return model
+
+    def _top_successors(self, successors, max_successors) -> Dict[int, int]:
+        successors.sort(key=lambda x: (-x[1], x[0]))
+        return {self._word_id(w): c for w, c in successors[:max_successors]}
+
+    @classmethod
+    def from_bigram_lists(
+        cls, bigram_model: Dict[str, List[str]], frequencies: Dict[str, int]
+    ) -> "NgramModel":
+        """
+        Convertir l'ancien format (mot -> liste des suivants les plus fréquents)
+        Les rangs deviennent des pseudo-comptes décroissants
+        """
+        unigrams = Counter(frequencies)
+        bigrams = Counter()
+        for word, followers in bigram_model.items():
+            for rank, follower in enumerate(followers):
+                bigrams[(word, follower)] = len(followers) - rank
+        return cls.from_counts(unigrams, bigrams, Counter(), min_count=1)
+
+    # ------------------------------------------------------------------
+    # Sérialisation compacte
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        def flat(successors):
+            return [value for pair in successors.items() for value in pair]
+
+        return {
+            "format": FORMAT_VERSION,
+            "alpha": self.alpha,
+            "vocabulary": self.vocabulary,
+            "unigrams": self.unigram_counts,
+            "bigrams": {
+                str(context): [self.bigram_totals[context]] + flat(successors)
+                for context, successors in self.bigrams.items()
+            },
+            "trigrams": {
+                f"{context[0]} {context[1]}": [self.trigram_totals[context]]
+                + flat(successors)
+                for context, successors in self.trigrams.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NgramModel":
+        if data.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Format de modèle N-gram inconnu: {data.get('format')}")
+
+        def unflat(values):
+            return dict(zip(values[1::2], values[2::2]))
+
+        model = cls(alpha=data.get("alpha", DEFAULT_BACKOFF))
+        model.vocabulary = data["vocabulary"]
+        model.word_ids = {word: i for i, word in enumerate(model.vocabulary)}
+        model.unigram_counts = data["unigrams"]
+        model.total_count = sum(model.unigram_counts)
+        for key, values in data["bigrams"].items():
+            model.bigrams[int(key)] = unflat(values)
+            model.bigram_totals[int(key)] = values[0]
+        for key, values in data["trigrams"].items():
+            first, second = key.split()
+            context = (int(first), int(second))
+            model.trigrams[context] = unflat(values)
+            model.trigram_totals[context] = values[0]
+        return model
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def score(
+        self, word_id: int, previous: Optional[int], before: Optional[int]
+    ) -> float:
+        """Score stupid backoff de word sachant (before, previous)"""
+        return self._backoff(word_id, self._context_levels(previous, before))
+
+    def _context_levels(self, previous: Optional[int], before: Optional[int]) -> list:
+        """
+        Niveaux de repli d'un contexte, trigram puis bigram: [(successeurs, total)]
+        Lus une fois par contexte (vues CSR: chaque lecture construit un dict)
+        """
+        levels = []
+        if before is not None and previous is not None:
+            successors = self.trigrams.get((before, previous))
+            total = self.trigram_totals[(before, previous)] if successors else 0
+            levels.append((successors, total))
+        if previous is not None:
+            successors = self.bigrams.get(previous)
+            levels.append(
+                (successors, self.bigram_totals[previous] if successors else 0)
+            )
+        return levels
+
+    def _backoff(self, word_id: int, levels: list) -> float:
+        factor = 1.0
+        for successors, total in levels:
+            if successors and word_id in successors:
+                return factor * successors[word_id] / total
+            factor *= self.alpha
+
+        if not self.total_count:
+            return 0.0
+        return factor * self.unigram_counts[word_id] / self.total_count
+
+    def score_word(self, word: str, context: Sequence[str]) -> float:
+        """Score d'un mot (chaîne) après les deux derniers tokens du contexte"""
+        word_id = self.word_ids.get(word)
+        if word_id is None:
+            return 0.0
+        ids = [self.word_ids.get(token) for token in context[-2:]]
+        previous = ids[-1] if ids else None
+        before = ids[-2] if len(ids) > 1 else None
+        return self.score(word_id, previous, before)
+
+    def predict(
+        self, context: Sequence[str], limit: int = 5, prefix: str = ""
+    ) -> List[Tuple[str, float]]:
+        """
+        Mots suivants les plus probables après les deux derniers tokens du contexte
+        Les candidats viennent des successeurs trigram puis bigram, complétés
+        par les unigrammes les plus fréquents (repli)
+        """
+        ids = [self.word_ids.get(token) for token in context[-2:]]
+        previous = ids[-1] if ids else None
+        before = ids[-2] if len(ids) > 1 else None
+
+        # Un seul parcours des successeurs de chaque niveau: un candidat reçoit
+        # le score du premier niveau qui le contient (stupid backoff), sans
+        # recherche par candidat. Classement par identifiant: seuls les mots
+        # retenus sont lus dans le vocabulaire
+        accept = self._prefix_filter(prefix) if prefix else None
+        scores = {}
+        candidates = 0
+        factor = 1.0
+        for successors, counts, total in self._successor_levels(previous, before):
+            candidates += len(successors)
+            for word_id, count in zip(successors, counts):
+                if word_id not in scores and (accept is None or accept(word_id)):
+                    scores[word_id] = factor * count / total
+            factor *= self.alpha
+
+        if candidates < limit:
+            for word_id in self._frequent_ids(limit * 20):
+                if word_id not in scores and (accept is None or accept(word_id)):
+                    scores[word_id] = (
+                        factor * self.unigram_counts[word_id] / self.total_count
+                        if self.total_count
+                        else 0.0
+                    )
+
+        scored = sorted(scores.items(), key=lambda x: -x[1])
+        return [(self.vocabulary[word_id], score) for word_id, score in scored[:limit]]
+
+    def _successor_levels(self, previous: Optional[int], before: Optional[int]) -> list:
+        """Niveaux de repli en séquences parallèles (successeurs, comptes, total)"""
+        return [
+            (
+                (list(successors), list(successors.values()), total)
+                if successors
+                else ((), (), total)
+            )
+            for successors, total in self._context_levels(previous, before)
+        ]
+
+    def _prefix_filter(self, prefix: str):
+        """Prédicat sur les identifiants: mot commençant par prefix, sans l'égaler"""
+        vocabulary = self.vocabulary
+
+        def accept(word_id):
+            word = vocabulary[word_id]
+            return word.startswith(prefix) and word != prefix
+
+        return accept
+
+    def _frequent_ids(self, count: int) -> Sequence[int]:
+        """Identifiants des mots les plus fréquents (repli unigram)"""
+        if self._ranked_ids is None:
+            self._ranked_ids = self._rank_ids()
+        return self._ranked_ids[:count]
+
+    def _rank_ids(self) -> Sequence[int]:
+        """
+        Classement des identifiants par fréquence décroissante
+        from_counts numérote déjà le vocabulaire par fréquence; un modèle lu
+        depuis un fichier (from_dict) n'offre pas cette garantie
+        """
+        counts = self.unigram_counts
+        if all(a >= b for a, b in zip(counts, counts[1:])):
+            return range(len(counts))
+        return sorted(range(len(counts)), key=lambda word_id: -counts[word_id])
+
+    def stats(self) -> dict:
+        return {
+            "vocabulary": len(self.vocabulary),
+            "bigram_contexts": len(self.bigrams),
+            "bigrams": sum(len(s) for s in self.bigrams.values()),
+            "trigram_contexts": len(self.trigrams),
+            "trigrams": sum(len(s) for s in self.trigrams.values()),
+        }
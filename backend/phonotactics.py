@@ -0,0 +1,151 @@
+"""
+Validation phonotactique malagasy: détection des combinaisons interdites
+
+Toutes les combinaisons sont compilées en une seule expression régulière
+(alternation générée, factorisée par premier caractère), parcourue une fois
+par mot ou par document:
+- has_violation: test rapide par mot, utilisé par le correcteur et le scraper
+- violations: toutes les positions de toutes les combinaisons d'un mot
+- scan: tous les tokens d'un document en un seul passage sur le texte
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Combinaisons phonotactiques interdites en malagasy
+INVALID_COMBINATIONS = ["nb", "mk", "dt", "bp", "sz", "nk"]
+
+# Combinaisons interdites seulement en début de mot
+WORD_INITIAL_ONLY = {"nk"}
+
+# Séquences écartées en plus lors du scraping (lettres doublées étrangères)
+NOISE_COMBINATIONS = ["qq", "xx"]
+
+
+def _alternation(combinations: Iterable[str]) -> str:
+    # Les plus longues d'abord: à une même position, la plus longue l'emporte
+    ordered = sorted(set(combinations), key=lambda c: (-len(c), c))
+    return "|".join(re.escape(c) for c in ordered)
+
+
+def _first_char_pattern(combinations: Iterable[str]) -> str:
+    """
+    Alternation factorisée par premier caractère: c(?=(suite1|suite2))
+    Seul le premier caractère est consommé, les occurrences chevauchantes
+    ("nbp": nb puis bp) sont donc toutes trouvées
+    """
+    by_first: Dict[str, List[str]] = {}
+    for combination in combinations:
+        by_first.setdefault(combination[0], []).append(combination[1:])
+    return "|".join(
+        f"{re.escape(first)}(?=({_alternation(rests)}))"
+        for first, rests in sorted(by_first.items())
+    )
+
+
+def _lower_same_length(text: str) -> str:
+    """Minuscules sans décaler les positions (rares caractères qui s'allongent)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class PhonotacticMatcher:
+    """Matcher multi-motifs compilé pour un ensemble de combinaisons interdites"""
+
+    def __init__(
+        self, combinations: Iterable[str], word_initial_only: Iterable[str] = ()
+    ):
+        self.combinations = sorted({c.lower() for c in combinations if c})
+        self.word_initial_only = {c.lower() for c in word_initial_only}
+        anywhere = [c for c in self.combinations if c not in self.word_initial_only]
+        initial = [c for c in self.combinations if c in self.word_initial_only]
+
+        self._all = re.compile(_first_char_pattern(self.combinations) or "(?!)")
+        # Test booléen par mot: pour quelques motifs courts, les recherches de
+        # sous-chaînes (en C) coûtent moins que l'appel au moteur de regex
+        self._anywhere = tuple(anywhere)
+        self._initial = tuple(initial)
+        self._longest_first = sorted(self.combinations, key=lambda c: (-len(c), c))
+
+    def _matches(self, text: str):
+        for match in self._all.finditer(text):
+            yield match.start(), match.group(0) + match.group(match.lastindex)
+
+    def _resolve(
+        self, text: str, position: int, combination: str, at_start: bool, end: int
+    ) -> Optional[str]:
+        """
+        Combinaison retenue à une position: la plus longue trouvée par la regex,
+        sinon (réservée au début de mot, ou débordant du token) la plus longue
+        des plus courtes qui s'applique ("nt" dans antr si seul "ntr" est initial)
+        """
+        if position + len(combination) <= end and (
+            at_start or combination not in self.word_initial_only
+        ):
+            return combination
+        for other in self._longest_first:
+            if (
+                len(other) < len(combination)
+                and text.startswith(other, position, end)
+                and (at_start or other not in self.word_initial_only)
+            ):
+                return other
+        return None
+
+    def has_violation(self, word: str) -> bool:
+        """Le mot (en minuscules) contient-il au moins une combinaison interdite"""
+        for combination in self._anywhere:
+            if combination in word:
+                return True
+        return word.startswith(self._initial)
+
+    def violations(self, word: str) -> List[Tuple[str, int]]:
+        """Toutes les combinaisons interdites du mot: (combinaison, position)"""
+        if self._all.search(word) is None:
+            return []
+        found = []
+        for position, combination in self._matches(word):
+            combination = self._resolve(
+                word, position, combination, position == 0, len(word)
+            )
+            if combination is not None:
+                found.append((combination, position))
+        return found
+
+    def scan(
+        self, text: str, spans: Sequence[Tuple[int, int]]
+    ) -> Dict[int, List[Tuple[str, int]]]:
+        """
+        Mode document: un seul passage sur le texte pour tous les tokens
+        spans: positions (début, fin) des tokens, triées
+        Retourne {indice du token: [(combinaison, position dans le token)]}
+        """
+        starts = [start for start, _ in spans]
+        found: Dict[int, List[Tuple[str, int]]] = {}
+        lowered = _lower_same_length(text)
+        for position, combination in self._matches(lowered):
+            index = bisect_right(starts, position) - 1
+            if index < 0:
+                continue
+            start, end = spans[index]
+            if position >= end:
+                continue
+            combination = self._resolve(
+                lowered, position, combination, position == start, end
+            )
+            if combination is None:
+                continue
+            found.setdefault(index, []).append((combination, position - start))
+        return found
+
+
+# Règles de l'éditeur (validation, correcteur orthographique)
+PHONOTACTIC_MATCHER = PhonotacticMatcher(INVALID_COMBINATIONS, WORD_INITIAL_ONLY)
+
+# Filtre du corpus: mêmes règles, plus le bruit typique des pages scrapées
+CORPUS_FILTER_MATCHER = PhonotacticMatcher(
+    INVALID_COMBINATIONS + NOISE_COMBINATIONS, WORD_INITIAL_ONLY
+)
@@ -0,0 +1,85 @@
+"""
+Classement précalculé des mots par fréquence
+
+Le tri complet de WORD_FREQUENCIES est fait une seule fois (à chaque
+rechargement des fréquences); n'importe quelle limite est ensuite servie par
+découpage. Les requêtes filtrées (préfixe...) parcourent le classement et
+s'arrêtent dès `limit` résultats; les sous-ensembles ad hoc (catégorie
+grammaticale, candidats bigram...) utilisent un top-k partiel par tas, en
+O(n log k) au lieu d'un tri complet.
+
+Le classement est une suite d'identifiants: avec les données binaires
+(from_ids), il lit directement les tableaux du fichier mappé, sans copie
+des mots ni des fréquences.
+"""
+
+import heapq
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+
+class FrequencyRanking:
+    """Mots triés par fréquence décroissante, construits une seule fois"""
+
+    def __init__(self, frequencies: Optional[Dict[str, int]] = None):
+        ranked = sorted((frequencies or {}).items(), key=lambda x: (-x[1], x[0]))
+        # Identifiant = rang: le vocabulaire est rangé par fréquence
+        self.vocabulary: Sequence[str] = [word for word, _ in ranked]
+        self.counts: Sequence[int] = [count for _, count in ranked]
+        self.ranked_ids: Sequence[int] = range(len(ranked))
+        self.word_ids = {word: i for i, word in enumerate(self.vocabulary)}
+
+    @classmethod
+    def from_ids(
+        cls,
+        vocabulary: Sequence[str],
+        counts: Sequence[int],
+        ranked_ids: Sequence[int],
+        word_ids,
+    ) -> "FrequencyRanking":
+        """
+        Classement sur des identifiants existants (vues du fichier binaire)
+        - vocabulary / counts: identifiant -> mot / fréquence
+        - ranked_ids: identifiants triés par (fréquence décroissante, mot)
+        - word_ids: mot -> identifiant (méthode get)
+        """
+        ranking = cls()
+        ranking.vocabulary = vocabulary
+        ranking.counts = counts
+        ranking.ranked_ids = ranked_ids
+        ranking.word_ids = word_ids
+        return ranking
+
+    def top(self, limit: int) -> List[str]:
+        """Les `limit` mots les plus fréquents (simple découpage)"""
+        vocabulary = self.vocabulary
+        return [vocabulary[word_id] for word_id in self.ranked_ids[:limit]]
+
+    def top_filtered(self, limit: int, predicate: Callable[[str], bool]) -> List[str]:
+        """`limit` mots les plus fréquents satisfaisant un filtre (arrêt anticipé)"""
+        vocabulary = self.vocabulary
+        result = []
+        for word_id in self.ranked_ids:
+            word = vocabulary[word_id]
+            if predicate(word):
+                result.append(word)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def top_with_prefix(self, prefix: str, limit: int) -> List[str]:
+        """Mots les plus fréquents commençant par un préfixe"""
+        return self.top_filtered(limit, lambda word: word.startswith(prefix))
+
+    def top_among(self, words: Iterable[str], limit: int) -> List[str]:
+        """Top-k partiel (tas) d'un sous-ensemble ad hoc de mots classés"""
+        counts = self.counts
+        ids = (self.word_ids.get(word) for word in words)
+        ids = [word_id for word_id in ids if word_id is not None and counts[word_id]]
+        # Identifiants dans l'ordre des mots: départage identique au classement
+        best = heapq.nsmallest(
+            limit, ids, key=lambda word_id: (-counts[word_id], word_id)
+        )
+        return [self.vocabulary[word_id] for word_id in best]
+
+    def __len__(self):
+        return len(self.ranked_ids)
@@ -0,0 +1,111 @@
+"""
+Suivi du chargement des ressources au démarrage du serveur
+
+Chaque ressource (dictionnaire, modèle N-gram, index...) passe par les états
+pending -> loading -> ready | failed, avec sa durée de chargement et sa taille.
+Les ressources optionnelles (ex: données NLTK) n'empêchent pas d'être prêt.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class ResourceTracker:
+    """États et durées de chargement des ressources, pour /ready"""
+
+    def __init__(self, required: Iterable[str], optional: Iterable[str] = ()):
+        self.required = list(required)
+        self.optional = list(optional)
+        self.resources: Dict[str, dict] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._event: Optional[asyncio.Event] = None
+        self.reset()
+
+    def reset(self):
+        """Remet toutes les ressources à l'état pending (nouveau démarrage)"""
+        self.resources = {
+            name: {"state": PENDING, "optional": name in self.optional}
+            for name in self.required + self.optional
+        }
+        self.started_at = None
+        self.finished_at = None
+        self._event = None
+
+    def start(self):
+        """Début du chargement: à appeler depuis la boucle asyncio"""
+        self.started_at = time.perf_counter()
+        self._event = asyncio.Event()
+
+    def finish(self):
+        self.finished_at = time.perf_counter()
+        if self._event is not None:
+            self._event.set()
+
+    @contextmanager
+    def track(self, name: str):
+        """Mesure le chargement d'une ressource (record["size"] modifiable)"""
+        record = self.resources[name]
+        record.update(state=LOADING, error=None)
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record.update(state=FAILED, error=str(e))
+            raise
+        else:
+            if record["state"] == LOADING:
+                record["state"] = READY
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    def mark(self, name: str, state: str, **details):
+        self.resources[name].update(state=state, **details)
+
+    @property
+    def ready(self) -> bool:
+        return all(self.resources[name]["state"] == READY for name in self.required)
+
+    @property
+    def status(self) -> str:
+        """loading (en cours), ready (tout chargé) ou degraded (échec partiel)"""
+        if self.ready:
+            return "ready"
+        if self.finished_at is None:
+            return "loading"
+        return "degraded"
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Attend la fin du chargement (au plus timeout secondes)
+        Retourne False si les données ne sont pas prêtes: l'appelant se
+        contente alors des données de base
+        """
+        if self.ready:
+            return True
+        if self._event is None or timeout <= 0:
+            return False
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.ready
+
+    def report(self) -> dict:
+        elapsed = None
+        if self.started_at is not None:
+            end = self.finished_at or time.perf_counter()
+            elapsed = round((end - self.started_at) * 1000, 2)
+        return {
+            "ready": self.ready,
+            "status": self.status,
+            "elapsed_ms": elapsed,
+            "resources": self.resources,
+        }
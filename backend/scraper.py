@@ -2,27 +2,184 @@
 Script de Scraping pour enrichir le dictionnaire Malagasy
 Sources: Wikipedia MG, Teny Malagasy, Rakibolana, Wiktionary MG
 
-Installation: pip install beautifulsoup4 requests
+Installation: pip install beautifulsoup4 requests httpx
 Usage: python3 scraper.py
 """
 
 import requests
 from bs4 import BeautifulSoup
+import asyncio
 import json
-import re
 from collections import Counter
+from itertools import chain, groupby, repeat
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import time
 import os
 import urllib3
 
+from binary_store import write_binary_store
+from corpus_counts import SpillingCounter
+from count_sketch import DEFAULT_DEPTH, DEFAULT_WIDTH, SketchCounter
+from crawl_store import CrawlStore
+from dedup import DEFAULT_THRESHOLD, NearDuplicateDetector
+from fetcher import AsyncFetcher
+from ngram_model import NgramModel, count_ngrams
+from phonotactics import CORPUS_FILTER_MATCHER
+from tokenizer import is_token, tokenize
+
 # Désactiver les avertissements SSL
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Fragments d'URL et de balisage écartés du corpus
+STOP_WORDS = {"http", "https", "www", "com", "org", "html", "php", "css", "jpg", "png"}
+
+# API MediaWiki (configurable: miroir ou serveur local de test)
+WIKIPEDIA_API_URL = os.getenv("WIKIPEDIA_API_URL", "https://mg.wikipedia.org/w/api.php")
+
+# Stockage persistant du crawl (reprise, téléchargements incrémentaux)
+CRAWL_STORE_PATH = os.getenv("CRAWL_STORE_PATH", "data/crawl_store.sqlite3")
+WIKIPEDIA_CHECKPOINT = "wikipedia_mg"
+
+# Identifiants par requête (maximum MediaWiki pour list=random et pageids)
+MEDIAWIKI_BATCH_SIZE = 50
+
+# Articles mis en attente avant tokenisation et comptage (mémoire bornée)
+INGEST_BATCH_ARTICLES = 256
+
+# N-grams distincts gardés en mémoire avant déversement sur disque
+COUNT_SPILL_ENTRIES = int(os.getenv("COUNT_SPILL_ENTRIES", "1000000"))
+
+# Comptage des bigrammes/trigrammes: "exact" (Counter déversé sur disque) ou
+# "sketch" (Count-Min Sketch + top-k par contexte: mémoire fixe, comptes
+# approchés, n-grams rares jamais stockés)
+NGRAM_COUNTING = os.getenv("NGRAM_COUNTING", "exact")
+SKETCH_WIDTH = int(os.getenv("SKETCH_WIDTH", str(DEFAULT_WIDTH)))
+SKETCH_DEPTH = int(os.getenv("SKETCH_DEPTH", str(DEFAULT_DEPTH)))
+
+# Successeurs suivis par contexte en mode sketch (max_successors du modèle)
+SKETCH_TOP_K = 50
+
+# Similarité (Jaccard des shingles) à partir de laquelle un texte ingéré est
+# un quasi-doublon d'un texte déjà compté (0: détection désactivée)
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", str(DEFAULT_THRESHOLD)))
+
+# Articles conservés pour corpus_sample.txt
+CORPUS_SAMPLE_ARTICLES = 50
+
+# En dessous de ce nombre d'articles, le démarrage des processus coûte plus
+# que le comptage lui-même
+PARALLEL_MIN_ARTICLES = 64
+
+# Démarrage des workers de comptage: jamais fork (ingest tourne dans un
+# thread d'asyncio.to_thread, un fork copierait des verrous détenus)
+POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def keep_token(word):
+    """
+    Filtre du corpus pour un token
+    (les caractères sont déjà garantis par le tokenizer)
+    """
+    if len(word) < 2 or len(word) > 30:
+        return False
+
+    # Mots à éviter
+    if word in STOP_WORDS:
+        return False
+
+    # Combinaisons interdites en malagasy (matcher partagé avec l'API)
+    if CORPUS_FILTER_MATCHER.has_violation(word):
+        return False
+
+    return True
+
+
+def tokenize_article(text):
+    """Tokens malagasy d'un texte (tokenizer partagé avec l'API)"""
+    return [w for w in tokenize(text) if keep_token(w)]
+
+
+def count_articles(texts, hasher=None):
+    """
+    Étape map (dans un worker): chaque article est tokenisé une seule fois,
+    puis compté en unigrammes, bigrammes et trigrammes.
+    Résultat par article: (empreinte, comptes); l'empreinte (voir
+    dedup.MinHasher, None sans hasher) est calculée sur les mêmes tokens, les
+    doublons sont écartés ensuite sans retokeniser
+    """
+    results = []
+    for text in texts:
+        tokens = tokenize(text)
+        counts = count_ngrams([[word for word in tokens if keep_token(word)]])
+        sketch = (*hasher.sketch(tokens), len(tokens)) if hasher else None
+        results.append((sketch, counts))
+    return results
+
+
 class MalagasyScraper:
-    def __init__(self):
+    def __init__(
+        self,
+        workers=None,
+        api_url=None,
+        concurrency=8,
+        rate=5.0,
+        store_path=CRAWL_STORE_PATH,
+        spill_entries=COUNT_SPILL_ENTRIES,
+        spill_dir=None,
+        counting=NGRAM_COUNTING,
+        sketch_width=SKETCH_WIDTH,
+        sketch_depth=SKETCH_DEPTH,
+        dedup_threshold=DEDUP_THRESHOLD,
+    ):
         self.dictionary = set()
         self.word_frequencies = Counter()
-        self.corpus_text = []
+        # Pipeline: textes en attente de comptage (vidé par process_corpus),
+        # échantillon conservé pour l'export, nombre d'articles ingérés
+        self.pending_texts = []
+        self.corpus_sample = []
+        self.article_count = 0
+        # Comptes N-gram du corpus: exacts, déversés sur disque au-delà de
+        # spill_entries, ou approchés dans une esquisse de taille fixe
+        self.counting = counting
+        if counting == "exact":
+            self.bigram_counts = SpillingCounter("bigrams", spill_dir, spill_entries)
+            self.trigram_counts = SpillingCounter("trigrams", spill_dir, spill_entries)
+        elif counting == "sketch":
+            # Totaux des contextes: unigrammes (exacts) et esquisse des bigrammes
+            self.bigram_counts = SketchCounter(
+                sketch_width,
+                sketch_depth,
+                SKETCH_TOP_K,
+                context_counts=lambda contexts: [
+                    self.word_frequencies[c[0]] for c in contexts
+                ],
+            )
+            self.trigram_counts = SketchCounter(
+                sketch_width,
+                sketch_depth,
+                SKETCH_TOP_K,
+                context_counts=self.bigram_counts.estimate,
+            )
+        else:
+            raise ValueError(f"Mode de comptage inconnu: {counting} (exact ou sketch)")
+        # Doublons et quasi-doublons écartés avant la fusion des comptes (dedup.py)
+        self.deduplicator = (
+            NearDuplicateDetector(dedup_threshold) if dedup_threshold > 0 else None
+        )
+        self.workers = workers or os.cpu_count() or 1
+        # Pool de comptage créé au premier lot et gardé jusqu'au dernier
+        # process_corpus (un seul démarrage de processus par crawl)
+        self._pool = None
+        # Téléchargement asynchrone des articles (voir fetcher.py)
+        self.api_url = api_url or WIKIPEDIA_API_URL
+        self.concurrency = concurrency
+        self.rate = rate
+        # Crawl persistant (store_path=None: tout en mémoire, rien de stocké)
+        self.store = CrawlStore(store_path) if store_path else None
+        self.crawl_stats = {"downloaded": 0, "unchanged": 0, "not_modified": 0}
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -33,45 +190,22 @@ class MalagasyScraper:
     def scrape_wikipedia_mg(self, num_articles=50):
         """
         Scraper les articles Wikipedia Malagasy
+        (téléchargement concurrent, voir _fetch_wikipedia_articles)
         """
         print(f"Scraping {num_articles} articles de Wikipedia MG...")
 
-        base_url = "https://mg.wikipedia.org/w/api.php"
-
-        # Paramètres pour obtenir des articles aléatoires
-        params = {
-            "action": "query",
-            "format": "json",
-            "list": "random",
-            "rnnamespace": 0,
-            "rnlimit": min(num_articles, 50),
-        }
-
         try:
-            response = self.session.get(
-                base_url, params=params, timeout=15, verify=False
+            start = time.perf_counter()
+            articles, stats = asyncio.run(self._fetch_wikipedia_articles(num_articles))
+            print(
+                f"   {articles} articles en {time.perf_counter() - start:.1f}s "
+                f"({self.crawl_stats['downloaded']} téléchargés, "
+                f"{self.crawl_stats['unchanged']} inchangés; "
+                f"{stats['requests']} requêtes, "
+                f"{stats['retries']} nouvelles tentatives, {stats['failures']} échecs)"
             )
-            response.raise_for_status()
-
-            data = response.json()
-            articles = data.get("query", {}).get("random", [])
-            print(f"   Trouvé {len(articles)} articles")
-
-            for idx, article in enumerate(articles):
-                title = article["title"]
-                page_id = article["id"]
-
-                content = self._get_article_content(page_id)
-                if content:
-                    self.corpus_text.append(content)
-                    words = self._tokenize(content)
-                    self.dictionary.update(words)
-                    self.word_frequencies.update(words)
-
-                if (idx + 1) % 10 == 0:
-                    print(f"   Traité: {idx + 1}/{len(articles)} articles")
-
-                time.sleep(0.2)
+            if not articles:
+                raise RuntimeError("aucun article téléchargé")
 
             print(f"✓ Wikipedia MG: {len(self.dictionary)} mots collectés")
 
@@ -80,6 +214,183 @@ class MalagasyScraper:
             print("   Tentative de scraping direct des pages...")
             self._scrape_wikipedia_direct()
 
+    async def _fetch_wikipedia_articles(self, num_articles):
+        """
+        Articles aléatoires: identifiants par lots de 50 (list=random), puis
+        textes des lots de 50 pageids, requêtes concurrentes.
+        Le point de reprise note tous les articles du crawl et ceux déjà
+        traités: un crawl interrompu reprend au lancement suivant, les
+        articles traités avant l'interruption étant recomptés depuis le
+        stockage (le modèle est celui d'un crawl sans interruption).
+        Chaque lot reçu est compté aussitôt (ingest), puis libéré.
+        Retourne (nombre d'articles, statistiques HTTP)
+        """
+        async with AsyncFetcher(
+            concurrency=self.concurrency, rate=self.rate
+        ) as fetcher:
+            checkpoint = (
+                self.store.load_checkpoint(WIKIPEDIA_CHECKPOINT) if self.store else None
+            )
+            articles = 0
+            if checkpoint and "page_ids" in checkpoint:
+                page_ids = checkpoint["page_ids"]
+                completed = set(checkpoint["completed"])
+                print(
+                    f"   Reprise du crawl interrompu: "
+                    f"{len(page_ids) - len(completed)} articles restants"
+                )
+                # Recomptés par ingest: le détecteur de doublons les revoit aussi
+                stored = self.store.get_texts(p for p in page_ids if p in completed)
+                articles += len(stored)
+                await asyncio.to_thread(
+                    self.ingest, (stored[p] for p in page_ids if p in stored)
+                )
+            else:
+                page_ids = await self._random_page_ids(fetcher, num_articles)
+                completed = set()
+                print(f"   Trouvé {len(page_ids)} articles")
+
+            self._save_checkpoint(page_ids, completed)
+
+            remaining = [page_id for page_id in page_ids if page_id not in completed]
+            batches = [
+                remaining[i : i + MEDIAWIKI_BATCH_SIZE]
+                for i in range(0, len(remaining), MEDIAWIKI_BATCH_SIZE)
+            ]
+            tasks = [self._fetch_batch(fetcher, batch) for batch in batches]
+            for done in asyncio.as_completed(tasks):
+                try:
+                    batch_texts, batch_ids = await done
+                    articles += len(batch_texts)
+                    # Comptage hors de la boucle: les téléchargements continuent
+                    await asyncio.to_thread(self.ingest, batch_texts)
+                    completed.update(batch_ids)
+                    self._save_checkpoint(page_ids, completed)
+                except Exception as e:
+                    print(f"   ⚠ Lot d'articles abandonné: {e}")
+                print(f"   Traité: {len(completed)}/{len(page_ids)} articles")
+
+            pending = len(page_ids) - len(completed)
+            if pending:
+                print(f"   ⚠ {pending} articles à reprendre au prochain lancement")
+            elif self.store:
+                self.store.clear_checkpoint(WIKIPEDIA_CHECKPOINT)
+            await asyncio.to_thread(self.process_corpus)
+            return articles, dict(fetcher.stats)
+
+    def _save_checkpoint(self, page_ids, completed):
+        if self.store and len(completed) < len(page_ids):
+            self.store.save_checkpoint(
+                WIKIPEDIA_CHECKPOINT,
+                {"page_ids": page_ids, "completed": sorted(completed)},
+            )
+
+    async def _fetch_batch(self, fetcher, page_ids):
+        """
+        Textes d'un lot d'articles: seuls les articles nouveaux ou modifiés
+        (révision différente de celle stockée) sont téléchargés
+        Retourne (textes, identifiants traités)
+        """
+        if self.store is None:
+            extracts = await self._get_extracts(fetcher, page_ids)
+            self.crawl_stats["downloaded"] += len(extracts)
+            return [text for _, text in extracts.values()], page_ids
+
+        revisions = await self._get_revisions(fetcher, page_ids)
+        stored = self.store.revisions(page_ids)
+        changed = [
+            page_id
+            for page_id in page_ids
+            if page_id not in stored or stored[page_id] != revisions.get(page_id)
+        ]
+        extracts = await self._get_extracts(fetcher, changed) if changed else {}
+        for page_id, (title, text) in extracts.items():
+            self.store.put_page(page_id, text, revisions.get(page_id), title)
+
+        unchanged = self.store.get_texts(p for p in page_ids if p not in extracts)
+        self.crawl_stats["downloaded"] += len(extracts)
+        self.crawl_stats["unchanged"] += len(unchanged)
+        return [text for _, text in extracts.values()] + list(
+            unchanged.values()
+        ), page_ids
+
+    async def _get_revisions(self, fetcher, page_ids):
+        """Dernière révision de chaque article (prop=info, sans le texte)"""
+        data = await fetcher.get_json(
+            self.api_url,
+            {
+                "action": "query",
+                "format": "json",
+                "pageids": "|".join(str(page_id) for page_id in page_ids),
+                "prop": "info",
+            },
+        )
+        return {
+            int(page_id): page.get("lastrevid")
+            for page_id, page in data.get("query", {}).get("pages", {}).items()
+        }
+
+    async def _random_page_ids(self, fetcher, num_articles):
+        """Identifiants d'articles aléatoires (sans doublons)"""
+        requests_needed = -(-num_articles // MEDIAWIKI_BATCH_SIZE)
+        responses = await asyncio.gather(
+            *(
+                fetcher.get_json(
+                    self.api_url,
+                    {
+                        "action": "query",
+                        "format": "json",
+                        "list": "random",
+                        "rnnamespace": 0,
+                        "rnlimit": min(
+                            MEDIAWIKI_BATCH_SIZE,
+                            num_articles - i * MEDIAWIKI_BATCH_SIZE,
+                        ),
+                    },
+                )
+                for i in range(requests_needed)
+            )
+        )
+        page_ids = {}
+        for data in responses:
+            for article in data.get("query", {}).get("random", []):
+                page_ids[article["id"]] = article["title"]
+        return list(page_ids)[:num_articles]
+
+    async def _get_extracts(self, fetcher, page_ids):
+        """
+        Textes d'un lot d'articles. Sans exintro, TextExtracts ne renvoie
+        qu'un extrait complet par réponse (exlimit plafonné à 1): une requête
+        par article, toutes lancées ensemble, la concurrence et le débit par
+        hôte étant réglés par le fetcher
+        Retourne {identifiant: (titre, texte)}
+        """
+        extracts = await asyncio.gather(
+            *(self._get_extract(fetcher, page_id) for page_id in page_ids)
+        )
+        return {
+            page_id: extract
+            for page_id, extract in zip(page_ids, extracts)
+            if extract is not None
+        }
+
+    async def _get_extract(self, fetcher, page_id):
+        """(titre, texte) d'un article, None s'il n'a pas de texte"""
+        data = await fetcher.get_json(
+            self.api_url,
+            {
+                "action": "query",
+                "format": "json",
+                "pageids": str(page_id),
+                "prop": "extracts",
+                "explaintext": 1,
+            },
+        )
+        page = data.get("query", {}).get("pages", {}).get(str(page_id), {})
+        if not page.get("extract"):
+            return None
+        return page.get("title"), page["extract"]
+
     def _scrape_wikipedia_direct(self):
         """Scraper directement les pages HTML de Wikipedia"""
         try:
@@ -104,50 +415,22 @@ class MalagasyScraper:
             for page in pages:
                 url = f"https://mg.wikipedia.org/wiki/{page}"
                 try:
-                    response = self.session.get(url, timeout=10, verify=False)
-                    soup = BeautifulSoup(response.content, "html.parser")
+                    soup = BeautifulSoup(self._get_page(url, timeout=10), "html.parser")
 
                     # Extraire le contenu principal
                     content_div = soup.find("div", {"id": "mw-content-text"})
                     if content_div:
-                        text = content_div.get_text()
-                        self.corpus_text.append(text)
-                        words = self._tokenize(text)
-                        self.dictionary.update(words)
-                        self.word_frequencies.update(words)
+                        self.ingest([content_div.get_text()])
 
                     time.sleep(0.5)
                 except:
                     continue
 
+            self.process_corpus()
             print(f"✓ Scraping direct: {len(self.dictionary)} mots collectés")
         except Exception as e:
             print(f"⚠ Erreur scraping direct: {e}")
 
-    def _get_article_content(self, page_id):
-        """Récupérer le contenu d'un article Wikipedia"""
-        url = "https://mg.wikipedia.org/w/api.php"
-        params = {
-            "action": "query",
-            "format": "json",
-            "pageids": page_id,
-            "prop": "extracts",
-            "explaintext": True,
-        }
-
-        try:
-            response = self.session.get(url, params=params, timeout=10, verify=False)
-            data = response.json()
-            pages = data.get("query", {}).get("pages", {})
-
-            if str(page_id) in pages:
-                extract = pages[str(page_id)].get("extract", "")
-                return extract
-        except:
-            pass
-
-        return None
-
     def scrape_teny_malagasy(self):
         """
         Scraper le dictionnaire Teny Malagasy avec gestion SSL
@@ -159,9 +442,7 @@ class MalagasyScraper:
 
         try:
             # Essayer avec verify=False pour SSL
-            response = self.session.get(base_url, timeout=15, verify=False)
-            response.encoding = "utf-8"
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(self._get_page(base_url), "html.parser")
 
             # Extraire tous les textes de la page
             all_text = soup.get_text()
@@ -223,8 +504,7 @@ class MalagasyScraper:
         words_added = 0
 
         try:
-            response = self.session.get(base_url, timeout=15, verify=False)
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(self._get_page(base_url), "html.parser")
 
             # Extraire tous les mots
             all_text = soup.get_text()
@@ -280,8 +560,7 @@ class MalagasyScraper:
         """Scraper directement les pages du Wiktionary"""
         try:
             url = "https://mg.wiktionary.org/wiki/Fandraisana"
-            response = self.session.get(url, timeout=10, verify=False)
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(self._get_page(url, timeout=10), "html.parser")
 
             text = soup.get_text()
             words = self._tokenize(text)
@@ -290,70 +569,179 @@ class MalagasyScraper:
         except:
             pass
 
+    def _get_page(self, url, timeout=15):
+        """
+        Contenu d'une page HTML; si elle est déjà stockée, requête
+        conditionnelle (ETag / Last-Modified): 304 -> contenu stocké
+        """
+        cached = self.store.get_document(url) if self.store else None
+        headers = {}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(url, timeout=timeout, verify=False, headers=headers)
+        if response.status_code == 304 and cached:
+            self.crawl_stats["not_modified"] += 1
+            return cached["content"]
+        if self.store and response.status_code == 200:
+            self.store.put_document(
+                url,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return response.content
+
+    def rebuild_from_store(self):
+        """
+        Reconstruit corpus et dictionnaire depuis le crawl stocké, sans réseau
+        (tous les articles stockés, pas seulement ceux du dernier lancement)
+        """
+        if self.store is None:
+            raise RuntimeError("Aucun stockage de crawl configuré")
+        print(f"Reconstruction hors ligne depuis {self.store.path}...")
+        self.ingest(self.store.iter_texts())
+        self.process_corpus()
+        print(
+            f"✓ Corpus stocké: {self.article_count} articles, "
+            f"{len(self.dictionary)} mots"
+        )
+
     def _tokenize(self, text):
-        """Tokenisation pour le malagasy"""
-        text = text.lower()
-        text = re.sub(r"[^\w\s-]", " ", text)
-        words = re.findall(r"\b[a-zàáâèéêìíîòóôùúû-]{2,}\b", text, re.UNICODE)
-        valid_words = [w for w in words if self._is_valid_malagasy_word(w)]
-        return valid_words
+        """Tokenisation pour le malagasy (tokenizer partagé avec l'API)"""
+        return tokenize_article(text)
 
     def _is_valid_malagasy_word(self, word):
-        """Vérifier si un mot est malagasy"""
-        if len(word) < 2 or len(word) > 30:
-            return False
-
-        # Mots à éviter
-        stop_words = [
-            "http",
-            "https",
-            "www",
-            "com",
-            "org",
-            "html",
-            "php",
-            "css",
-            "jpg",
-            "png",
-        ]
-        if word in stop_words:
-            return False
+        """Vérifier si un mot isolé (titre, lien) est malagasy"""
+        return is_token(word) and keep_token(word)
 
-        # Combinaisons interdites en malagasy
-        invalid_combos = ["nb", "mk", "dt", "bp", "sz", "qq", "xx"]
-        for combo in invalid_combos:
-            if combo in word:
-                return False
-
-        if not re.match(r"^[a-zàáâèéêìíîòóôùúû-]+$", word, re.UNICODE):
-            return False
+    def ingest(self, texts):
+        """
+        Entrée du pipeline (textes -> tokens -> comptes): les textes sont mis
+        en attente et comptés par lots de INGEST_BATCH_ARTICLES, puis libérés.
+        texts peut être un générateur: le corpus n'est jamais entier en mémoire
+        (le texte brut est conservé sur disque par le stockage du crawl)
+        Les doublons d'un texte déjà ingéré (même page par l'API et en HTML,
+        gabarits répétés) sont écartés par process_corpus, avant la fusion
+        des comptes
+        """
+        for text in texts:
+            self.pending_texts.append(text)
+            if len(self.pending_texts) >= INGEST_BATCH_ARTICLES:
+                self.process_corpus(final=False)
 
-        return True
+    def process_corpus(self, final=True):
+        """
+        Tokenise et compte les articles en attente
+        (map-reduce: les comptes de chaque article sont calculés dans un pool
+        de processus, fusionnés ensuite). Chaque article n'est tokenisé
+        qu'une fois: les workers calculent aussi son empreinte MinHash, les
+        doublons sont écartés ici, dans l'ordre d'ingestion, avant la fusion.
+        Le pool sert à tous les lots d'ingest (final=False) et est fermé par
+        l'appel final (fin du crawl, construction des modèles)
+        """
+        try:
+            self._count_pending()
+        finally:
+            if final:
+                self._close_pool()
+
+    def _count_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(POOL_START_METHOD),
+            )
+        return self._pool
+
+    def _close_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _count_pending(self):
+        texts = self.pending_texts
+        if not texts:
+            return
+        self.pending_texts = []
+
+        start = time.perf_counter()
+        workers = min(self.workers, len(texts))
+        # Plusieurs lots par worker: les articles n'ont pas tous la même taille
+        chunk_size = max(1, len(texts) // (workers * 4))
+        chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+        hasher = self.deduplicator.hasher if self.deduplicator else None
+        if workers > 1 and len(texts) >= PARALLEL_MIN_ARTICLES:
+            pool = self._count_pool()
+            results = list(pool.map(count_articles, chunks, repeat(hasher)))
+        else:
+            workers = 1
+            results = [count_articles(chunk, hasher) for chunk in chunks]
+
+        # Étape reduce (ordre des articles conservé par map)
+        for text, (sketch, counts) in zip(texts, chain.from_iterable(results)):
+            if sketch is not None and self.deduplicator.check(*sketch):
+                continue
+            unigrams, bigrams, trigrams = counts
+            self.word_frequencies.update(unigrams)
+            self.bigram_counts.update(bigrams)
+            self.trigram_counts.update(trigrams)
+            self.dictionary.update(unigrams)
+            self.article_count += 1
+            if len(self.corpus_sample) < CORPUS_SAMPLE_ARTICLES:
+                self.corpus_sample.append(text)
+
+        elapsed = time.perf_counter() - start
+        print(
+            f"   Corpus: {len(texts)} articles tokenisés en {elapsed:.2f}s "
+            f"({workers} processus, {self.article_count} au total)"
+        )
 
     def build_bigram_model(self):
-        """Construire un modèle bigram"""
+        """Construire un modèle bigram (depuis les comptes du corpus)"""
         print("Construction du modèle N-gram...")
+        self.process_corpus()
 
-        bigram_model = {}
-
-        for text in self.corpus_text:
-            words = self._tokenize(text)
-
-            for i in range(len(words) - 1):
-                word1, word2 = words[i], words[i + 1]
-
-                if word1 not in bigram_model:
-                    bigram_model[word1] = Counter()
-
-                bigram_model[word1][word2] += 1
-
+        # Fusion externe triée par clé: les successeurs d'un mot se suivent,
+        # un seul mot est regroupé en mémoire à la fois
         final_model = {}
-        for word, counter in bigram_model.items():
-            final_model[word] = [w for w, _ in counter.most_common(10)]
+        for word1, group in groupby(self.bigram_counts.items(), key=lambda x: x[0][0]):
+            # Égalités départagées par ordre alphabétique (ordre stable)
+            successors = sorted(group, key=lambda x: (-x[1], x[0][1]))
+            final_model[word1] = [word2 for (_, word2), _ in successors[:10]]
 
         print(f"   Modèle bigram: {len(final_model)} entrées")
         return final_model
 
+    def build_ngram_model(self, min_count=2, max_successors=50):
+        """
+        Construire le modèle N-gram avec comptes (jusqu'aux trigrammes)
+        Les n-grams vus moins de min_count fois sont élagués
+        """
+        print("Construction du modèle N-gram (trigrammes)...")
+        self.process_corpus()
+
+        # Les fréquences des mots sont les unigrammes du corpus
+        model = NgramModel.from_counts(
+            self.word_frequencies,
+            self.bigram_counts,
+            self.trigram_counts,
+            min_count=min_count,
+            max_successors=max_successors,
+            # Fusion externe triée: les n-grams d'un même contexte sont consécutifs
+            sorted_items=True,
+        )
+
+        stats = model.stats()
+        print(
+            f"   Modèle N-gram: {stats['bigrams']} bigrammes, "
+            f"{stats['trigrams']} trigrammes (min_count={min_count})"
+        )
+        return model
+
     def export_data(self, output_dir="data"):
         """Exporter les données"""
         os.makedirs(output_dir, exist_ok=True)
@@ -380,16 +768,38 @@ class MalagasyScraper:
             json.dump(bigram_model, f, ensure_ascii=False, indent=2)
         print(f"   ✓ {bigram_file}")
 
+        # Modèle N-gram avec comptes (format compact, identifiants entiers)
+        ngram_model = self.build_ngram_model()
+        ngram_file = os.path.join(output_dir, "ngram_model.json")
+        with open(ngram_file, "w", encoding="utf-8") as f:
+            json.dump(
+                ngram_model.to_dict(), f, ensure_ascii=False, separators=(",", ":")
+            )
+        print(f"   ✓ {ngram_file}")
+
+        # Format binaire (mmap): dictionnaire, toutes les fréquences, N-grams
+        binary_file = os.path.join(output_dir, "malagasy_data.bin")
+        write_binary_store(
+            binary_file, self.dictionary, self.word_frequencies, ngram_model
+        )
+        print(f"   ✓ {binary_file} ({os.path.getsize(binary_file) / 1024:.0f} Ko)")
+
         # Corpus
         corpus_file = os.path.join(output_dir, "corpus_sample.txt")
         with open(corpus_file, "w", encoding="utf-8") as f:
-            sample = "\n\n".join(self.corpus_text[:50])
+            sample = "\n\n".join(self.corpus_sample)
             f.write(sample)
         print(f"   ✓ {corpus_file}")
+        if self.store:
+            stats = self.store.stats()
+            print(
+                f"   ✓ Corpus complet: {self.store.path} ({stats['pages']} articles, "
+                f"{stats['file_bytes'] / 1024:.0f} Ko)"
+            )
 
         print(f"\n Statistiques finales:")
         print(f"   • Mots uniques: {len(self.dictionary)}")
-        print(f"   • Articles traités: {len(self.corpus_text)}")
+        print(f"   • Articles traités: {self.article_count}")
         print(f"   • Mots totaux: {sum(self.word_frequencies.values())}")
 
     def get_statistics(self):
@@ -398,8 +808,50 @@ class MalagasyScraper:
         print("STATISTIQUES DU SCRAPING")
         print("=" * 60)
         print(f"Mots uniques: {len(self.dictionary)}")
-        print(f"Articles traités: {len(self.corpus_text)}")
+        print(f"Articles traités: {self.article_count}")
+        if self.deduplicator:
+            stats = self.deduplicator.stats
+            print(
+                f"Doublons écartés: {stats['exact_duplicates']} identiques, "
+                f"{stats['near_duplicates']} quasi-doublons (similarité >= "
+                f"{self.deduplicator.threshold:.0%}) sur {stats['documents']} textes, "
+                f"{stats['tokens_dropped']} tokens non comptés"
+            )
+        if self.counting == "sketch":
+            counters = (
+                ("Bigrammes", self.bigram_counts),
+                ("Trigrammes", self.trigram_counts),
+            )
+            for label, counter in counters:
+                stats = counter.stats()
+                print(
+                    f"{label} (esquisse {stats['width']}x{stats['depth']}, "
+                    f"{stats['sketch_bytes'] / 1e6:.0f} Mo): {stats['tracked']} suivis "
+                    f"dans {stats['contexts']} contextes, surestimation <= "
+                    f"{stats['error_bound']:.1f}"
+                )
+        spills = sum(
+            getattr(counter, "spills", 0)
+            for counter in (self.bigram_counts, self.trigram_counts)
+        )
+        if spills:
+            spilled = (
+                self.bigram_counts.spilled_bytes + self.trigram_counts.spilled_bytes
+            )
+            print(
+                f"Comptes déversés sur disque: {spills} fois ({spilled / 1e6:.1f} Mo)"
+            )
         print(f"Mots totaux: {sum(self.word_frequencies.values())}")
+        if self.store:
+            stats = self.store.stats()
+            print(
+                f"Crawl: {self.crawl_stats['downloaded']} articles téléchargés, "
+                f"{self.crawl_stats['unchanged']} inchangés, "
+                f"{self.crawl_stats['not_modified']} pages non modifiées (304)"
+            )
+            print(
+                f"Stockage: {stats['pages']} articles, {stats['documents']} pages HTML"
+            )
 
         if self.word_frequencies:
             print("\n Top 20 mots les plus fréquents:")
@@ -446,6 +898,8 @@ def main():
     print("   • malagasy_dictionary.json")
     print("   • word_frequencies.json")
     print("   • bigram_model.json")
+    print("   • ngram_model.json")
+    print("   • malagasy_data.bin")
     print("   • corpus_sample.txt")
     print("=" * 60)
 
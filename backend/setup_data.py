@@ -4,7 +4,8 @@ Lance automatiquement le scraping si les données n'existent pas
 
 Usage:
     python3 setup_data.py                   # Setup interactif
-    python3 setup_data.py --force           # Force le re-scraping
+    python3 setup_data.py --force           # Force le re-scraping (incrémental)
+    python3 setup_data.py --offline         # Reconstruit depuis le crawl stocké
     python3 setup_data.py --quick           # Scraping rapide (50 articles)
     python3 setup_data.py --all-sources     # Active toutes les sources
     python3 setup_data.py --minimal         # Données minimales uniquement
@@ -47,7 +48,7 @@ def get_data_stats():
         return None
 
 
-def run_scraper(num_articles=50, all_sources=False):
+def run_scraper(num_articles=50, all_sources=False, offline=False):
     """Lance le scraper avec les options spécifiées"""
     print("\n" + "=" * 70)
     print("LANCEMENT DU SCRAPING")
@@ -64,10 +65,18 @@ def run_scraper(num_articles=50, all_sources=False):
 
         scraper = MalagasyScraper()
 
+        if offline:
+            # Modèles reconstruits depuis data/crawl_store.sqlite3, sans réseau
+            scraper.rebuild_from_store()
+            scraper.get_statistics()
+            scraper.export_data()
+            return True
+
         print(f"\n Configuration du scraping:")
         print(f"   • Articles Wikipedia: {num_articles}")
         print(f"   • Toutes les sources: {'Oui' if all_sources else 'Non'}")
         print(f"\n Temps estimé: 2-5 minutes selon votre connexion...")
+        print(f"   (seules les pages nouvelles ou modifiées sont téléchargées)")
         print()
 
         # 1. Wikipedia MG (toujours activé)
@@ -200,10 +209,18 @@ def main():
     quick_mode = "--quick" in sys.argv
     all_sources = "--all-sources" in sys.argv
     minimal_only = "--minimal" in sys.argv
+    offline = "--offline" in sys.argv
 
     # Créer le dossier data
     os.makedirs("data", exist_ok=True)
 
+    # Reconstruction hors ligne depuis le crawl stocké
+    if offline:
+        print("\n Mode hors ligne: reconstruction des modèles depuis le crawl stocké")
+        if not run_scraper(offline=True):
+            print(f"\n  Reconstruction échouée (lancez d'abord un scraping)")
+        return
+
     # Vérifier si les données existent
     data_exists = check_data_exists()
 
@@ -217,7 +234,8 @@ def main():
             print(f"   • Fréquences: {stats['word_frequencies']:,} mots")
 
         print(f"\n Options disponibles:")
-        print(f"   • python3 setup_data.py --force         # Re-scraping complet")
+        print(f"   • python3 setup_data.py --force         # Re-scraping (reprise)")
+        print(f"   • python3 setup_data.py --offline       # Reconstruction locale")
         print(
             f"   • python3 setup_data.py --quick         # Scraping rapide (50 articles)"
         )
@@ -0,0 +1,126 @@
+"""
+Cache LRU borné (nombre d'entrées et mémoire) pour les suggestions
+Partagé entre les requêtes: spell-check, traduction, knowledge graph
+
+Les clés sont (espace de noms, mot, version du dictionnaire): un rechargement
+du dictionnaire change la version et invalide automatiquement le cache.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+def estimate_size(value: Any) -> int:
+    """Estimation approximative de la mémoire occupée par une valeur (octets)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class SuggestionCache:
+    """Cache LRU thread-safe avec compteurs de hits/miss/évictions"""
+
+    def __init__(self, max_entries: int = 50_000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(
+        self,
+        namespace: str,
+        word: Hashable,
+        default=None,
+        version: Optional[int] = None,
+    ):
+        """Lire une entrée (et la marquer comme récemment utilisée)"""
+        key = (namespace, word, self.version if version is None else version)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(
+        self, namespace: str, word: Hashable, value: Any, version: Optional[int] = None
+    ):
+        """
+        Ajouter une entrée, en évinçant les plus anciennes si nécessaire
+        Une entrée calculée avec une version périmée du dictionnaire est ignorée
+        """
+        version = self.version if version is None else version
+        key = (namespace, word, version)
+        size = estimate_size(key) + estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            # Vérifiée sous le verrou: un set_version concurrent ne peut pas
+            # ranger la valeur périmée sous la nouvelle version
+            if version != self.version:
+                return
+            if key in self._entries:
+                self._bytes -= self._sizes[key]
+                self._entries.move_to_end(key)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        word: Hashable,
+        compute: Callable[[], Any],
+        version: Optional[int] = None,
+    ):
+        """Lire une entrée ou la calculer puis la mettre en cache"""
+        missing = object()
+        value = self.get(namespace, word, missing, version)
+        if value is missing:
+            value = compute()
+            self.put(namespace, word, value, version)
+        return value
+
+    def set_version(self, version: int):
+        """Changer de version du dictionnaire: toutes les entrées sont invalidées"""
+        with self._lock:
+            self.version = version
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Compteurs exposés via /stats"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "memory_bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "dictionary_version": self.version,
+        }
@@ -0,0 +1,146 @@
+"""
+Index de suppressions symétriques (algorithme SymSpell)
+Suggestions orthographiques en temps quasi constant par mot
+
+Principe: on précalcule, pour chaque mot du dictionnaire, toutes les variantes
+obtenues en supprimant 1 à N caractères. À la recherche, on génère les
+suppressions du mot mal orthographié et on ne vérifie la distance d'édition
+que sur les candidats qui partagent une suppression.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from rapidfuzz import fuzz
+from rapidfuzz.distance import Levenshtein
+
+# Distance d'édition maximale indexée
+DEFAULT_MAX_DISTANCE = 2
+
+# Seuls les N premiers caractères sont indexés (borne la mémoire de l'index)
+DEFAULT_PREFIX_LENGTH = 7
+
+
+def generate_deletes(word: str, max_distance: int) -> Set[str]:
+    """Toutes les variantes obtenues en supprimant jusqu'à max_distance caractères"""
+    deletes = set()
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for candidate in frontier:
+            # Jusqu'à la chaîne vide: un mot d'une lettre partage "" avec tout
+            # mot d'une ou deux lettres (substitution, distance <= 2)
+            for i in range(len(candidate)):
+                deleted = candidate[:i] + candidate[i + 1 :]
+                if deleted not in deletes:
+                    deletes.add(deleted)
+                    next_frontier.add(deleted)
+        frontier = next_frontier
+    return deletes
+
+
+class SymSpellIndex:
+    """Index de suppressions construit une seule fois au chargement du dictionnaire"""
+
+    def __init__(
+        self,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+    ):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        # Suppression -> identifiants des mots; vocabulary et frequencies sont
+        # indexés par identifiant (vues du fichier binaire avec from_ids)
+        self.deletes: Dict[str, List[int]] = {}
+        self.vocabulary: Sequence[str] = []
+        self.frequencies: Sequence[int] = []
+
+    @classmethod
+    def build(
+        cls,
+        words: Iterable[str],
+        frequencies: Optional[Dict[str, int]] = None,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+    ) -> "SymSpellIndex":
+        """Construire l'index depuis le dictionnaire et les fréquences"""
+        vocabulary = sorted(set(words))
+        frequencies = frequencies or {}
+        return cls.from_ids(
+            vocabulary,
+            [frequencies.get(word, 0) for word in vocabulary],
+            range(len(vocabulary)),
+            max_distance=max_distance,
+            prefix_length=prefix_length,
+        )
+
+    @classmethod
+    def from_ids(
+        cls,
+        vocabulary: Sequence[str],
+        frequencies: Sequence[int],
+        word_ids: Iterable[int],
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+    ) -> "SymSpellIndex":
+        """
+        Construire l'index sur des identifiants existants (mots distincts)
+        vocabulary / frequencies: identifiant -> mot / fréquence, non copiés
+        """
+        index = cls(max_distance=max_distance, prefix_length=prefix_length)
+        index.vocabulary = vocabulary
+        index.frequencies = frequencies
+        for word_id in word_ids:
+            index._add(word_id, vocabulary[word_id])
+        return index
+
+    def _add(self, word_id: int, word: str):
+        """Indexer un mot et toutes ses suppressions"""
+        key = word[: self.prefix_length]
+        self.deletes.setdefault(key, []).append(word_id)
+        for deleted in generate_deletes(key, self.max_distance):
+            self.deletes.setdefault(deleted, []).append(word_id)
+
+    def candidates(self, word: str) -> Set[int]:
+        """Identifiants des mots partageant une suppression avec le mot donné"""
+        key = word[: self.prefix_length]
+        found = set(self.deletes.get(key, ()))
+        for deleted in generate_deletes(key, self.max_distance):
+            found.update(self.deletes.get(deleted, ()))
+        return found
+
+    def lookup(
+        self, word: str, limit: int = 5, rerank: bool = False
+    ) -> List[Tuple[str, float, int]]:
+        """
+        Suggestions pour un mot: liste de (mot, score, distance)
+        - Tri par défaut: distance croissante puis fréquence décroissante
+        - rerank=True: tri par score rapidfuzz (fuzz.ratio) sur les seuls candidats
+        """
+        if not word:
+            return []
+        # (identifiant, score, distance), mots lus seulement pour les candidats
+        scored = []
+        for word_id in sorted(self.candidates(word)):
+            candidate = self.vocabulary[word_id]
+            if abs(len(candidate) - len(word)) > self.max_distance:
+                continue
+            distance = Levenshtein.distance(
+                word, candidate, score_cutoff=self.max_distance
+            )
+            if distance > self.max_distance:
+                continue
+            scored.append((word_id, fuzz.ratio(word, candidate), distance))
+
+        frequencies = self.frequencies
+        if rerank:
+            scored.sort(key=lambda s: (-s[1], -frequencies[s[0]]))
+        else:
+            scored.sort(key=lambda s: (s[2], -frequencies[s[0]], -s[1]))
+
+        return [
+            (self.vocabulary[word_id], score, distance)
+            for word_id, score, distance in scored[:limit]
+        ]
+
+    def __len__(self):
+        return len(self.deletes)
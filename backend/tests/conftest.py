@@ -0,0 +1,126 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+# Les modules du backend sont importés à plat (comme par uvicorn main:app)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+WORDS = (
+    "ny fianakaviana trano tsara lehibe manoratra mandeha sakafo vary razana".split()
+)
+
+
+class FakeMediaWiki:
+    """
+    API MediaWiki locale: list=random, prop=info et prop=extracts. Comme
+    TextExtracts sans exintro, une réponse ne contient qu'un extrait complet
+    (les suivants via "continue")
+    """
+
+    def __init__(self, pages=200, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.revision_bump = set()
+        # Articles dont l'extrait échoue (404, sans nouvelle tentative)
+        self.failing_pages = set()
+        self.aliases = {}
+        self.requests = {"random": 0, "info": 0, "extracts": 0}
+        self.in_flight = self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}/w/api.php"
+
+    def text(self, page_id):
+        # aliases: articles au texte identique à celui d'un autre
+        rng = random.Random(self.aliases.get(page_id, page_id))
+        return " ".join(rng.choice(WORDS) for _ in range(40))
+
+    def random_ids(self, number, limit):
+        """Réponse à la number-ième requête list=random: reproductible"""
+        return random.Random(number).sample(range(1, self.pages + 1), limit)
+
+    def _respond(self, query, number):
+        if query.get("list") == "random":
+            sample = self.random_ids(number, int(query["rnlimit"]))
+            return {"query": {"random": [{"id": i, "title": f"t{i}"} for i in sample]}}
+
+        ids = query["pageids"].split("|")
+        if query.get("prop") == "info":
+            return {
+                "query": {
+                    "pages": {
+                        i: {
+                            "pageid": int(i),
+                            "lastrevid": int(i) * 10 + (int(i) in self.revision_bump),
+                        }
+                        for i in ids
+                    }
+                }
+            }
+
+        offset = int(query.get("excontinue", 0))
+        pages = {i: {"pageid": int(i), "title": f"t{i}"} for i in ids}
+        pages[ids[offset]]["extract"] = self.text(int(ids[offset]))
+        body = {"query": {"pages": pages}}
+        if offset + 1 < len(ids):
+            body["continue"] = {"excontinue": offset + 1, "continue": "||"}
+        return body
+
+    def _handler(self):
+        wiki = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = {
+                    k: v[0] for k, v in parse_qs(urlsplit(self.path).query).items()
+                }
+                kind = "random" if "list" in query else query.get("prop")
+                with wiki._lock:
+                    wiki.requests[kind] += 1
+                    number = wiki.requests[kind]
+                    failing = (
+                        kind == "extracts"
+                        and int(query["pageids"]) in wiki.failing_pages
+                    )
+                    wiki.in_flight += 1
+                    wiki.max_in_flight = max(wiki.max_in_flight, wiki.in_flight)
+                time.sleep(wiki.delay)
+                with wiki._lock:
+                    wiki.in_flight -= 1
+                if failing:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                data = json.dumps(wiki._respond(query, number)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def mediawiki():
+    wiki = FakeMediaWiki().start()
+    yield wiki
+    wiki.stop()
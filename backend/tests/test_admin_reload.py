@@ -0,0 +1,69 @@
+import gc
+import os
+import signal
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from data_snapshot import RELOAD_MARKER, data_files_signature
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    # Données de base uniquement; data/ (et le marqueur) dans un répertoire
+    # temporaire. L'instantané et le dernier rapport sont restaurés ensuite
+    build = main.build_linguistic_data
+    monkeypatch.setattr(
+        main, "build_linguistic_data", lambda: build(include_files=False)
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "DATA", main.DATA)
+    monkeypatch.setattr(main, "LAST_RELOAD", {})
+    monkeypatch.setattr(main, "ADMIN_TOKEN", None)
+    return TestClient(main.app)
+
+
+def test_reload_without_master_reports_a_single_worker(server, monkeypatch):
+    monkeypatch.setattr(main, "DATA_WATCH_SECONDS", 0)
+    previous = main.DATA.version
+
+    response = server.post("/admin/reload")
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["scope"] == "worker"
+    assert report["pid"] == os.getpid()
+    assert report["other_workers"] == "not_notified"
+    assert report["previous_version"] == previous
+    assert main.DATA.version == report["version"] > previous
+    # Les autres workers voient la signature de data/ changer
+    assert RELOAD_MARKER in {name for name, _, _ in data_files_signature()}
+
+
+def test_reload_under_preload_is_delegated_to_the_master(server, monkeypatch):
+    signals = []
+    monkeypatch.setattr(main, "PRELOAD_DATA", True)
+    monkeypatch.setenv("DATA_RELOAD_MASTER_PID", "4242")
+    monkeypatch.setattr(os, "kill", lambda pid, sig: signals.append((pid, sig)))
+    previous = main.DATA
+
+    response = server.post("/admin/reload")
+
+    assert response.status_code == 202
+    assert response.json()["scope"] == "all_workers"
+    assert signals == [(4242, signal.SIGHUP)]
+    assert main.DATA is previous
+
+
+def test_master_reload_shares_the_new_snapshot(server, monkeypatch):
+    monkeypatch.setattr(main, "PRELOAD_DATA", True)
+    previous = main.DATA.version
+    try:
+        main.reload_shared_data()
+    finally:
+        gc.unfreeze()
+
+    assert main.DATA.version > previous
+    assert main.DATA.binary_store is not None
+    assert main.LAST_RELOAD["trigger"] == "master"
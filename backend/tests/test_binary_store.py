@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from binary_store import BinaryStore, write_binary_store
+from completion import PrefixTrie
+from ngram_model import NgramModel, count_ngrams
+from ranking import FrequencyRanking
+from symspell import SymSpellIndex
+
+VOCABULARY = ["mandeha", "ny", "trano", "tsara", "vary", "rano", "é", "àla", "zanaka"]
+
+
+@pytest.fixture(scope="module")
+def model_and_counts():
+    rng = random.Random(1)
+    streams = [
+        [rng.choice(VOCABULARY) for _ in range(rng.randint(3, 30))] for _ in range(300)
+    ]
+    unigrams, bigrams, trigrams = count_ngrams(streams)
+    return NgramModel.from_counts(unigrams, bigrams, trigrams, min_count=2), unigrams
+
+
+@pytest.fixture(params=[False, True], ids=["mmap", "word_index"])
+def store(request, tmp_path, model_and_counts):
+    model, unigrams = model_and_counts
+    path = tmp_path / "data.bin"
+    write_binary_store(str(path), set(VOCABULARY[:6]), dict(unigrams), model)
+    store = BinaryStore(str(path), word_index=request.param)
+    yield store
+    store.close()
+
+
+def test_lexicon_and_frequencies(store, model_and_counts):
+    _, unigrams = model_and_counts
+    assert set(store.dictionary) == set(VOCABULARY[:6])
+    assert "zanaka" not in store.dictionary and "zz" not in store.dictionary
+    assert dict(store.frequencies.items()) == dict(unigrams)
+
+
+def test_binary_model_predicts_like_in_memory_model(store, model_and_counts):
+    model, _ = model_and_counts
+    binary_model = store.ngram_model()
+    for context in [[], ["ny"], ["ny", "trano"], ["zz", "ny"], ["mandeha", "é"]]:
+        for prefix in ["", "m", "t", "ny", "à", "zz"]:
+            expected = model.predict(context, 5, prefix)
+            assert binary_model.predict(context, 5, prefix) == pytest.approx(expected)
+        for word in VOCABULARY:
+            assert binary_model.score_word(word, context) == pytest.approx(
+                model.score_word(word, context)
+            )
+
+
+def test_bigram_lists_length_counts_contexts(store):
+    bigram_lists = store.bigram_lists()
+    assert len(bigram_lists) == len(list(bigram_lists)) > 0
+    for word in bigram_lists:
+        assert bigram_lists[word]
+
+
+def test_indexes_on_store_ids_match_in_memory_indexes(store, model_and_counts):
+    _, unigrams = model_and_counts
+    dictionary, frequencies = set(VOCABULARY[:6]), dict(unigrams)
+    counts = store.sections["frequencies"]
+
+    ranking = FrequencyRanking(frequencies)
+    binary_ranking = FrequencyRanking.from_ids(
+        store.vocabulary, counts, store.ranked_ids(), store.word_ids
+    )
+    assert len(binary_ranking) == len(ranking)
+    assert binary_ranking.top(20) == ranking.top(20)
+    assert binary_ranking.top_with_prefix("t", 3) == ranking.top_with_prefix("t", 3)
+    assert binary_ranking.top_among(VOCABULARY[::2], 3) == ranking.top_among(
+        VOCABULARY[::2], 3
+    )
+
+    spell_index = SymSpellIndex.build(dictionary, frequencies)
+    binary_index = SymSpellIndex.from_ids(
+        store.vocabulary, counts, store.dictionary_ids()
+    )
+    for word in ["mandha", "trno", "tsra", "ni", "zanaka"]:
+        assert binary_index.lookup(word) == spell_index.lookup(word)
+
+    trie = PrefixTrie.build(dictionary, frequencies, top_k=3)
+    binary_trie = PrefixTrie.from_ids(
+        store.vocabulary, counts, store.dictionary_ids(), top_k=3
+    )
+    for prefix in ["", "t", "tr", "zz"]:
+        assert binary_trie.complete(prefix, 2) == trie.complete(prefix, 2)
+        assert binary_trie.complete(prefix, 10) == trie.complete(prefix, 10)
+    assert "trano" in binary_trie and "zanaka" not in binary_trie
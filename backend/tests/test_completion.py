@@ -0,0 +1,60 @@
+import asyncio
+import random
+
+import main
+from completion import PrefixTrie
+
+
+def test_complete_matches_brute_force_ranking():
+    rng = random.Random(0)
+    words = {
+        "".join(rng.choice("abmnst") for _ in range(rng.randint(1, 6)))
+        for _ in range(500)
+    }
+    frequencies = {word: rng.randint(0, 50) for word in words}
+    trie = PrefixTrie.build(words, frequencies, top_k=8)
+
+    for prefix in ["", "a", "ma", "mna", "zz"]:
+        for limit in [1, 8, 30]:
+            expected = sorted(
+                (word for word in words if word.startswith(prefix)),
+                key=lambda word: (-frequencies[word], len(word), word),
+            )[:limit]
+            assert trie.complete(prefix, limit) == expected
+
+
+def test_autocomplete_limit_is_served_from_precomputed_top(monkeypatch):
+    def no_walk(node):
+        raise AssertionError("parcours du sous-arbre")
+
+    monkeypatch.setattr(main.DATA.completion_trie, "_iter_words", no_walk)
+    result = asyncio.run(
+        main.autocomplete(main.AutocompleteInput(context="ma", limit=1000))
+    )
+    assert len(result["suggestions"]) <= main.AUTOCOMPLETE_MAX_LIMIT
+
+
+def autocomplete(context, limit=5):
+    return asyncio.run(
+        main.autocomplete(main.AutocompleteInput(context=context, limit=limit))
+    )
+
+
+def test_trailing_hyphen_is_part_of_the_word():
+    result = autocomplete("Aman-")
+    assert result["mode"] == "completion"
+    assert result["prefix"] == "aman-"
+    assert result["last_word"] is None
+    assert result["suggestions"] == ["aman-dreny"]
+
+    # Aucun composé trano-...: pas de complétion de "trano" lui-même
+    result = autocomplete("ny trano-")
+    assert (result["mode"], result["prefix"]) == ("completion", "trano-")
+    assert result["suggestions"] == []
+
+
+def test_lone_hyphen_predicts_the_next_word():
+    result = autocomplete("ny -")
+    assert result["mode"] == "next_word"
+    assert result["last_word"] == "ny"
+    assert result["suggestions"] == autocomplete("ny ")["suggestions"]
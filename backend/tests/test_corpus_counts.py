@@ -0,0 +1,94 @@
+import random
+from collections import Counter
+
+import pytest
+
+import corpus_counts
+from corpus_counts import SpillingCounter
+from ngram_model import NgramModel, count_ngrams
+from scraper import MalagasyScraper, tokenize_article
+
+WORDS = [
+    "ny",
+    "trano",
+    "tsara",
+    "vary",
+    "mandeha",
+    "rano",
+    "lehibe",
+    "sakafo",
+    "zanaka",
+]
+
+
+@pytest.fixture
+def articles():
+    rng = random.Random(3)
+    return [
+        ". ".join(" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(5))
+        for _ in range(300)
+    ]
+
+
+def test_spilled_counts_merge_to_exact_counts(tmp_path, monkeypatch):
+    # Fusions intermédiaires (compactage) dès quelques runs
+    monkeypatch.setattr(corpus_counts, "MERGE_FAN_IN", 3)
+    rng = random.Random(0)
+    counter = SpillingCounter("bigrams", str(tmp_path), max_entries=20)
+    expected = Counter()
+    for _ in range(200):
+        batch = Counter(
+            (rng.choice(WORDS), rng.choice(WORDS)) for _ in range(rng.randint(1, 30))
+        )
+        counter.update(batch)
+        expected.update(batch)
+
+    assert counter.spills > 3 and len(counter.runs) < 3
+    items = list(counter.items())
+    assert dict(items) == dict(expected)
+    assert [key for key, _ in items] == sorted(expected, key=" ".join)
+
+    counter.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_streaming_scraper_builds_the_in_memory_model(articles):
+    scraper = MalagasyScraper(store_path=None, spill_entries=50, dedup_threshold=0)
+    scraper.ingest(iter(articles))
+    scraper.process_corpus()
+    assert scraper.bigram_counts.spills > 0
+
+    unigrams, bigrams, trigrams = count_ngrams(tokenize_article(a) for a in articles)
+    assert scraper.word_frequencies == unigrams
+    assert dict(scraper.bigram_counts.items()) == dict(bigrams)
+    assert dict(scraper.trigram_counts.items()) == dict(trigrams)
+    assert (
+        scraper.build_ngram_model().to_dict()
+        == NgramModel.from_counts(unigrams, bigrams, trigrams).to_dict()
+    )
+
+
+def test_counting_pool_is_shared_by_all_batches(articles, monkeypatch):
+    import scraper as scraper_module
+
+    pools = []
+
+    class RecordingPool(scraper_module.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(scraper_module, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(scraper_module, "INGEST_BATCH_ARTICLES", 100)
+    monkeypatch.setattr(scraper_module, "PARALLEL_MIN_ARTICLES", 10)
+    scraper = MalagasyScraper(workers=2, store_path=None, dedup_threshold=0)
+    scraper.ingest(iter(articles))
+    assert len(pools) == 1 and scraper._pool is pools[0]
+    assert pools[0]._mp_context.get_start_method() != "fork"
+
+    scraper.process_corpus()
+    assert scraper._pool is None and pools[0]._shutdown_thread
+    assert (
+        scraper.word_frequencies
+        == count_ngrams(tokenize_article(a) for a in articles)[0]
+    )
@@ -0,0 +1,68 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from count_sketch import CountMinSketch, SketchCounter
+
+WORDS = [f"w{i}" for i in range(400)]
+
+
+def zipf_bigrams(seed, batches=30):
+    """Lots de bigrammes, fréquences zipfiennes (quelques contextes dominants)"""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(WORDS))]
+    for _ in range(batches):
+        tokens = rng.choices(WORDS, weights, k=500)
+        yield Counter(zip(tokens, tokens[1:]))
+
+
+@pytest.mark.parametrize("conservative", [True, False])
+def test_sketch_never_underestimates(conservative):
+    sketch = CountMinSketch(width=256, depth=4, conservative=conservative)
+    exact = Counter()
+    for batch in zipf_bigrams(0):
+        keys = list(batch)
+        sketch.update(keys, np.array([batch[k] for k in keys]))
+        exact.update(batch)
+
+    keys = list(exact)
+    estimates = sketch.estimate(keys)
+    assert all(estimate >= exact[key] for key, estimate in zip(keys, estimates))
+    assert sketch.total == sum(exact.values())
+
+
+@pytest.mark.parametrize("width", [1 << 8, 1 << 14])
+def test_counter_estimates_bound_exact_counts_and_keeps_heavy_hitters(width):
+    unigrams = Counter()
+    exact = Counter()
+    counter = SketchCounter(
+        width=width,
+        depth=4,
+        top_k=5,
+        context_counts=lambda contexts: [unigrams[c[0]] for c in contexts],
+    )
+    for batch in zipf_bigrams(1):
+        for (first, _), count in batch.items():
+            unigrams[first] += count
+        exact.update(batch)
+        counter.update(batch)
+
+    tracked = dict(counter.items())
+    assert tracked
+    assert all(estimate >= exact[ngram] for ngram, estimate in tracked.items())
+    assert all(len(top) <= 5 for top in counter.heavy_hitters.values())
+
+    # Les successeurs les plus fréquents des contextes fréquents sont gardés
+    for context in ["w0", "w1", "w2"]:
+        successors = Counter({b: c for (a, b), c in exact.items() if a == context})
+        heaviest, _ = successors.most_common(1)[0]
+        assert (context, heaviest) in tracked
+
+
+def test_counter_skips_ngrams_below_min_count():
+    counter = SketchCounter(width=1 << 12, depth=4, min_count=2)
+    counter.update(Counter({("ny", "trano"): 1, ("ny", "vary"): 3}))
+    assert dict(counter.items()) == {("ny", "vary"): 3}
+    assert counter.context_total("ny") == 4
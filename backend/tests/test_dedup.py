@@ -0,0 +1,91 @@
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+import scraper
+from dedup import MinHasher, NearDuplicateDetector
+
+WORDS = [a + b + "na" for a in "bdfhkl" for b in "aeiou"]
+
+
+def random_text(rng, length=60):
+    return [rng.choice(WORDS) for _ in range(length)]
+
+
+def test_exact_and_near_duplicates_are_dropped():
+    rng = random.Random(0)
+    detector = NearDuplicateDetector(threshold=0.8)
+    original = random_text(rng, 200)
+    near = list(original)
+    near[100] = "hafa"
+
+    assert not detector.is_duplicate(original)
+    assert detector.is_duplicate(original)
+    assert detector.is_duplicate(near)
+    assert not detector.is_duplicate(random_text(rng, 200))
+    assert detector.stats["exact_duplicates"] == 1
+    assert detector.stats["near_duplicates"] == 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_candidates_include_every_document_of_a_bucket(seed):
+    # Une ligne par bande et des shingles d'un mot: chaque bucket est partagé
+    # par beaucoup de documents distincts, le quasi-doublon du dernier indexé
+    # doit rester candidat
+    rng = random.Random(seed)
+    detector = NearDuplicateDetector(
+        threshold=0.8, num_perm=32, bands=32, shingle_size=1
+    )
+    texts = [random_text(rng, 30) for _ in range(80)]
+    indexed = [text for text in texts if not detector.is_duplicate(text)]
+    near = list(indexed[-1])
+    near[15] = "hafa"
+    assert detector.is_duplicate(near)
+
+
+def test_sketch_does_not_depend_on_the_process_hash_seed():
+    # Les signatures viennent des workers du comptage: elles doivent être
+    # identiques d'un processus à l'autre (graines de hash() différentes)
+    code = (
+        "from dedup import MinHasher; "
+        "f, s = MinHasher().sketch('ny trano tsara be dia be'.split()); "
+        "print(f, s.tolist())"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            cwd=scraper.__file__.rsplit("/", 1)[0],
+        ).stdout
+        for seed in (1, 2)
+    }
+    fingerprint, signature = MinHasher().sketch("ny trano tsara be dia be".split())
+    assert outputs == {f"{fingerprint} {signature.tolist()}\n"}
+
+
+def test_ingest_tokenizes_each_article_once(monkeypatch):
+    calls = []
+
+    def counting_tokenize(text):
+        calls.append(text)
+        return tokenize(text)
+
+    tokenize = scraper.tokenize
+    monkeypatch.setattr(scraper, "tokenize", counting_tokenize)
+    rng = random.Random(3)
+    texts = [" ".join(random_text(rng, 40)) for _ in range(20)]
+    texts += texts[:5]
+
+    corpus = scraper.MalagasyScraper(workers=1, store_path=None)
+    corpus.ingest(texts)
+    corpus.process_corpus()
+
+    assert sorted(calls) == sorted(texts)
+    assert corpus.article_count == 20
+    assert corpus.deduplicator.stats["exact_duplicates"] == 5
@@ -0,0 +1,126 @@
+import asyncio
+import random
+
+import pytest
+
+import main
+from document_store import EMBED_PLACEHOLDER, apply_delta
+from tokenizer import iter_tokens
+
+ALPHABET = list("abdefghijklmnoprstvyz -'\n1ç")
+
+
+def check(**fields):
+    return asyncio.run(
+        main.spell_check_incremental(main.IncrementalSpellCheckInput(**fields))
+    )
+
+
+def full_check(text):
+    result = asyncio.run(main.spell_check(main.SpellCheckInput(text=text)))
+    return [
+        (r["word"], r["start"], r["end"], r["is_correct"]) for r in result["results"]
+    ]
+
+
+def merge(previous, response):
+    """Même fusion que mergeSpellCheckResults côté client"""
+    start, end = response["token_range"]["start"], response["token_range"]["end"]
+    shift = response["shift"]
+    shifted = [
+        {**r, "start": r["start"] + shift, "end": r["end"] + shift}
+        for r in previous[end:]
+    ]
+    return previous[:start] + response["results"] + shifted
+
+
+def random_edit(rng, text):
+    """Delta Quill aléatoire (insertion, suppression ou remplacement)"""
+    pos = rng.randint(0, len(text))
+    ops = [{"retain": pos}] if pos else []
+    inserted = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 4)))
+    if pos == len(text) or rng.random() < 0.4:
+        ops.append({"insert": inserted})
+        return ops, text[:pos] + inserted + text[pos:]
+    deleted = rng.randint(1, min(4, len(text) - pos))
+    ops.append({"delete": deleted})
+    if rng.random() < 0.5:
+        return ops, text[:pos] + text[pos + deleted :]
+    ops.append({"insert": inserted})
+    return ops, text[:pos] + inserted + text[pos + deleted :]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_matches_full_check_after_random_edits(seed):
+    rng = random.Random(seed)
+    words = sorted(main.DATA.dictionary)[:60] + ["tranoo", "fo-o", "amin'ny", "ab1"]
+    text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+    document_id = f"fuzz-{seed}"
+
+    response = check(document_id=document_id, text=text)
+    results = response["results"]
+    for _ in range(40):
+        ops, text = random_edit(rng, text)
+        response = check(
+            document_id=document_id, ops=ops, base_version=response["version"]
+        )
+        assert not response["resync"]
+        results = merge(results, response)
+
+        expected = full_check(text)
+        assert [
+            (r["word"], r["start"], r["end"], r["is_correct"]) for r in results
+        ] == expected
+        assert response["total_words"] == len(expected)
+        assert response["errors_found"] == sum(not ok for *_, ok in expected)
+
+
+def test_word_glued_to_digit_is_not_split():
+    response = check(document_id="digit", text="tpova ln")
+    response = check(
+        document_id="digit",
+        ops=[{"retain": 5}, {"delete": 1}, {"insert": "1"}],
+        base_version=response["version"],
+    )
+    assert list(iter_tokens("tpova1ln")) == []
+    assert response["total_words"] == 0
+
+
+def test_stale_base_version_requests_resync():
+    response = check(document_id="stale", text="ny trano")
+    response = check(document_id="stale", ops=[{"insert": "x"}], base_version=99)
+    assert response["resync"]
+
+
+def test_iter_tokens_window_does_not_cut_words():
+    assert list(iter_tokens("tpova1ln", 0, 5)) == []
+    assert list(iter_tokens("ny trano", 0, 4)) == [("ny", 0, 2), ("trano", 3, 8)]
+
+
+def test_apply_delta_reports_changed_span():
+    assert apply_delta(
+        "ny trano", [{"retain": 3}, {"delete": 5}, {"insert": "vary"}]
+    ) == (
+        "ny vary",
+        3,
+        8,
+        7,
+    )
+    assert apply_delta("ab", [{"retain": 2}]) == ("ab", 2, 2, 2)
+
+
+def test_apply_delta_counts_embed_as_one_position():
+    text, start, old_end, new_end = apply_delta(
+        "ny trano", [{"retain": 2}, {"insert": {"image": "x.png"}}, {"retain": 6}]
+    )
+    assert text == "ny" + EMBED_PLACEHOLDER + " trano"
+    assert (start, old_end, new_end) == (2, 2, 3)
+    assert [t for t, _, _ in iter_tokens(text)] == ["ny", "trano"]
+
+
+@pytest.mark.parametrize(
+    "ops", [[{"retain": 20}], [{"delete": 20}], [{"retain": 1}, {"bold": True}]]
+)
+def test_apply_delta_rejects_incompatible_ops(ops):
+    with pytest.raises(ValueError):
+        apply_delta("ny trano", ops)
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def websocket():
+    with TestClient(main.app).websocket_connect("/ws") as websocket:
+        yield websocket
+
+
+def test_spell_check_message(websocket):
+    websocket.send_json(
+        {"id": 1, "type": "spell_check", "payload": {"text": "ny tranoo"}}
+    )
+    response = websocket.receive_json()
+    assert response["id"] == 1
+    assert response["type"] == "spell_check"
+    assert response["status"] == "ok"
+    assert response["data"]["errors_found"] == 1
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "pas du json",
+        "[1, 2]",
+        '{"id": 2, "type": "inconnu"}',
+        '{"id": 2, "type": ["spell_check"]}',
+        '{"id": 2, "type": "sentiment", "payload": ["x"]}',
+        '{"id": 2, "type": "sentiment", "payload": {"text": 3}}',
+    ],
+)
+def test_invalid_message_keeps_connection_open(websocket, raw):
+    websocket.send_text(raw)
+    assert websocket.receive_json()["status"] == "error"
+
+    websocket.send_json({"id": 3, "type": "sentiment", "payload": {"text": "tsara"}})
+    response = websocket.receive_json()
+    assert (response["id"], response["status"]) == (3, "ok")
+
+
+def test_handler_error_is_reported(websocket, monkeypatch):
+    async def failing(input_data):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(main.LIVE_HANDLERS, "sentiment", (main.TextInput, failing))
+    websocket.send_json({"id": 4, "type": "sentiment", "payload": {"text": "tsara"}})
+    assert websocket.receive_json() == {
+        "id": 4,
+        "type": "sentiment",
+        "status": "error",
+        "error": "boom",
+    }
+
+
+def test_queued_messages_of_same_type_are_coalesced(monkeypatch):
+    release = threading.Event()
+    original = main.live_spell_check
+
+    async def slow(input_data):
+        await asyncio.to_thread(release.wait, 5)
+        return await original(input_data)
+
+    monkeypatch.setitem(main.LIVE_HANDLERS, "spell_check", (main.SpellCheckInput, slow))
+    with TestClient(main.app).websocket_connect("/ws") as websocket:
+        for i in range(3):
+            websocket.send_json(
+                {"id": i, "type": "spell_check", "payload": {"text": "ny"}}
+            )
+        # Un traitement est bloqué: le plus récent message en attente remplace
+        # les précédents, chaque message reçoit une seule réponse
+        first = websocket.receive_json()
+        release.set()
+        responses = [first] + [websocket.receive_json() for _ in range(2)]
+
+    statuses = {response["id"]: response["status"] for response in responses}
+    assert sorted(statuses) == [0, 1, 2]
+    assert statuses[2] == "ok"
+    assert statuses[1] == "superseded"
@@ -0,0 +1,38 @@
+import pytest
+
+import main
+from morphology import MorphologicalAnalyzer
+
+DICTIONARY = {"soratra", "ora", "asa", "hina", "tosika", "vaky"}
+
+
+@pytest.fixture
+def analyzer():
+    return MorphologicalAnalyzer(DICTIONARY, main.PREFIXES, main.SUFFIXES)
+
+
+@pytest.mark.parametrize(
+    "word, root",
+    [
+        ("manoratra", "soratra"),
+        ("nanoratra", "soratra"),
+        ("fanoratana", "soratra"),
+        ("mpanoratra", "soratra"),
+        ("miasa", "asa"),
+        ("mihinana", "hina"),
+        ("manosika", "tosika"),
+    ],
+)
+def test_root(analyzer, word, root):
+    assert analyzer.root(word) == root
+
+
+def test_short_dictionary_word_is_not_a_false_stem():
+    analyzer = MorphologicalAnalyzer({"ora"}, main.PREFIXES, main.SUFFIXES)
+    assert analyzer.root("mpanoratra") is None
+    assert analyzer.root("manoratra") is None
+
+
+def test_tense_of_verbal_prefix(analyzer):
+    assert analyzer.analyze("nanoratra")[0].tense == "passé"
+    assert analyzer.analyze("hanoratra")[0].tense == "futur"
@@ -0,0 +1,89 @@
+from collections import Counter
+
+import pytest
+
+from ngram_model import NgramModel
+
+UNIGRAMS = Counter({"ny": 10, "trano": 6, "lehibe": 4, "kely": 3, "tsara": 2})
+BIGRAMS = Counter({("ny", "trano"): 4, ("ny", "kely"): 2, ("trano", "tsara"): 1})
+TRIGRAMS = Counter({("ho", "ny", "trano"): 3})
+
+
+@pytest.fixture
+def model():
+    return NgramModel.from_counts(UNIGRAMS, BIGRAMS, TRIGRAMS, min_count=1)
+
+
+def test_predict_backs_off_from_trigram_to_bigram_to_unigram(model):
+    alpha, total = model.alpha, sum(UNIGRAMS.values())
+
+    predictions = dict(model.predict(["ho", "ny"], limit=10))
+
+    # Trigram (ho, ny) -> trano, puis bigram ny -> kely, puis unigrammes
+    assert predictions["trano"] == pytest.approx(3 / 3)
+    assert predictions["kely"] == pytest.approx(alpha * 2 / 6)
+    assert predictions["lehibe"] == pytest.approx(alpha * alpha * 4 / total)
+    assert predictions["tsara"] == pytest.approx(alpha * alpha * 2 / total)
+    for word, score in predictions.items():
+        assert model.score_word(word, ["ho", "ny"]) == pytest.approx(score)
+
+
+def test_predict_without_trigram_starts_at_the_bigram(model):
+    alpha, total = model.alpha, sum(UNIGRAMS.values())
+
+    predictions = model.predict(["ary", "ny"], limit=3)
+
+    assert predictions == [
+        ("trano", pytest.approx(4 / 6)),
+        ("kely", pytest.approx(2 / 6)),
+        ("ny", pytest.approx(alpha * 10 / total)),
+    ]
+
+
+def test_predict_unknown_context_uses_unigrams(model):
+    total = sum(UNIGRAMS.values())
+
+    predictions = model.predict(["tsy", "fantatra"], limit=3)
+
+    assert predictions == [
+        ("ny", pytest.approx(10 / total)),
+        ("trano", pytest.approx(6 / total)),
+        ("lehibe", pytest.approx(4 / total)),
+    ]
+
+
+def test_unigram_fallback_with_unsorted_vocabulary():
+    # Vocabulaire d'un fichier non rangé par fréquence: les mots rares d'abord,
+    # plus nombreux que les candidats du repli (limit * 20)
+    rare = [f"teny{i}" for i in range(30)]
+    model = NgramModel.from_dict(
+        {
+            "format": "ngram-v1",
+            "vocabulary": rare + ["trano", "ny"],
+            "unigrams": [1] * len(rare) + [50, 100],
+            "bigrams": {},
+            "trigrams": {},
+        }
+    )
+    total = len(rare) + 150
+
+    assert model.predict(["tsy"], limit=1) == [("ny", pytest.approx(100 / total))]
+    assert model.predict(["tsy"], limit=2) == [
+        ("ny", pytest.approx(100 / total)),
+        ("trano", pytest.approx(50 / total)),
+    ]
+
+
+def test_from_counts_ranks_unsorted_counters():
+    unigrams = Counter()
+    for word, count in [("tsara", 2), ("ny", 10), ("kely", 3), ("trano", 6)]:
+        unigrams[word] = count
+
+    model = NgramModel.from_counts(unigrams, Counter(), Counter())
+
+    assert [word for word, _ in model.predict([], limit=4)] == [
+        "ny",
+        "trano",
+        "kely",
+        "tsara",
+    ]
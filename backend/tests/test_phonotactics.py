@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from phonotactics import (
+    CORPUS_FILTER_MATCHER,
+    INVALID_COMBINATIONS,
+    NOISE_COMBINATIONS,
+    PHONOTACTIC_MATCHER,
+    WORD_INITIAL_ONLY,
+    PhonotacticMatcher,
+)
+from tokenizer import iter_tokens
+
+# Combinaisons interdites connues, dans des mots où elles apparaissent
+KNOWN_VIOLATIONS = [
+    ("anbary", [("nb", 1)]),
+    ("tsimkalo", [("mk", 3)]),
+    ("adtrano", [("dt", 1)]),
+    ("abpaka", [("bp", 1)]),
+    ("masza", [("sz", 2)]),
+    ("nkanto", [("nk", 0)]),
+    ("nbp", [("nb", 0), ("bp", 1)]),
+    ("sasza mkasz", [("sz", 2), ("mk", 6), ("sz", 9)]),
+]
+
+
+def reference_violations(word, combinations, word_initial_only):
+    """Recherche naïve: à chaque position, la plus longue combinaison permise"""
+    found = []
+    for position in range(len(word)):
+        allowed = [
+            combination
+            for combination in combinations
+            if word.startswith(combination, position)
+            and (position == 0 or combination not in word_initial_only)
+        ]
+        if allowed:
+            found.append((max(allowed, key=len), position))
+    return found
+
+
+@pytest.mark.parametrize("word, expected", KNOWN_VIOLATIONS)
+def test_known_invalid_clusters(word, expected):
+    assert PHONOTACTIC_MATCHER.violations(word) == expected
+    assert PHONOTACTIC_MATCHER.has_violation(word)
+
+
+@pytest.mark.parametrize("word", ["fianakaviana", "trano", "manoratra", "tsara"])
+def test_valid_words(word):
+    assert PHONOTACTIC_MATCHER.violations(word) == []
+    assert not PHONOTACTIC_MATCHER.has_violation(word)
+
+
+def test_word_initial_only_cluster_inside_a_word_is_allowed():
+    assert PHONOTACTIC_MATCHER.violations("ankoatra") == []
+    assert not PHONOTACTIC_MATCHER.has_violation("ankoatra")
+
+
+def test_corpus_filter_adds_noise_clusters():
+    for combination in NOISE_COMBINATIONS:
+        word = f"a{combination}a"
+        assert CORPUS_FILTER_MATCHER.has_violation(word)
+        assert not PHONOTACTIC_MATCHER.has_violation(word)
+
+
+@pytest.mark.parametrize(
+    "combinations, initial",
+    [
+        (INVALID_COMBINATIONS, WORD_INITIAL_ONLY),
+        (INVALID_COMBINATIONS + NOISE_COMBINATIONS, WORD_INITIAL_ONLY),
+        # Préfixes communs et longueurs différentes: la plus longue d'abord
+        (["ts", "tsk", "nt", "ntr", "a.b", "kk"], {"ntr"}),
+    ],
+)
+def test_generated_pattern_matches_a_naive_scan(combinations, initial):
+    matcher = PhonotacticMatcher(combinations, initial)
+    letters = sorted(set("".join(combinations)) | set("aeio"))
+    rng = random.Random(0)
+    for _ in range(2000):
+        word = "".join(rng.choices(letters, k=rng.randint(1, 10)))
+        expected = reference_violations(word, matcher.combinations, initial)
+        assert matcher.violations(word) == expected
+        assert matcher.has_violation(word) == bool(expected)
+
+
+def test_document_scan_matches_each_token():
+    text = "Anbary sy NKANTO, ankoatra ny masza-nbp\nMkasz tsara"
+    tokens = list(iter_tokens(text))
+
+    found = PHONOTACTIC_MATCHER.scan(text, [(start, end) for _, start, end in tokens])
+
+    assert found == {
+        index: PHONOTACTIC_MATCHER.violations(token)
+        for index, (token, _, _) in enumerate(tokens)
+        if PHONOTACTIC_MATCHER.violations(token)
+    }
+    assert set(found) == {0, 2, 5, 6}
+
+
+def test_document_scan_keeps_combinations_inside_tokens():
+    # "a.b" chevauche deux tokens: seules les combinaisons internes comptent
+    matcher = PhonotacticMatcher(["ts", "tsk", "nt", "ntr", "a.b", "kk"], {"ntr"})
+    rng = random.Random(1)
+    for _ in range(300):
+        text = "".join(rng.choices("antrskbAN .-", k=rng.randint(1, 40)))
+        tokens = list(iter_tokens(text))
+
+        found = matcher.scan(text, [(start, end) for _, start, end in tokens])
+
+        assert found == {
+            index: matcher.violations(token)
+            for index, (token, _, _) in enumerate(tokens)
+            if matcher.violations(token)
+        }
@@ -0,0 +1,79 @@
+from scraper import MalagasyScraper
+
+
+def make_scraper(mediawiki, **options):
+    options.setdefault("store_path", None)
+    options.setdefault("dedup_threshold", 0)
+    return MalagasyScraper(api_url=mediawiki.url, rate=1000, **options)
+
+
+def test_extracts_are_fetched_concurrently(mediawiki):
+    mediawiki.delay = 0.05
+    scraper = make_scraper(mediawiki)
+    scraper.scrape_wikipedia_mg(num_articles=40)
+
+    assert scraper.article_count == 40
+    # Un extrait complet par réponse: une requête par article, en parallèle
+    assert mediawiki.requests["extracts"] == 40
+    assert mediawiki.max_in_flight > 1
+
+
+def crawl(mediawiki, store_path, num_articles=120):
+    scraper = make_scraper(mediawiki, store_path=str(store_path))
+    scraper.scrape_wikipedia_mg(num_articles=num_articles)
+    return scraper
+
+
+def model_state(scraper):
+    return (
+        scraper.article_count,
+        dict(scraper.word_frequencies),
+        dict(scraper.bigram_counts.items()),
+        dict(scraper.trigram_counts.items()),
+    )
+
+
+def test_resumed_crawl_counts_like_an_uninterrupted_one(tmp_path):
+    from conftest import FakeMediaWiki
+
+    reference_wiki = FakeMediaWiki().start()
+    try:
+        reference = crawl(reference_wiki, tmp_path / "reference.sqlite3")
+    finally:
+        reference_wiki.stop()
+
+    wiki = FakeMediaWiki().start()
+    try:
+        # Interruption: un article du premier lot de 50 ne peut être lu
+        wiki.failing_pages = {wiki.random_ids(1, 50)[0]}
+        interrupted = crawl(wiki, tmp_path / "crawl.sqlite3")
+        checkpoint = interrupted.store.load_checkpoint("wikipedia_mg")
+        assert checkpoint is not None
+        assert 0 < len(checkpoint["completed"]) < len(checkpoint["page_ids"])
+        assert interrupted.article_count < reference.article_count
+
+        wiki.failing_pages = set()
+        resumed = crawl(wiki, tmp_path / "crawl.sqlite3")
+    finally:
+        wiki.stop()
+
+    assert resumed.store.load_checkpoint("wikipedia_mg") is None
+    assert model_state(resumed) == model_state(reference)
+
+
+def test_resumed_crawl_still_drops_duplicates_of_earlier_articles(tmp_path, mediawiki):
+    first_batch = mediawiki.random_ids(1, 50)
+    second_batch = mediawiki.random_ids(2, 50)
+    # Un article du lot interrompu double un article traité avant l'interruption
+    mediawiki.aliases = {first_batch[1]: second_batch[0]}
+    mediawiki.failing_pages = {first_batch[0]}
+    path = str(tmp_path / "crawl.sqlite3")
+    make_scraper(mediawiki, store_path=path, dedup_threshold=0.8).scrape_wikipedia_mg(
+        100
+    )
+
+    mediawiki.failing_pages = set()
+    resumed = make_scraper(mediawiki, store_path=path, dedup_threshold=0.8)
+    resumed.scrape_wikipedia_mg(100)
+    assert resumed.deduplicator.stats["exact_duplicates"] == 1
+    assert resumed.article_count == len(set(first_batch) | set(second_batch)) - 1
@@ -0,0 +1,78 @@
+import json
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from tokenizer import iter_tokens
+
+# Seuil au-delà duquel le frontend demande le streaming (STREAM_THRESHOLD_CHARS)
+STREAM_THRESHOLD_CHARS = 200_000
+
+WORDS = (
+    "ny aman-dreny fianakaviana tranoo tsara lehibe manoratra tamin'ny "
+    "AN'I Rakoto mandeha sakafo vary1 razana ç".split()
+)
+
+
+@pytest.fixture(scope="module")
+def document():
+    rng = random.Random(0)
+    lines = []
+    while sum(map(len, lines)) <= STREAM_THRESHOLD_CHARS:
+        words = rng.choices(WORDS, k=rng.randint(0, 400))
+        end = rng.choice(["", "-", " ", "\r"])
+        lines.append(" ".join(words) + end)
+    return "\n".join(lines)
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(main.app)
+
+
+def stream(client, text, unit):
+    payload = {"text": text, "stream": True, "stream_unit": unit}
+    with client.stream("POST", "/spell-check", json=payload) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        return [json.loads(line) for line in response.iter_lines() if line]
+
+
+def test_token_stream_matches_the_full_response(client, document):
+    full = client.post("/spell-check", json={"text": document}).json()
+
+    lines = stream(client, document, "token")
+
+    *tokens, summary = lines
+    assert all(line["type"] == "token" for line in tokens)
+    assert [{k: v for k, v in t.items() if k != "type"} for t in tokens] == full[
+        "results"
+    ]
+    assert summary["type"] == "summary"
+    assert summary["total_words"] == full["total_words"]
+    assert summary["errors_found"] == full["errors_found"]
+
+
+def test_paragraph_chunks_never_split_a_token(client, document):
+    *paragraphs, summary = stream(client, document, "paragraph")
+
+    assert len(paragraphs) > 1
+    previous_end = 0
+    results = []
+    for paragraph in paragraphs:
+        assert paragraph["type"] == "paragraph"
+        assert previous_end <= paragraph["start"] < paragraph["end"]
+        assert "\n" not in document[paragraph["start"] : paragraph["end"]]
+        previous_end = paragraph["end"]
+        for result in paragraph["results"]:
+            # Positions absolues dans le document, à l'intérieur du paragraphe
+            assert paragraph["start"] <= result["start"] < result["end"]
+            assert result["end"] <= paragraph["end"]
+            assert document[result["start"] : result["end"]].lower() == result["word"]
+            results.append((result["word"], result["start"], result["end"]))
+
+    # Aucun token coupé ni perdu à la frontière des paragraphes
+    assert results == list(iter_tokens(document))
+    assert summary["total_words"] == len(results)
@@ -0,0 +1,77 @@
+import suggestion_cache
+from suggestion_cache import SuggestionCache, estimate_size
+
+
+def test_eviction_by_entry_count_drops_least_recently_used():
+    cache = SuggestionCache(max_entries=3)
+    for word in "abc":
+        cache.put("spell", word, word.upper())
+    cache.get("spell", "a")
+    cache.put("spell", "d", "D")
+
+    assert cache.get("spell", "b") is None
+    assert [cache.get("spell", word) for word in "acd"] == ["A", "C", "D"]
+    assert cache.stats()["entries"] == 3
+    assert cache.evictions == 1
+
+
+def test_eviction_by_byte_size():
+    value = ["x" * 100] * 10
+    entry = estimate_size(("spell", "mot0", 0)) + estimate_size(value)
+    cache = SuggestionCache(max_bytes=3 * entry + entry // 2)
+    for i in range(5):
+        cache.put("spell", f"mot{i}", value)
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["memory_bytes"] <= cache.max_bytes
+    assert cache.evictions == 2
+    assert cache.get("spell", "mot0") is None
+    assert cache.get("spell", "mot4") == value
+
+
+def test_value_larger_than_the_cache_is_not_stored():
+    cache = SuggestionCache(max_bytes=100)
+    cache.put("spell", "mot", "x" * 1000)
+    assert cache.get("spell", "mot") is None
+    assert cache.stats()["memory_bytes"] == 0
+
+
+def test_version_bump_invalidates_entries():
+    cache = SuggestionCache()
+    cache.put("spell", "mot", ["suggestion"])
+    cache.set_version(1)
+
+    assert cache.get("spell", "mot") is None
+    stats = cache.stats()
+    assert stats["entries"] == 0
+    assert stats["memory_bytes"] == 0
+    assert stats["invalidations"] == 1
+    assert stats["dictionary_version"] == 1
+
+
+def test_stale_version_put_is_dropped():
+    cache = SuggestionCache()
+    cache.set_version(2)
+    cache.put("spell", "mot", ["ancien"], version=1)
+
+    assert cache.get("spell", "mot") is None
+    assert cache.get("spell", "mot", version=1) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_version_bump_during_put_drops_the_stale_value(monkeypatch):
+    cache = SuggestionCache()
+
+    def estimate_during_reload(value):
+        # Rechargement du dictionnaire entre l'appel à put et l'insertion
+        if cache.version == 0:
+            cache.set_version(1)
+        return estimate_size(value)
+
+    monkeypatch.setattr(suggestion_cache, "estimate_size", estimate_during_reload)
+    cache.put("spell", "mot", ["ancien"])
+
+    assert cache.get("spell", "mot") is None
+    assert cache.get("spell", "mot", version=0) is None
+    assert cache.stats()["entries"] == 0
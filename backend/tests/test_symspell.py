@@ -0,0 +1,96 @@
+import random
+
+import pytest
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
+
+from symspell import SymSpellIndex
+
+LETTERS = "abmnst"
+
+
+@pytest.fixture(scope="module")
+def vocabulary():
+    # Mots d'une à douze lettres: au-delà du préfixe indexé (7) et en dessous
+    rng = random.Random(0)
+    words = {
+        "".join(rng.choice(LETTERS) for _ in range(rng.randint(1, 12)))
+        for _ in range(3000)
+    }
+    return {word: rng.randint(1, 50) for word in words}
+
+
+@pytest.fixture(scope="module")
+def index(vocabulary):
+    return SymSpellIndex.build(vocabulary, vocabulary)
+
+
+def misspell(rng, word, edits):
+    letters = list(word)
+    for _ in range(edits):
+        position = rng.randint(0, len(letters))
+        operation = rng.choice("isd" if letters else "i")
+        if operation == "i":
+            letters.insert(position, rng.choice(LETTERS + "z"))
+        elif operation == "s":
+            letters[min(position, len(letters) - 1)] = rng.choice(LETTERS + "z")
+        else:
+            del letters[min(position, len(letters) - 1)]
+    return "".join(letters)
+
+
+def scan(word, vocabulary, max_distance=2):
+    """Ancien parcours complet du dictionnaire: (mot, distance)"""
+    distances = {
+        candidate: Levenshtein.distance(word, candidate) for candidate in vocabulary
+    }
+    return {(w, d) for w, d in distances.items() if d <= max_distance}
+
+
+@pytest.mark.parametrize("edits", [1, 2])
+def test_lookup_finds_every_word_the_full_scan_finds(index, vocabulary, edits):
+    rng = random.Random(edits)
+    words = sorted(vocabulary)
+    for _ in range(300):
+        typo = misspell(rng, rng.choice(words), edits)
+        if not typo:
+            continue
+        found = index.lookup(typo, limit=len(vocabulary))
+        assert {(word, distance) for word, _, distance in found} == scan(
+            typo, vocabulary
+        )
+        # Tri par défaut: distance, puis fréquence décroissante
+        keys = [(distance, -vocabulary[word]) for word, _, distance in found]
+        assert keys == sorted(keys)
+
+
+def test_reranked_scores_match_the_fuzzy_scan(index, vocabulary):
+    rng = random.Random(7)
+    words = sorted(vocabulary)
+    for _ in range(100):
+        typo = misspell(rng, rng.choice(words), rng.randint(1, 2))
+        if not typo:
+            continue
+        near = [word for word, _ in scan(typo, vocabulary)]
+        expected = process.extract(typo, near, scorer=fuzz.ratio, limit=5)
+        found = index.lookup(typo, limit=5, rerank=True)
+        assert [score for _, score, _ in found] == pytest.approx(
+            [score for _, score, _ in expected]
+        )
+
+
+def test_empty_input_has_no_suggestion(index):
+    assert index.lookup("") == []
+
+
+def test_very_long_input(index, vocabulary):
+    long_word = "mandehanatsaratokoa" * 10
+    words = dict(vocabulary, **{long_word: 1})
+    long_index = SymSpellIndex.build(words, words)
+
+    # Seuls les premiers caractères sont indexés: la recherche reste bornée,
+    # la distance est vérifiée sur le mot entier
+    assert long_index.lookup(long_word[:-1] + "z")[0][:3:2] == (long_word, 1)
+    assert long_index.lookup("z" + long_word[1:])[0][:3:2] == (long_word, 1)
+    assert long_index.lookup(long_word[:100]) == []
+    assert index.lookup("z" * 500) == []
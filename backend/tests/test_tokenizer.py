@@ -0,0 +1,57 @@
+import pytest
+
+from tokenizer import is_token, iter_tokens, tokenize
+
+TEXTS = [
+    "Ny aman-dreny sy ny zanaka",
+    "-trano- lehibe-- --kely",
+    "Nandeha tamin'ny fiara izy, tamin’ny alina AN'I Rakoto",
+    "MADAGASIKARA Antananarivo FIANARANTSOA",
+    "Ny Aman-Dreny SY ny AMIN'NY fianakaviana-",
+    "tpova1ln ça rano2 ñy ary ny ankizy",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_offsets_round_trip(text):
+    tokens = list(iter_tokens(text))
+
+    assert tokens
+    for token, start, end in tokens:
+        assert text[start:end].lower() == token
+        assert is_token(text[start:end])
+    # Mêmes tokens que la tokenisation sans positions
+    assert [token for token, _, _ in tokens] == tokenize(text)
+
+
+def test_hyphens_apostrophes_and_uppercase():
+    text = "-Aman-Dreny- AMIN'NY an’i"
+
+    assert list(iter_tokens(text)) == [
+        ("aman-dreny", 1, 11),
+        ("amin", 13, 17),
+        ("ny", 18, 20),
+        ("an", 21, 23),
+        ("i", 24, 25),
+    ]
+
+
+def test_window_yields_tokens_starting_inside_it():
+    text = "Ny TRANO lehibe sy aman-dreny"
+    everything = list(iter_tokens(text))
+
+    for start in range(len(text) + 1):
+        for end in range(start, len(text) + 1):
+            expected = [t for t in everything if start <= t[1] < end]
+            assert list(iter_tokens(text, start, end)) == expected
+
+
+def test_window_keeps_whole_tokens():
+    text = "Ny TRANO lehibe"
+
+    # Un token commencé dans la fenêtre est rendu en entier, au-delà de end
+    assert list(iter_tokens(text, 3, 4)) == [("trano", 3, 8)]
+    # Une fenêtre ouverte au milieu d'un mot ne produit pas de morceau
+    assert list(iter_tokens(text, 4, 9)) == []
+    assert list(iter_tokens(text, 5, len(text))) == [("lehibe", 9, 15)]
+    assert list(iter_tokens(text, 3, 3)) == []
@@ -0,0 +1,73 @@
+"""
+Tokenisation malagasy partagée par l'API et le scraper
+
+Une seule expression régulière compilée, sans nettoyage préalable du texte:
+- iter_tokens: générateur (token, début, fin), parcours du texte d'origine
+  (aucune copie), positions directement utilisables par l'éditeur
+- tokenize: liste des tokens en minuscules (une passe sur le texte en
+  minuscules: str.lower en C coûte moins que la conversion token par token)
+- is_token: une chaîne isolée (titre, lien) forme-t-elle exactement un token
+
+Un token est une suite de lettres malagasy et de traits d'union internes
+(aman-dreny). L'apostrophe des contractions (amin'ny, an'i,
+tamin’ny) sépare deux tokens, chacun avec ses propres positions: "amin" puis
+"ny", comme dans le dictionnaire et le modèle N-gram. Un mot collé à un
+chiffre ou à une lettre étrangère (ç, ñ...) n'est pas découpé en morceaux.
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple
+
+LETTERS = "a-zàáâèéêìíîòóôùúû"
+
+# Majuscules explicites: re.IGNORECASE sur une classe Unicode est bien plus lent
+_TOKEN_CLASS = f"[{LETTERS}{LETTERS.upper()}-]"
+
+# \b aux deux extrémités: pas de trait d'union en début ou en fin de token
+TOKEN_PATTERN = re.compile(rf"\b{_TOKEN_CLASS}+\b")
+
+# Même motif sur un texte déjà en minuscules (classe plus petite)
+_LOWER_TOKEN_PATTERN = re.compile(rf"\b[{LETTERS}-]+\b")
+
+# Caractère pouvant appartenir à un token
+TOKEN_CHAR = re.compile(_TOKEN_CLASS)
+
+# Mot en cours de frappe en fin de texte, trait d'union final compris
+# (autocomplétion: "ny aman-" complète aman-dreny, "ny -" n'est pas un mot)
+TRAILING_WORD = re.compile(rf"\b{_TOKEN_CLASS}+\Z")
+
+# Caractère que \b traite comme partie d'un mot (chiffres, lettres étrangères
+# compris): une zone modifiée est étendue sur ces caractères, sinon un mot
+# collé à un chiffre pourrait y être découpé en token
+WORD_CHAR = re.compile(r"[\w-]")
+
+
+def iter_tokens(
+    text: str, start: int = 0, end: Optional[int] = None
+) -> Iterator[Tuple[str, int, int]]:
+    """
+    Génère (token en minuscules, début, fin) des tokens qui commencent dans
+    text[start:end]. Le texte n'est pas tronqué à end (endpos ferait
+    correspondre \b à la coupure): les tokens sont ceux du texte entier
+    """
+    if end is None:
+        end = len(text)
+    # Reprise au séparateur qui précède start: une fenêtre ouverte dans un mot
+    # (aman-|dreny) ne produit pas de morceau
+    scan = start
+    while scan > 0 and WORD_CHAR.match(text, scan - 1):
+        scan -= 1
+    for match in TOKEN_PATTERN.finditer(text, scan):
+        if match.start() >= end:
+            return
+        if match.start() >= start:
+            yield match.group().lower(), match.start(), match.end()
+
+
+def tokenize(text: str) -> List[str]:
+    """Tokens en minuscules, dans l'ordre du texte"""
+    return _LOWER_TOKEN_PATTERN.findall(text.lower())
+
+
+def is_token(text: str) -> bool:
+    return TOKEN_PATTERN.fullmatch(text) is not None
@@ -1,5 +1,54 @@
 // API Service Module
 const API_BASE = "http://localhost:8000";
+const WS_BASE = API_BASE.replace(/^http/, "ws");
+
+// Canal WebSocket persistant: une seule connexion pour toutes les analyses.
+// Une requête remplacée côté serveur par une plus récente du même type
+// est résolue avec null.
+const createLiveChannel = () => {
+  let socket = null;
+  let nextId = 1;
+  const waiting = new Map();
+
+  const connect = () => {
+    if (socket && socket.readyState <= WebSocket.OPEN) return socket;
+
+    socket = new WebSocket(`${WS_BASE}/ws`);
+    socket.onmessage = (event) => {
+      const message = JSON.parse(event.data);
+      const request = waiting.get(message.id);
+      if (!request) return;
+      waiting.delete(message.id);
+
+      if (message.status === "ok") request.resolve(message.data);
+      else if (message.status === "superseded") request.resolve(null);
+      else request.reject(new Error(JSON.stringify(message.error)));
+    };
+    socket.onclose = () => {
+      waiting.forEach((request) =>
+        request.reject(new Error("Connexion WebSocket fermée"))
+      );
+      waiting.clear();
+      socket = null;
+    };
+    return socket;
+  };
+
+  const send = (type, payload) =>
+    new Promise((resolve, reject) => {
+      const ws = connect();
+      const id = nextId++;
+      const message = JSON.stringify({ id, type, payload });
+      waiting.set(id, { resolve, reject });
+
+      if (ws.readyState === WebSocket.OPEN) ws.send(message);
+      else ws.addEventListener("open", () => ws.send(message), { once: true });
+    });
+
+  return { send, close: () => socket?.close() };
+};
+
+const liveChannel = createLiveChannel();
 
 window.ApiService = {
   spellCheck: async (text) => {
@@ -11,6 +60,52 @@ window.ApiService = {
     return await response.json();
   },
 
+  // Vérification en streaming (NDJSON): onItem est appelé pour chaque ligne
+  // reçue (token ou paragraphe), le résumé final est renvoyé
+  spellCheckStream: async (text, onItem, { unit = "token", rerank = false } = {}) => {
+    const response = await fetch(`${API_BASE}/spell-check`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ text, rerank, stream: true, stream_unit: unit }),
+    });
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let summary = null;
+
+    const handleLine = (line) => {
+      if (!line.trim()) return;
+      const item = JSON.parse(line);
+      if (item.type === "summary") summary = item;
+      else onItem(item);
+    };
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split("\n");
+      buffer = lines.pop();
+      lines.forEach(handleLine);
+    }
+    handleLine(buffer + decoder.decode());
+    return summary;
+  },
+
+  spellCheckIncremental: async ({ documentId, text, ops, baseVersion }) => {
+    const response = await fetch(`${API_BASE}/spell-check/incremental`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        document_id: documentId,
+        text,
+        ops,
+        base_version: baseVersion,
+      }),
+    });
+    return await response.json();
+  },
+
   analyzeSentiment: async (text) => {
     const response = await fetch(`${API_BASE}/sentiment`, {
       method: "POST",
@@ -58,5 +153,33 @@ window.ApiService = {
       body: JSON.stringify({ word }),
     });
     return await response.json();
-  }
-};
\ No newline at end of file
+  },
+
+  analyzeWord: async (word) => {
+    const response = await fetch(`${API_BASE}/analyze-word`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ word }),
+    });
+    return await response.json();
+  },
+
+  analyzeWords: async (words) => {
+    const response = await fetch(`${API_BASE}/analyze-word/batch`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ words }),
+    });
+    return await response.json();
+  },
+
+  // Analyses en direct via le canal WebSocket
+  liveSpellCheck: (text) => liveChannel.send("spell_check", { text }),
+
+  liveAutocomplete: (context, limit = 5) =>
+    liveChannel.send("autocomplete", { context, limit }),
+
+  liveSentiment: (text) => liveChannel.send("sentiment", { text }),
+
+  liveWordAnalysis: (word) => liveChannel.send("word_analysis", { word }),
+};
@@ -1,4 +1,4 @@
-const { useState } = React;
+const { useState, useRef } = React;
 
 // Récupération des modules
 const {
@@ -17,17 +17,26 @@ const {
 } = window.Icons;
 
 const {
-  spellCheck,
+  spellCheckIncremental,
+  spellCheckStream,
   analyzeSentiment: analyzeSentimentAPI,
-  lemmatizeWord,
-  getKnowledgeGraph,
-  translateWord,
-  validatePhonotactics,
+  analyzeWord: analyzeWordAPI,
+  liveSentiment,
+  liveWordAnalysis,
 } = window.ApiService;
 
-const { updateStats, calculateAccuracy, getSampleText } = window.Utils;
+const {
+  updateStats,
+  calculateAccuracy,
+  getSampleText,
+  mergeSpellCheckResults,
+  documentText,
+} = window.Utils;
 const useQuillEditor = window.useQuillEditor;
 
+// Au-delà de cette taille, la vérification est reçue en streaming (NDJSON)
+const STREAM_THRESHOLD_CHARS = 200000;
+
 window.MalagasyEditor = function() {
   const [text, setText] = useState("");
   const [spellCheckResults, setSpellCheckResults] = useState(null);
@@ -41,8 +50,20 @@ window.MalagasyEditor = function() {
   const [loading, setLoading] = useState(false);
   const [selectedWord, setSelectedWord] = useState("");
 
-  const handleTextChange = (content) => {
+  // État du document côté serveur (vérification incrémentale)
+  const documentRef = useRef({
+    id: `doc-${Date.now()}-${Math.random().toString(36).slice(2)}`,
+    version: null,
+    results: [],
+  });
+  const pendingDeltaRef = useRef(null);
+
+  const handleTextChange = (content, delta) => {
     setText(content);
+    if (delta) {
+      const Delta = Quill.import("delta");
+      pendingDeltaRef.current = (pendingDeltaRef.current || new Delta()).compose(delta);
+    }
     setStats(updateStats(content, spellCheckResults));
   };
 
@@ -56,32 +77,68 @@ window.MalagasyEditor = function() {
 
   const analyzeWord = async (word) => {
     try {
-      const [lemmaData, kgData, transData, phonoData] = await Promise.all([
-        lemmatizeWord(word),
-        getKnowledgeGraph(word),
-        translateWord(word, "mg", "fr"),
-        validatePhonotactics(word),
-      ]);
-
-      setLemma(lemmaData);
-      setKnowledgeGraph(kgData);
-      setTranslation(transData);
-      setPhonotactics(phonoData);
+      let analysis;
+      try {
+        analysis = await liveWordAnalysis(word);
+        // Requête remplacée par une sélection plus récente
+        if (!analysis) return;
+      } catch (liveError) {
+        analysis = await analyzeWordAPI(word);
+      }
+
+      setLemma(analysis.lemma);
+      setKnowledgeGraph(analysis.knowledge_graph);
+      setTranslation(analysis.translation);
+      setPhonotactics(analysis.phonotactics);
     } catch (error) {
       console.error("Error analyzing word:", error);
     }
   };
 
   const performSpellCheck = async () => {
-    if (!text.trim()) return;
+    const content = documentText(quillRef.current);
+    if (!content.trim()) return;
     setLoading(true);
     setActiveTab("spell");
 
+    const doc = documentRef.current;
+    const pending = pendingDeltaRef.current;
+    pendingDeltaRef.current = null;
+
     try {
-      const data = await spellCheck(text);
-      setSpellCheckResults(data);
-      setStats(updateStats(text, data));
+      if (content.length > STREAM_THRESHOLD_CHARS) {
+        await streamSpellCheck(content);
+        return;
+      }
+
+      // Seules les modifications depuis la dernière vérification sont envoyées
+      let data = null;
+      if (doc.version !== null && pending) {
+        data = await spellCheckIncremental({
+          documentId: doc.id,
+          ops: pending.ops,
+          baseVersion: doc.version,
+        });
+      }
+      if (doc.version === null || data?.resync) {
+        data = await spellCheckIncremental({ documentId: doc.id, text: content });
+      }
+
+      if (data) {
+        doc.version = data.version;
+        doc.results = mergeSpellCheckResults(doc.results, data);
+      }
+      const results = {
+        results: doc.results,
+        total_words: data ? data.total_words : doc.results.length,
+        errors_found: data
+          ? data.errors_found
+          : doc.results.filter((r) => !r.is_correct).length,
+      };
+      setSpellCheckResults(results);
+      setStats(updateStats(content, results));
     } catch (error) {
+      doc.version = null;
       console.error("Spell check error:", error);
       alert("Erreur de connexion au serveur. Vérifiez que le backend est lancé.");
     } finally {
@@ -89,13 +146,58 @@ window.MalagasyEditor = function() {
     }
   };
 
+  // Grand document: les résultats s'affichent au fil de la réception,
+  // au plus une mise à jour par image
+  const streamSpellCheck = async (content) => {
+    const doc = documentRef.current;
+    const received = [];
+    let errors = 0;
+    let frame = null;
+
+    const flush = () => {
+      frame = null;
+      const results = {
+        results: received.slice(),
+        total_words: received.length,
+        errors_found: errors,
+      };
+      setSpellCheckResults(results);
+      setStats(updateStats(content, results));
+    };
+
+    const summary = await spellCheckStream(
+      content,
+      (paragraph) => {
+        paragraph.results.forEach((result) => {
+          received.push(result);
+          if (!result.is_correct) errors += 1;
+        });
+        if (frame === null) frame = requestAnimationFrame(flush);
+      },
+      { unit: "paragraph" }
+    );
+
+    if (frame !== null) cancelAnimationFrame(frame);
+    flush();
+    // Pas d'état serveur pour ce document: prochaine vérification complète
+    doc.version = null;
+    doc.results = received;
+    return summary;
+  };
+
   const analyzeSentiment = async () => {
     if (!text.trim()) return;
     setLoading(true);
     setActiveTab("sentiment");
 
     try {
-      const data = await analyzeSentimentAPI(text);
+      let data;
+      try {
+        data = await liveSentiment(text);
+        if (!data) return;
+      } catch (liveError) {
+        data = await analyzeSentimentAPI(text);
+      }
       setSentiment(data);
     } catch (error) {
       console.error("Sentiment analysis error:", error);
@@ -104,13 +206,12 @@ window.MalagasyEditor = function() {
     }
   };
 
-  const replaceWord = (oldWord, newWord) => {
-    const content = quillRef.current.getText();
-    const newContent = content.replace(
-      new RegExp(`\\b${oldWord}\\b`, "gi"),
-      newWord
-    );
-    quillRef.current.setText(newContent);
+  const replaceWord = (result, newWord) => {
+    const quill = quillRef.current;
+    quill.deleteText(result.start, result.end - result.start);
+    quill.insertText(result.start, newWord);
+    // Les positions des autres résultats ont changé: re-vérifier la zone
+    performSpellCheck();
   };
 
   const insertSampleText = () => {
@@ -266,7 +367,7 @@ window.MalagasyEditor = function() {
                               <span
                                 key={i}
                                 className="suggestion-tag"
-                                onClick={() => replaceWord(result.word, sug.word)}
+                                onClick={() => replaceWord(result, sug.word)}
                               >
                                 {sug.word}
                               </span>
@@ -20,9 +20,9 @@ window.useQuillEditor = (onTextChange, onTextSelection) => {
         },
       });
 
-      quillRef.current.on("text-change", () => {
+      quillRef.current.on("text-change", (delta) => {
         const content = quillRef.current.getText();
-        onTextChange(content);
+        onTextChange(content, delta);
       });
 
       quillRef.current.root.addEventListener("mouseup", () => {
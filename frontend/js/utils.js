@@ -14,6 +14,28 @@ window.Utils = {
     };
   },
 
+  // Texte du document aligné sur les positions Quill: chaque embed (image,
+  // formule) compte pour un caractère, U+FFFC comme côté serveur.
+  // getText() les omet, ce qui décalerait les positions après un embed
+  documentText: (quill) =>
+    quill
+      .getContents()
+      .ops.map((op) => (typeof op.insert === "string" ? op.insert : "\uFFFC"))
+      .join(""),
+
+  // Fusionne une réponse de /spell-check/incremental dans les résultats locaux
+  mergeSpellCheckResults: (previous, data) => {
+    if (data.full_sync) return data.results;
+
+    const { start, end } = data.token_range;
+    const shifted = previous.slice(end).map((result) => ({
+      ...result,
+      start: result.start + data.shift,
+      end: result.end + data.shift,
+    }));
+    return [...previous.slice(0, start), ...data.results, ...shifted];
+  },
+
   calculateAccuracy: (stats) => {
     return stats.words > 0
       ? Math.round((1 - stats.errors / stats.words) * 100)